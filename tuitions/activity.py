@@ -0,0 +1,224 @@
+import arrow
+import atexit
+import threading
+
+from django.db import close_old_connections, models, transaction
+
+from .caches import principal_cache, get_principal_cache_key
+
+
+# Constants
+
+ACTIVITY_FLUSH_INTERVAL = 10 # Seconds
+ACTIVITY_FLUSH_BATCH_SIZE = 500
+DAILY_ACTIVITY_REWARD_POINTS = 5
+
+
+# Activity tracker
+
+class ActivityTracker(object):
+	"""Write-behind buffer for the activity of parents, students, and tutors.
+
+	Notes:
+		- Last activity timestamps, daily reward points, and mobile user IDs
+		are kept in memory and written with bulk UPDATE statements every
+		ACTIVITY_FLUSH_INTERVAL seconds, or as soon as ACTIVITY_FLUSH_BATCH_SIZE
+		users are pending.
+		- Daily reward points are only added if the stored last activity is
+		from an earlier day, so a reward is never given twice for the same
+		day, even across processes.
+	"""
+	def __init__(self, flush_interval, batch_size):
+		self.flush_interval = flush_interval
+		self.batch_size = batch_size
+		self._pending = {}
+		self._lock = threading.Lock()
+		self._wake = threading.Event()
+		self._thread = None
+
+	def get_key(self, user):
+		return (user.__class__, user.pk)
+
+	def get_last_active_at(self, user):
+		"""Returns the latest known activity of the user, including activity
+		that has not been written yet.
+		"""
+		with self._lock:
+			pending = self._pending.get(self.get_key(user), {})
+		pending_last_active_at = pending.get('last_active_at')
+
+		if pending_last_active_at and (not user.last_active_at or
+			pending_last_active_at > user.last_active_at):
+			return pending_last_active_at
+		return user.last_active_at
+
+	def record_activity(self, user, last_active_at, is_rewarded):
+		"""Records the activity of the user, and whether the daily reward
+		points need to be added.
+		"""
+		self._record(user, {
+			'last_active_at': last_active_at,
+			'is_rewarded': is_rewarded
+		})
+
+	def record_mobile_user_id(self, user, mobile_user_id):
+		"""Records the new mobile user ID of the user."""
+		self._record(user, {'mobile_user_id': mobile_user_id})
+
+	def _record(self, user, changes):
+		with self._lock:
+			pending = self._pending.setdefault(self.get_key(user), {
+				'uuid': user.uuid,
+				'is_rewarded': False
+			})
+			is_rewarded = pending['is_rewarded'] or changes.pop(
+				'is_rewarded', False
+			)
+			pending.update(changes)
+			pending['is_rewarded'] = is_rewarded
+			number_of_pending = len(self._pending)
+
+		self.start()
+		if number_of_pending >= self.batch_size:
+			self._wake.set()
+
+	def start(self):
+		"""Starts the background flush thread if it is not running."""
+		if self._thread is not None:
+			return
+
+		with self._lock:
+			if self._thread is None:
+				self._thread = threading.Thread(
+					target=self._run, name='activity-tracker', daemon=True
+				)
+				self._thread.start()
+
+	def _run(self):
+		while True:
+			self._wake.wait(self.flush_interval)
+			self._wake.clear()
+			try:
+				close_old_connections()
+				self.flush()
+			except Exception as e:
+				pass
+
+	def flush(self):
+		"""Writes all the pending activity to the database."""
+		with self._lock:
+			pending, self._pending = self._pending, {}
+
+		if not pending:
+			return
+
+		# Group the pending activity by model
+		activity_by_model = {}
+		for (model, pk), changes in pending.items():
+			activity_by_model.setdefault(model, []).append((pk, changes))
+
+		try:
+			for model, activity in activity_by_model.items():
+				for i in range(0, len(activity), self.batch_size):
+					self._write(model, activity[i:i + self.batch_size])
+		except Exception:
+			self._requeue(pending)
+			raise
+
+		# Cached users no longer match the database
+		for (model, pk), changes in pending.items():
+			principal_cache.delete(
+				get_principal_cache_key(model.__name__.lower(), changes['uuid'])
+			)
+
+	def _write(self, model, activity):
+		rewarded = {}
+		last_active_at_pks = []
+		last_active_at_cases = []
+		mobile_user_id_pks = []
+		mobile_user_id_cases = []
+
+		for pk, changes in activity:
+			if 'last_active_at' in changes:
+				last_active_at_pks.append(pk)
+				last_active_at_cases.append(
+					models.When(pk=pk, then=models.Value(
+						changes['last_active_at']
+					))
+				)
+				if changes['is_rewarded']:
+					start_of_day = arrow.get(
+						changes['last_active_at']
+					).floor('day').datetime
+					rewarded.setdefault(start_of_day, []).append(pk)
+
+			if 'mobile_user_id' in changes:
+				mobile_user_id_pks.append(pk)
+				mobile_user_id_cases.append(
+					models.When(pk=pk, then=models.Value(
+						changes['mobile_user_id']
+					))
+				)
+
+		with transaction.atomic():
+			# Daily reward points (before the activity is updated)
+			for start_of_day, pks in rewarded.items():
+				model.objects.filter(
+					models.Q(last_active_at__isnull=True) |
+					models.Q(last_active_at__lt=start_of_day),
+					pk__in=pks
+				).update(
+					points=models.F('points') + DAILY_ACTIVITY_REWARD_POINTS
+				)
+
+			# Last activity
+			if last_active_at_cases:
+				model.objects.filter(pk__in=last_active_at_pks).update(
+					last_active_at=models.Case(
+						*last_active_at_cases,
+						default=models.F('last_active_at'),
+						output_field=models.DateTimeField()
+					)
+				)
+
+			# Mobile user IDs
+			if mobile_user_id_cases:
+				model.objects.filter(pk__in=mobile_user_id_pks).update(
+					mobile_user_id=models.Case(
+						*mobile_user_id_cases,
+						default=models.F('mobile_user_id'),
+						output_field=models.CharField()
+					)
+				)
+
+	def _requeue(self, pending):
+		"""Puts activity that could not be written back in the buffer,
+		without overwriting newer activity.
+		"""
+		with self._lock:
+			for key, changes in pending.items():
+				newer_changes = self._pending.get(key)
+				if newer_changes is None:
+					self._pending[key] = changes
+				else:
+					is_rewarded = (
+						changes['is_rewarded'] or newer_changes['is_rewarded']
+					)
+					changes.update(newer_changes)
+					changes['is_rewarded'] = is_rewarded
+					self._pending[key] = changes
+
+
+activity_tracker = ActivityTracker(
+	ACTIVITY_FLUSH_INTERVAL, ACTIVITY_FLUSH_BATCH_SIZE
+)
+
+
+def flush_activity_tracker_on_exit():
+	"""Writes the pending activity before the process exits."""
+	try:
+		activity_tracker.flush()
+	except Exception as e:
+		pass
+
+atexit.register(flush_activity_tracker_on_exit)
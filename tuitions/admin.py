@@ -18,20 +18,41 @@ admin.site.register(LogEntry)
 admin.site.register(SiteConfig, SingletonModelAdmin)
 
 
+@admin.register(Plan)
+class PlanAdmin(admin.ModelAdmin):
+	list_display = ('name', *Plan.JOBS_LIMIT_FIELDS)
+
+
 @admin.register(Account)
 class AccountAdmin(admin.ModelAdmin):
 	list_display = ('user', 'account_type')
 	search_fields = (
 		'account_type', 'user__username', 'user__email'
 	)
+	readonly_fields = ('token_version',)
+	actions = ('revoke_auth_jwts',)
+
+	def revoke_auth_jwts(self, request, queryset):
+		for account in queryset:
+			account.revoke_auth_jwts()
+	revoke_auth_jwts.short_description = 'Revoke authentication tokens'
 
 
 @admin.register(Area)
 class AreaAdmin(admin.ModelAdmin):
-	list_display = ('id', 'name', 'city', 'zip_code', 'country')
+	list_display = (
+		'id', 'name', 'city', 'zip_code', 'latitude', 'longitude', 'country'
+	)
 	search_fields = ('name', 'city', 'zip_code', 'country')
 
 
+@admin.register(AreaDistance)
+class AreaDistanceAdmin(admin.ModelAdmin):
+	list_display = ('id', 'from_area', 'to_area', 'distance')
+	search_fields = ('from_area__name', 'to_area__name')
+	list_select_related = ('from_area', 'to_area')
+
+
 @admin.register(OfflineSubject)
 @admin.register(OnlineSubject)
 class SubjectAdmin(admin.ModelAdmin):
@@ -88,6 +109,13 @@ class TutorAdmin(admin.ModelAdmin):
 	search_fields = ('uuid', 'full_name', 'phone_number', 'country',)
 
 
+@admin.register(TutorJobQuota)
+class TutorJobQuotaAdmin(admin.ModelAdmin):
+	list_display = ('id', 'tutor', 'period', 'kind', 'number_of_jobs')
+	list_filter = ('kind',)
+	raw_id_fields = ('tutor',)
+
+
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
 	list_display = (
@@ -0,0 +1,289 @@
+import threading
+import time
+
+from collections import OrderedDict
+
+
+# Constants
+
+PRINCIPAL_CACHE_MAX_SIZE = 5000
+PRINCIPAL_CACHE_TTL = 60 # Seconds
+REVOCATION_TABLE_REFRESH_INTERVAL = 30 # Seconds
+PLAN_TABLE_REFRESH_INTERVAL = 60 # Seconds
+TUTOR_FILTER_RESULT_CACHE_MAX_SIZE = 2000 # Result pages
+TUTOR_FILTER_RESULT_CACHE_TTL = 120 # Seconds
+TUTOR_CARD_CACHE_MAX_SIZE = 10000 # Tutors
+TUTOR_CARD_CACHE_TTL = 600 # Seconds
+
+
+# Caches
+
+class LRUCache(object):
+	"""Thread-safe, size bounded LRU cache where every entry expires after a
+	fixed TTL.
+
+	Notes:
+		- The cache lives in the process memory, so every worker process has
+		its own copy.
+		- Hits, misses, evictions (size), expirations (TTL) and invalidations
+		are counted so that the cache can be sized under load.
+	"""
+	def __init__(self, max_size, ttl):
+		self.max_size = max_size
+		self.ttl = ttl
+		self.generation = 0
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+		self.expirations = 0
+		self.invalidations = 0
+		self._entries = OrderedDict()
+		self._lock = threading.Lock()
+
+	def get(self, key, default=None):
+		"""Returns the value for the key, or the default if the key is
+		missing or has expired.
+		"""
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is None:
+				self.misses += 1
+				return default
+
+			value, expires_at = entry
+			if expires_at <= time.monotonic():
+				del self._entries[key]
+				self._discard(key)
+				self.expirations += 1
+				self.misses += 1
+				return default
+
+			self._entries.move_to_end(key)
+			self.hits += 1
+			return value
+
+	def set(self, key, value, generation=None):
+		"""Stores the value for the key, evicting the least recently used
+		entries if the cache is full.
+
+		If a generation is given and any key has been invalidated since it was
+		read, the value is not stored, as it might have been loaded before the
+		invalidation.
+		"""
+		with self._lock:
+			if generation is not None and generation != self.generation:
+				return False
+			return self._set(key, value)
+
+	def _set(self, key, value):
+		self._entries[key] = (value, time.monotonic() + self.ttl)
+		self._entries.move_to_end(key)
+		while len(self._entries) > self.max_size:
+			evicted_key, entry = self._entries.popitem(last=False)
+			self._discard(evicted_key)
+			self.evictions += 1
+		return True
+
+	def delete(self, key):
+		"""Invalidates the key."""
+		with self._lock:
+			self.generation += 1
+			if self._entries.pop(key, None) is not None:
+				self._discard(key)
+				self.invalidations += 1
+
+	def clear(self):
+		"""Invalidates every key."""
+		with self._lock:
+			self.generation += 1
+			for key in self._entries:
+				self._discard(key)
+			self.invalidations += len(self._entries)
+			self._entries.clear()
+
+	def _discard(self, key):
+		"""Called with the lock held for every key that leaves the cache."""
+		pass
+
+	def get_stats(self):
+		"""Returns the counters of the cache."""
+		with self._lock:
+			lookups = self.hits + self.misses
+			return {
+				'size': len(self._entries),
+				'max_size': self.max_size,
+				'ttl': self.ttl,
+				'hits': self.hits,
+				'misses': self.misses,
+				'hit_ratio': self.hits / lookups if lookups else 0.0,
+				'evictions': self.evictions,
+				'expirations': self.expirations,
+				'invalidations': self.invalidations
+			}
+
+
+class TaggedLRUCache(LRUCache):
+	"""LRU cache where every entry can have tags, so that all the entries of
+	a tag can be invalidated at once.
+	"""
+	def __init__(self, max_size, ttl):
+		super(TaggedLRUCache, self).__init__(max_size, ttl)
+		self._tags = {}
+		self._keys_by_tag = {}
+
+	def set(self, key, value, generation=None, tags=()):
+		with self._lock:
+			if generation is not None and generation != self.generation:
+				return False
+
+			# Stored under the lock, so the tags are in place when the entry
+			# can be read
+			self._discard(key)
+			self._tags[key] = tuple(tags)
+			for tag in tags:
+				self._keys_by_tag.setdefault(tag, set()).add(key)
+			return self._set(key, value)
+
+	def invalidate_tag(self, tag):
+		"""Invalidates every key with the tag."""
+		with self._lock:
+			self.generation += 1
+			for key in list(self._keys_by_tag.get(tag, ())):
+				if self._entries.pop(key, None) is not None:
+					self.invalidations += 1
+				self._discard(key)
+
+	def _discard(self, key):
+		for tag in self._tags.pop(key, ()):
+			keys = self._keys_by_tag[tag]
+			keys.discard(key)
+			if not keys:
+				del self._keys_by_tag[tag]
+
+
+class RevocationTable(object):
+	"""In-process copy of the revocation counters of the accounts, reloaded
+	from the database at most once every refresh interval.
+
+	Notes:
+		- The loader returns (account ID, revocation counter) pairs, and only
+		needs to return the accounts whose counter is not zero.
+		- Revocations made by this process are visible immediately, the ones
+		made by other processes after the next refresh.
+	"""
+	def __init__(self, loader, refresh_interval):
+		self.loader = loader
+		self.refresh_interval = refresh_interval
+		self.refreshes = 0
+		self._counters = {}
+		self._refreshed_at = None
+		self._lock = threading.Lock()
+		self._refresh_lock = threading.Lock()
+
+	def get(self, account_id):
+		"""Returns the revocation counter of the account."""
+		# Only the first load blocks, later refreshes are done by one thread
+		# while the others keep using the current counters
+		blocking = self._refreshed_at is None
+		if self.is_stale() and self._refresh_lock.acquire(blocking=blocking):
+			try:
+				if self.is_stale():
+					self.refresh()
+			finally:
+				self._refresh_lock.release()
+
+		with self._lock:
+			return self._counters.get(account_id, 0)
+
+	def set(self, account_id, counter):
+		"""Stores a counter that has just been written to the database."""
+		with self._lock:
+			if counter > self._counters.get(account_id, 0):
+				self._counters[account_id] = counter
+
+	def is_stale(self):
+		return self._refreshed_at is None or (
+			time.monotonic() - self._refreshed_at >= self.refresh_interval
+		)
+
+	def refresh(self):
+		"""Reloads every counter from the database."""
+		counters = dict(self.loader())
+		with self._lock:
+			self._counters = counters
+			self._refreshed_at = time.monotonic()
+			self.refreshes += 1
+
+
+class PlanTable(object):
+	"""In-process copy of the plan definitions, reloaded from the database
+	at most once every refresh interval.
+
+	Notes:
+		- The loader returns the plans by name. Plans missing from the
+		database fall back to the defaults.
+		- Plans changed by this process are reloaded on the next get(), the
+		ones changed by other processes after the next refresh.
+	"""
+	def __init__(self, loader, defaults, refresh_interval):
+		self.loader = loader
+		self.defaults = defaults
+		self.refresh_interval = refresh_interval
+		self.refreshes = 0
+		self._plans = {}
+		self._refreshed_at = None
+		self._lock = threading.Lock()
+
+	def get(self, name):
+		"""Returns the plan with the given name."""
+		if self.is_stale():
+			with self._lock:
+				if self.is_stale():
+					self.refresh()
+		plans = self._plans
+		return plans[name] if name in plans else self.defaults[name]
+
+	def invalidate(self):
+		"""Makes the next get() reload the plans."""
+		self._refreshed_at = None
+
+	def is_stale(self):
+		return self._refreshed_at is None or (
+			time.monotonic() - self._refreshed_at >= self.refresh_interval
+		)
+
+	def refresh(self):
+		"""Reloads every plan from the database."""
+		self._plans = dict(self.loader())
+		self._refreshed_at = time.monotonic()
+		self.refreshes += 1
+
+
+# Authenticated principal cache
+
+principal_cache = LRUCache(PRINCIPAL_CACHE_MAX_SIZE, PRINCIPAL_CACHE_TTL)
+
+
+def get_principal_cache_key(user_type, user_uuid):
+	"""Returns the principal cache key for a parent, student, or tutor."""
+	return (user_type, str(user_uuid))
+
+
+def invalidate_principal(sender, instance, **kwargs):
+	"""Drops a parent, student, or tutor from the principal cache. Connected
+	to the post_save and post_delete signals of the user models.
+	"""
+	principal_cache.delete(
+		get_principal_cache_key(sender.__name__.lower(), instance.uuid)
+	)
+
+
+# Tutor filter caches
+
+# Pages of ordered tutor IDs, tagged with the country
+tutor_filter_result_cache = TaggedLRUCache(
+	TUTOR_FILTER_RESULT_CACHE_MAX_SIZE, TUTOR_FILTER_RESULT_CACHE_TTL
+)
+
+# Serialized public tutor cards, by tutor ID
+tutor_card_cache = LRUCache(TUTOR_CARD_CACHE_MAX_SIZE, TUTOR_CARD_CACHE_TTL)
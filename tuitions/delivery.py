@@ -0,0 +1,241 @@
+import atexit
+import queue
+import threading
+import time
+
+from .helpers import send_email, send_many, send_push_notification
+
+
+# Constants
+
+NOTIFICATION_QUEUE_SIZE = 1000 # Deliveries per channel
+NOTIFICATION_ENQUEUE_TIMEOUT = 5 # Seconds to wait for room in a full queue
+NOTIFICATION_DRAIN_TIMEOUT = 10 # Seconds to wait for the queues on shutdown
+NOTIFICATION_SMS_WORKERS = 4
+NOTIFICATION_SMS_BATCH_SIZE = 50
+NOTIFICATION_EMAIL_WORKERS = 2
+NOTIFICATION_PUSH_WORKERS = 2
+
+
+# Channel senders
+
+def deliver_sms(deliveries):
+	"""Sends (country code, phone number, message) SMSs, with one send_many()
+	call per country.
+	"""
+	messages_by_country = {}
+	for country_code, phone_number, message in deliveries:
+		messages_by_country.setdefault(country_code, []).append(
+			(phone_number, message)
+		)
+
+	for country_code, messages in messages_by_country.items():
+		send_many(country_code, messages)
+
+
+def deliver_emails(deliveries):
+	"""Sends (to address, subject, body) emails."""
+	for to_address, subject, body in deliveries:
+		send_email(to_address, subject, body)
+
+
+def deliver_push_notifications(deliveries):
+	"""Sends (mobile user ID, title, url) push notifications."""
+	for mobile_user_id, title, url in deliveries:
+		send_push_notification(mobile_user_id, title, url)
+
+
+# Delivery engine
+
+class DeliveryChannel(object):
+	"""Delivers the notifications of one channel with a fixed number of
+	worker threads reading from a bounded queue.
+
+	Notes:
+		- When the queue is full, submitting blocks for up to
+		NOTIFICATION_ENQUEUE_TIMEOUT seconds, and the delivery is dropped if
+		there is still no room.
+		- Every worker takes up to batch_size queued deliveries at a time, so
+		that bursts are sent in batches.
+	"""
+	def __init__(self, name, deliver, number_of_workers, queue_size,
+		batch_size=1):
+		self.name = name
+		self.deliver = deliver
+		self.number_of_workers = number_of_workers
+		self.batch_size = batch_size
+		self.submitted = 0
+		self.delivered = 0
+		self.failed = 0
+		self.dropped = 0
+		self.total_latency = 0.0
+		self.max_latency = 0.0
+		self._queue = queue.Queue(maxsize=queue_size)
+		self._threads = []
+		self._lock = threading.Lock()
+
+	def submit(self, delivery):
+		"""Queues a delivery. Returns False if it has been dropped."""
+		self.start()
+		try:
+			self._queue.put(
+				(delivery, time.monotonic()),
+				timeout=NOTIFICATION_ENQUEUE_TIMEOUT
+			)
+		except queue.Full:
+			with self._lock:
+				self.dropped += 1
+			return False
+
+		with self._lock:
+			self.submitted += 1
+		return True
+
+	def start(self):
+		"""Starts the worker threads if they are not running."""
+		if self._threads:
+			return
+
+		with self._lock:
+			if not self._threads:
+				for i in range(self.number_of_workers):
+					thread = threading.Thread(
+						target=self._run,
+						name=f'notification-{self.name}-{i}',
+						daemon=True
+					)
+					thread.start()
+					self._threads.append(thread)
+
+	def _run(self):
+		while True:
+			# None is queued once per worker to stop it, so a worker never
+			# takes more than one None
+			items = [self._queue.get()]
+			while items[-1] is not None and len(items) < self.batch_size:
+				try:
+					items.append(self._queue.get_nowait())
+				except queue.Empty:
+					break
+
+			deliveries = [item for item in items if item is not None]
+			if deliveries:
+				self._deliver(deliveries)
+
+			for item in items:
+				self._queue.task_done()
+			if len(deliveries) < len(items):
+				return
+
+	def _deliver(self, items):
+		try:
+			self.deliver([delivery for delivery, enqueued_at in items])
+			is_delivered = True
+		except Exception as e:
+			is_delivered = False
+
+		now = time.monotonic()
+		with self._lock:
+			if is_delivered:
+				self.delivered += len(items)
+			else:
+				self.failed += len(items)
+			for delivery, enqueued_at in items:
+				latency = now - enqueued_at
+				self.total_latency += latency
+				self.max_latency = max(self.max_latency, latency)
+
+	def drain(self, timeout):
+		"""Stops the workers once the queued deliveries have been sent, or
+		the timeout has passed.
+		"""
+		with self._lock:
+			threads, self._threads = self._threads, []
+
+		deadline = time.monotonic() + timeout
+		for thread in threads:
+			try:
+				self._queue.put(
+					None, timeout=max(deadline - time.monotonic(), 0)
+				)
+			except queue.Full:
+				break
+		for thread in threads:
+			thread.join(max(deadline - time.monotonic(), 0))
+
+	def get_metrics(self):
+		"""Returns the queue depth, counters, and latencies (seconds from
+		being queued to being sent) of the channel.
+		"""
+		with self._lock:
+			finished = self.delivered + self.failed
+			return {
+				'queue_depth': self._queue.qsize(),
+				'queue_size': self._queue.maxsize,
+				'workers': len(self._threads),
+				'submitted': self.submitted,
+				'delivered': self.delivered,
+				'failed': self.failed,
+				'dropped': self.dropped,
+				'average_latency':
+				self.total_latency / finished if finished else 0.0,
+				'max_latency': self.max_latency
+			}
+
+
+class NotificationDeliveryEngine(object):
+	"""Fans the extra notifications out to the SMS, email, and push
+	channels.
+	"""
+	def __init__(self, channels):
+		self.channels = {channel.name: channel for channel in channels}
+
+	def deliver(self, deliveries):
+		"""Queues a list of (channel name, delivery) pairs."""
+		for channel_name, delivery in deliveries:
+			self.channels[channel_name].submit(delivery)
+
+	def drain(self, timeout):
+		"""Drains every channel, sharing the timeout."""
+		deadline = time.monotonic() + timeout
+		for channel in self.channels.values():
+			channel.drain(max(deadline - time.monotonic(), 0))
+
+	def get_metrics(self):
+		return {
+			name: channel.get_metrics()
+			for name, channel in self.channels.items()
+		}
+
+
+notification_delivery_engine = NotificationDeliveryEngine([
+	DeliveryChannel(
+		'sms',
+		deliver_sms,
+		NOTIFICATION_SMS_WORKERS,
+		NOTIFICATION_QUEUE_SIZE,
+		NOTIFICATION_SMS_BATCH_SIZE
+	),
+	DeliveryChannel(
+		'email',
+		deliver_emails,
+		NOTIFICATION_EMAIL_WORKERS,
+		NOTIFICATION_QUEUE_SIZE
+	),
+	DeliveryChannel(
+		'push',
+		deliver_push_notifications,
+		NOTIFICATION_PUSH_WORKERS,
+		NOTIFICATION_QUEUE_SIZE
+	)
+])
+
+
+def drain_notification_delivery_engine_on_exit():
+	"""Sends the queued notifications before the process exits."""
+	try:
+		notification_delivery_engine.drain(NOTIFICATION_DRAIN_TIMEOUT)
+	except Exception as e:
+		pass
+
+atexit.register(drain_notification_delivery_engine_on_exit)
@@ -0,0 +1,115 @@
+from django.db import models
+from rest_framework.exceptions import NotFound
+
+
+# Load plans
+
+class LoadPlan(object):
+	"""Describes how an object is loaded for a view, so that it is fetched in
+	one query shaped for what the view needs.
+
+	Notes:
+		- select_related and prefetch_related take the same paths as the
+		queryset methods.
+		- only limits the loaded fields of the object. The foreign keys in
+		select_related are always loaded.
+	"""
+	def __init__(self, select_related=(), prefetch_related=(), only=()):
+		self.select_related = tuple(select_related)
+		self.prefetch_related = tuple(prefetch_related)
+		self.only = tuple(only)
+
+	@property
+	def key(self):
+		return (self.select_related, self.prefetch_related, self.only)
+
+	def get_only(self):
+		return self.only + self.select_related
+
+	def apply(self, queryset):
+		"""Returns the queryset shaped by the plan."""
+		if self.select_related:
+			queryset = queryset.select_related(*self.select_related)
+		if self.prefetch_related:
+			queryset = queryset.prefetch_related(*self.prefetch_related)
+		if self.only:
+			queryset = queryset.only(*self.get_only())
+		return queryset
+
+
+# Methods
+
+def get_queryset(queryset):
+	"""Returns the queryset of a model, manager, or queryset."""
+	if isinstance(queryset, models.QuerySet):
+		return queryset
+	if isinstance(queryset, models.Manager):
+		return queryset.all()
+	return queryset._default_manager.all()
+
+
+def fetch(queryset, load_plan=None, **filters):
+	"""Returns the object of a model, manager, or queryset matching the
+	filters, shaped by the load plan, or None. Always one query.
+	"""
+	queryset = get_queryset(queryset)
+	if load_plan is not None:
+		queryset = load_plan.apply(queryset)
+
+	try:
+		return queryset.get(**filters)
+	except queryset.model.DoesNotExist:
+		return None
+
+
+def fetch_or_404(queryset, load_plan=None, detail=None, **filters):
+	"""Returns the object of a model, manager, or queryset matching the
+	filters, shaped by the load plan. Raises NotFound otherwise, which the
+	views turn into a 404 with the detail (by default 'Not found.').
+	"""
+	obj = fetch(queryset, load_plan, **filters)
+	if obj is None:
+		raise NotFound(detail)
+	return obj
+
+
+# Load plans of any model
+
+# For objects only used to filter other querysets
+ID_LOAD_PLAN = LoadPlan(only=('id',))
+
+
+# Load plans of the jobs
+
+REQUEST_FOR_TUTOR_LOAD_PLAN = LoadPlan(
+	select_related=('tuition_area', 'tutor_undergraduate_university')
+)
+
+OPS_REQUEST_FOR_TUTOR_LOAD_PLAN = LoadPlan(
+	select_related=('parent', 'tuition_area', 'tutor_undergraduate_university')
+)
+
+TUITION_REQUEST_LOAD_PLAN = LoadPlan(
+	select_related=(
+		'parent', 'tutor__undergraduate_university', 'tuition_area', 'review'
+	)
+)
+
+TUITION_REQUEST_USERS_LOAD_PLAN = LoadPlan(select_related=('parent', 'tutor'))
+
+
+# Load plans of the reviews
+
+REVIEW_LOAD_PLAN = LoadPlan(select_related=('parent', 'tutor'))
+
+
+# Load plans of the notifications
+
+NOTIFICATION_READ_STATUS_LOAD_PLAN = LoadPlan(only=('is_read',))
+
+
+# Load plans of the users
+
+USER_UUID_LOAD_PLAN = LoadPlan(only=('uuid',))
+
+SMS_RECIPIENT_LOAD_PLAN = LoadPlan(only=('phone_number', 'country'))
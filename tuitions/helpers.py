@@ -1,13 +1,13 @@
 import arrow
 import json
+import math
 import requests
 
 from random import randint
 from six import string_types
 
-from .env_variables_manager import (
-	get_bd_sms_sender_password, get_sendgrid_auth_token
-)
+from .env_variables_manager import get_sendgrid_auth_token
+from .sms import ssl_wireless_transport
 
 # Constants
 
@@ -26,6 +26,42 @@ JOBS_LIMIT = {
 	}
 }
 
+AUTH_JWT_VERSION = 2 # Version 1 tokens carry only the ID and user type
+
+TUTOR_SHUFFLE_KEY_RANGE = 2 ** 31 # Shuffle keys and seeds are below this
+
+EARTH_RADIUS_IN_KM = 6371.0
+AREA_DISTANCE_MAX_KM = 25 # Farthest area distance stored and searched
+AREA_DISTANCE_BAND_KM = 2 # Width of the distance bands of the search results
+
+TEXT_SEARCH_CONFIG = 'english' # Postgres text search configuration
+TEXT_SEARCH_MAX_LENGTH = 255 # Characters of a text query
+
+# Relative weights of the tutor ranking score components
+TUTOR_RANKING_WEIGHTS = {
+	'reviews': 4,
+	'university_grade': 3,
+	'activity': 2,
+	'completeness': 1,
+	'profile_views': 1
+}
+TUTOR_RANKING_SCORE_LEVELS = 100 # Ranking scores go from 0 to this
+TUTOR_RANKING_REVIEW_PRIOR_COUNT = 5 # Neutral reviews added to every tutor
+TUTOR_RANKING_REVIEW_PRIOR_RATING = 3 # Out of 5
+TUTOR_RANKING_ACTIVITY_HALF_LIFE = 14 # Days
+TUTOR_RANKING_MAX_PROFILE_VIEWS = 1000 # Views scoring the full component
+TUTOR_RANKING_UNIVERSITY_GRADES = {1: 1.0, 2: 0.6, 3: 0.3} # Ungraded is 0
+TUTOR_RANKING_COMPLETENESS_FIELDS = (
+	'is_personal_information_complete',
+	'is_teaching_preferences_complete',
+	'undergraduate_university_academic_bg__is_complete'
+)
+TUTOR_RANKING_FIELDS = (
+	'tutor_behavior', 'way_of_teaching', 'communication_skills',
+	'time_management', 'number_of_reviews', 'last_active_at',
+	'number_of_public_profile_views', *TUTOR_RANKING_COMPLETENESS_FIELDS
+)
+
 
 # Helper functions
 
@@ -45,25 +81,58 @@ def field_is_not_null(value):
 		return True
 
 
+def get_distance_in_km(latitude_1, longitude_1, latitude_2, longitude_2):
+	"""Returns the great-circle (haversine) distance between two points."""
+	latitude_1, longitude_1, latitude_2, longitude_2 = map(
+		math.radians, map(float, (latitude_1, longitude_1, latitude_2, longitude_2))
+	)
+	a = (
+		math.sin((latitude_2 - latitude_1) / 2) ** 2 +
+		math.cos(latitude_1) * math.cos(latitude_2) *
+		math.sin((longitude_2 - longitude_1) / 2) ** 2
+	)
+	return 2 * EARTH_RADIUS_IN_KM * math.asin(math.sqrt(a))
+
+
 def bd_sms_sender(phone_number, message):
 	"""Sends an SMS to a Bangladeshi phone number."""
-	requests.post(
-		'http://sms.sslwireless.com/pushapi/dynamic/server.php',
-		data={
-			'user': 'Yoda',
-			'pass': get_bd_sms_sender_password(),
-			'sms[0][0]': phone_number,
-			'sms[0][1]': message,
-			'sms[0][2]': 54354354354,
-			'sid': 'Yoda'
-		}
-	)
+	bd_sms_bulk_sender([(phone_number, message)])
+
+
+def bd_sms_bulk_sender(messages):
+	"""Sends (phone number, message) SMSs to Bangladeshi phone numbers, in
+	batched submissions over pooled connections.
+	"""
+	ssl_wireless_transport.send_many(messages)
 
 
 def us_sms_sender(phone_number, message):
 	pass
 
 
+def us_sms_bulk_sender(messages):
+	pass
+
+
+def send_many(country_code, messages):
+	"""Sends (phone number, message) SMSs to phone numbers of a country.
+
+	Notes:
+		- Countries with a bulk sender get batched submissions, other
+		countries in SMS_SENDER_COUNTRY_MAP get one request per message, and
+		the rest are skipped.
+	"""
+	if country_code in SMS_BULK_SENDER_COUNTRY_MAP:
+		SMS_BULK_SENDER_COUNTRY_MAP[country_code](messages)
+	elif country_code in SMS_SENDER_COUNTRY_MAP:
+		for phone_number, message in messages:
+			SMS_SENDER_COUNTRY_MAP[country_code](phone_number, message)
+
+
+def send_push_notification(mobile_user_id, title, url):
+	pass
+
+
 def send_email(to_address, subject, body):
 	"""Sends an email to a given address."""
 	requests.post('https://api.sendgrid.com/v3/mail/send',
@@ -123,9 +192,73 @@ def get_random_for_tutor_filter():
 	return randint(0, 99)
 
 
+def get_tutor_shuffle_key():
+	"""Returns the random position of a tutor in the shuffled tutor filter
+	results.
+	"""
+	return randint(0, TUTOR_SHUFFLE_KEY_RANGE - 1)
+
+
+def get_tutor_ranking_score(values, now, weights=TUTOR_RANKING_WEIGHTS):
+	"""Returns the ranking score of a tutor, from 0 to
+	TUTOR_RANKING_SCORE_LEVELS.
+
+	Notes:
+		- The values are the TUTOR_RANKING_FIELDS of the tutor, and their
+		undergraduate_university_grade.
+		- Every component is between 0 and 1, and the score is their weighted
+		average. The weights do not need to add up to anything.
+		- The average rating is pulled towards a neutral rating, so that a
+		tutor with one perfect review does not outrank a tutor with many good
+		ones.
+	"""
+	ratings = (
+		values['tutor_behavior'] + values['way_of_teaching'] +
+		values['communication_skills'] + values['time_management']
+	) / 4
+	rating = (
+		ratings +
+		TUTOR_RANKING_REVIEW_PRIOR_RATING * TUTOR_RANKING_REVIEW_PRIOR_COUNT
+	) / (values['number_of_reviews'] + TUTOR_RANKING_REVIEW_PRIOR_COUNT)
+
+	activity = 0
+	if values['last_active_at'] is not None:
+		days = max((now - values['last_active_at']).total_seconds(), 0) / 86400
+		activity = 0.5 ** (days / TUTOR_RANKING_ACTIVITY_HALF_LIFE)
+
+	components = {
+		'reviews': min(max((rating - 1) / 4, 0), 1),
+		'university_grade': TUTOR_RANKING_UNIVERSITY_GRADES.get(
+			values['undergraduate_university_grade'], 0
+		),
+		'activity': activity,
+		'completeness': sum(
+			bool(values[field_name])
+			for field_name in TUTOR_RANKING_COMPLETENESS_FIELDS
+		) / len(TUTOR_RANKING_COMPLETENESS_FIELDS),
+		'profile_views': min(
+			math.log1p(values['number_of_public_profile_views']) /
+			math.log1p(TUTOR_RANKING_MAX_PROFILE_VIEWS),
+			1
+		)
+	}
+
+	total_weight = sum(weights.values())
+	if not total_weight:
+		return 0
+	return round(sum(
+		weight * components[name] for name, weight in weights.items()
+	) / total_weight * TUTOR_RANKING_SCORE_LEVELS)
+
+
 # Maps
 
 SMS_SENDER_COUNTRY_MAP = {
 	'BD': bd_sms_sender,
 	'US': us_sms_sender,
+}
+
+SMS_BULK_SENDER_COUNTRY_MAP = {
+	'BD': bd_sms_bulk_sender,
+	'US': us_sms_bulk_sender,
 }
\ No newline at end of file
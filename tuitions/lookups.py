@@ -0,0 +1,22 @@
+from django.db import models
+from django.db.models.lookups import IContains
+
+
+# Lookups
+
+@models.CharField.register_lookup
+class ILikeContains(IContains):
+	"""Case insensitive contains, eg: full_name__ilike_contains='rahman'.
+
+	Notes:
+		- On Postgres the column is compared with ILIKE, instead of comparing
+		UPPER() of the column with LIKE like icontains does, so that the
+		pg_trgm GIN index of the column can be used.
+		- Other databases use icontains.
+	"""
+	lookup_name = 'ilike_contains'
+
+	def as_postgresql(self, compiler, connection):
+		lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+		rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+		return f'{lhs_sql} ILIKE {rhs_sql}', lhs_params + rhs_params
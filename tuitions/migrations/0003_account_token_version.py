@@ -0,0 +1,18 @@
+# Generated by Django 2.2.10 on 2026-10-18 12:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tuitions', '0002_auto_20200212_1007'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0, help_text='Revocation counter of the authentication JWTs. Tokens signed with a lower version are rejected.', verbose_name='token version'),
+        ),
+    ]
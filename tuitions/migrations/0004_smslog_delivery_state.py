@@ -0,0 +1,68 @@
+# Generated by Django 2.2.10 on 2026-10-18 12:46
+
+from django.db import migrations, models
+import django_countries.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tuitions', '0003_account_token_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='smslog',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='attempts'),
+        ),
+        migrations.AddField(
+            model_name='smslog',
+            name='country',
+            field=django_countries.fields.CountryField(default='BD', max_length=2, verbose_name='country'),
+        ),
+        migrations.AddField(
+            model_name='smslog',
+            name='last_error',
+            field=models.TextField(blank=True, verbose_name='last error'),
+        ),
+        migrations.AddField(
+            model_name='smslog',
+            name='message_type',
+            field=models.CharField(choices=[('ops', 'Ops'), ('otp', 'OTP')], default='ops', max_length=20, verbose_name='message type'),
+        ),
+        migrations.AddField(
+            model_name='smslog',
+            name='next_attempt_at',
+            field=models.DateTimeField(blank=True, help_text='Time after which a pending SMS can be sent, or a sending SMS can be claimed again by another worker.', null=True, verbose_name='next attempt at'),
+        ),
+        migrations.AddField(
+            model_name='smslog',
+            name='phone_number',
+            field=models.CharField(blank=True, max_length=50, verbose_name='phone number'),
+        ),
+        migrations.AddField(
+            model_name='smslog',
+            name='sent_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='sent at'),
+        ),
+        migrations.AddField(
+            model_name='smslog',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed')], default='sent', max_length=20, verbose_name='status'),
+        ),
+        # Existing logs were sent by ops before being logged
+        migrations.AlterField(
+            model_name='smslog',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=20, verbose_name='status'),
+        ),
+        migrations.AddIndex(
+            model_name='smslog',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='tuitions_sm_status_79b33a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='smslog',
+            index=models.Index(fields=['phone_number', 'message_type', 'created_at'], name='tuitions_sm_phone_n_ea5a61_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 2.2.10 on 2026-10-18 12:51
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def create_unread_notification_counters(apps, schema_editor):
+    UnreadNotificationCounter = apps.get_model(
+        'tuitions', 'UnreadNotificationCounter'
+    )
+    for user_type in ('parent', 'student', 'tutor'):
+        users = apps.get_model('tuitions', user_type.capitalize()).objects
+        counts = users.annotate(
+            unread_notifications_count=models.Count(
+                f'{user_type}_notifications',
+                filter=models.Q(**{f'{user_type}_notifications__is_read': False})
+            )
+        ).values_list('id', 'unread_notifications_count')
+        UnreadNotificationCounter.objects.bulk_create([
+            UnreadNotificationCounter(**{
+                f'{user_type}_id': user_id,
+                'unread_notifications_count': count
+            }) for user_id, count in counts.iterator()
+        ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tuitions', '0004_smslog_delivery_state'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UnreadNotificationCounter',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('unread_notifications_count', models.PositiveIntegerField(default=0, verbose_name='unread notifications count')),
+                ('parent', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='unread_notification_counter', to='tuitions.Parent')),
+                ('student', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='unread_notification_counter', to='tuitions.Student')),
+                ('tutor', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='unread_notification_counter', to='tuitions.Tutor')),
+            ],
+        ),
+        migrations.RunPython(
+            create_unread_notification_counters, migrations.RunPython.noop
+        ),
+    ]
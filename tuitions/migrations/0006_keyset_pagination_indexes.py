@@ -0,0 +1,89 @@
+# Generated by Django 2.2.10 on 2026-10-18 12:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tuitions', '0005_unread_notification_counter'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['parent', '-created_at', '-id'], name='tuitions_no_parent__fe21bd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['student', '-created_at', '-id'], name='tuitions_no_student_3129d2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['tutor', '-created_at', '-id'], name='tuitions_no_tutor_i_5b4c5a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='requestfortutor',
+            index=models.Index(fields=['parent', '-created_at', '-id'], name='tuitions_re_parent__db33cf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['-created_at', '-id'], name='tuitions_re_created_d1f16e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['parent', '-created_at', '-id'], name='tuitions_re_parent__60def5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['tutor', '-created_at', '-id'], name='tuitions_re_tutor_i_c81923_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='smslog',
+            index=models.Index(fields=['parent', '-created_at', '-id'], name='tuitions_sm_parent__9930ab_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='smslog',
+            index=models.Index(fields=['student', '-created_at', '-id'], name='tuitions_sm_student_3dae8d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='smslog',
+            index=models.Index(fields=['tutor', '-created_at', '-id'], name='tuitions_sm_tutor_i_264986_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['parent', '-created_at', '-id'], name='tuitions_tr_parent__77bcce_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['student', '-created_at', '-id'], name='tuitions_tr_student_52de92_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['tutor', '-created_at', '-id'], name='tuitions_tr_tutor_i_1bb1fb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tuitionrequest',
+            index=models.Index(fields=['parent', '-created_at', '-id'], name='tuitions_tu_parent__691ff8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tuitionrequest',
+            index=models.Index(fields=['parent', '-updated_at', '-id'], name='tuitions_tu_parent__b9c6b5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tuitionrequest',
+            index=models.Index(fields=['parent', '-confirmation_date', '-id'], name='tuitions_tu_parent__8fc020_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tuitionrequest',
+            index=models.Index(fields=['tutor', '-created_at', '-id'], name='tuitions_tu_tutor_i_e771b8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tuitionrequest',
+            index=models.Index(fields=['tutor', '-updated_at', '-id'], name='tuitions_tu_tutor_i_f602c6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tuitionrequest',
+            index=models.Index(fields=['tutor', '-confirmation_date', '-id'], name='tuitions_tu_tutor_i_9d95c3_idx'),
+        ),
+    ]
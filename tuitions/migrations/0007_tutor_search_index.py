@@ -0,0 +1,86 @@
+# Generated by Django 2.2.10 on 2026-10-18 12:55
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.deletion
+import django_countries.fields
+import tuitions.models
+
+
+def create_tutor_search_index(apps, schema_editor):
+    Tutor = apps.get_model('tuitions', 'Tutor')
+    TutorSearchIndex = apps.get_model('tuitions', 'TutorSearchIndex')
+    tutors = Tutor.objects.filter(
+        is_verified_by_ops=True, is_suspended_by_ops=False, is_deleted=False
+    ).values_list(
+        'id', 'country', 'gender', 'academic_medium',
+        'undergraduate_university_id', 'undergraduate_university__grade',
+        'salary_range_start', 'salary_range_end',
+        'offline_preferred_teaching_subjects_arr',
+        'offline_preferred_teaching_areas_arr', 'random_1', 'random_2',
+        'random_3'
+    )
+    TutorSearchIndex.objects.bulk_create([
+        TutorSearchIndex(
+            tutor_id=tutor[0],
+            country=tutor[1],
+            gender=tutor[2],
+            academic_medium=tutor[3],
+            undergraduate_university_id=tutor[4],
+            undergraduate_university_grade=tutor[5],
+            salary_range_start=tutor[6],
+            salary_range_end=tutor[7],
+            offline_preferred_teaching_subjects_arr=tutor[8] or [],
+            offline_preferred_teaching_areas_arr=tutor[9] or [],
+            random_1=tutor[10],
+            random_2=tutor[11],
+            random_3=tutor[12]
+        ) for tutor in tutors.iterator()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tuitions', '0006_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TutorSearchIndex',
+            fields=[
+                ('tutor', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_index', serialize=False, to='tuitions.Tutor')),
+                ('country', django_countries.fields.CountryField(default='BD', max_length=2, verbose_name='country')),
+                ('gender', models.CharField(blank=True, max_length=50, verbose_name='gender')),
+                ('academic_medium', models.CharField(blank=True, max_length=50, verbose_name='academic medium')),
+                ('undergraduate_university_grade', models.IntegerField(blank=True, null=True, verbose_name='undergraduate university grade')),
+                ('salary_range_start', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True, verbose_name='salary range start')),
+                ('salary_range_end', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True, verbose_name='salary range end')),
+                ('offline_preferred_teaching_subjects_arr', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=tuitions.models.get_empty_list, size=None)),
+                ('offline_preferred_teaching_areas_arr', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=tuitions.models.get_empty_list, size=None)),
+                ('random_1', models.SmallIntegerField(default=0)),
+                ('random_2', models.SmallIntegerField(default=0)),
+                ('random_3', models.SmallIntegerField(default=0)),
+                ('undergraduate_university', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='tuitions.University', verbose_name='undergraduate university')),
+            ],
+            options={
+                'verbose_name_plural': 'tutor search index',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='tutorsearchindex',
+            index=models.Index(fields=['country', 'undergraduate_university_grade'], name='tuitions_tu_country_a3d515_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tutorsearchindex',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['offline_preferred_teaching_subjects_arr'], name='tutor_search_subjects_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tutorsearchindex',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['offline_preferred_teaching_areas_arr'], name='tutor_search_areas_gin'),
+        ),
+        migrations.RunPython(
+            create_tutor_search_index, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 2.2.10 on 2026-10-18 12:58
+
+from django.db import migrations, models
+import tuitions.helpers
+
+
+def set_shuffle_keys(apps, schema_editor):
+    # The added column has one default value for every row
+    TutorSearchIndex = apps.get_model('tuitions', 'TutorSearchIndex')
+    rows = list(TutorSearchIndex.objects.only('tutor_id'))
+    for row in rows:
+        row.shuffle_key = tuitions.helpers.get_tutor_shuffle_key()
+    TutorSearchIndex.objects.bulk_update(
+        rows, ['shuffle_key'], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tuitions', '0007_tutor_search_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='tutorsearchindex',
+            name='tuitions_tu_country_a3d515_idx',
+        ),
+        migrations.RemoveField(
+            model_name='tutor',
+            name='random_1',
+        ),
+        migrations.RemoveField(
+            model_name='tutor',
+            name='random_2',
+        ),
+        migrations.RemoveField(
+            model_name='tutor',
+            name='random_3',
+        ),
+        migrations.RemoveField(
+            model_name='tutorsearchindex',
+            name='random_1',
+        ),
+        migrations.RemoveField(
+            model_name='tutorsearchindex',
+            name='random_2',
+        ),
+        migrations.RemoveField(
+            model_name='tutorsearchindex',
+            name='random_3',
+        ),
+        migrations.AddField(
+            model_name='tutorsearchindex',
+            name='shuffle_key',
+            field=models.IntegerField(default=tuitions.helpers.get_tutor_shuffle_key, help_text='Random position of the tutor in the shuffled search results.', verbose_name='shuffle key'),
+        ),
+        migrations.RunPython(set_shuffle_keys, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='tutorsearchindex',
+            index=models.Index(fields=['country', 'undergraduate_university_grade', 'shuffle_key', 'tutor'], name='tuitions_tu_country_431039_idx'),
+        ),
+    ]
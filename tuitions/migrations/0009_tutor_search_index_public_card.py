@@ -0,0 +1,20 @@
+# Generated by Django 2.2.10 on 2026-10-18 13:01
+
+import django.contrib.postgres.fields.jsonb
+import django.core.serializers.json
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tuitions', '0008_tutor_search_shuffle_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tutorsearchindex',
+            name='public_card',
+            field=django.contrib.postgres.fields.jsonb.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='The tutor serialized for the public search and details. Empty until it is built.', verbose_name='public card'),
+        ),
+    ]
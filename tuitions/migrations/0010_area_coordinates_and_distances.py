@@ -0,0 +1,42 @@
+# Generated by Django 2.2.10 on 2026-10-18 13:03
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tuitions', '0009_tutor_search_index_public_card'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='area',
+            name='latitude',
+            field=models.DecimalField(blank=True, decimal_places=6, help_text='Optional. Latitude of the center of the area.', max_digits=9, null=True, validators=[django.core.validators.MinValueValidator(-90), django.core.validators.MaxValueValidator(90)], verbose_name='latitude'),
+        ),
+        migrations.AddField(
+            model_name='area',
+            name='longitude',
+            field=models.DecimalField(blank=True, decimal_places=6, help_text='Optional. Longitude of the center of the area.', max_digits=9, null=True, validators=[django.core.validators.MinValueValidator(-180), django.core.validators.MaxValueValidator(180)], verbose_name='longitude'),
+        ),
+        migrations.CreateModel(
+            name='AreaDistance',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('distance', models.FloatField(verbose_name='distance in km')),
+                ('from_area', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='distances_from', to='tuitions.Area', verbose_name='from area')),
+                ('to_area', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='distances_to', to='tuitions.Area', verbose_name='to area')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='areadistance',
+            index=models.Index(fields=['from_area', 'distance'], name='tuitions_ar_from_ar_26daff_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='areadistance',
+            unique_together={('from_area', 'to_area')},
+        ),
+    ]
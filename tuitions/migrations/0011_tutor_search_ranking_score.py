@@ -0,0 +1,56 @@
+# Generated by Django 2.2.10 on 2026-10-18 13:07
+
+from django.db import migrations, models
+from django.utils import timezone
+import tuitions.helpers
+
+
+def set_ranking_scores(apps, schema_editor):
+    TutorSearchIndex = apps.get_model('tuitions', 'TutorSearchIndex')
+    now = timezone.now()
+    rows = TutorSearchIndex.objects.values(
+        'tutor_id', 'undergraduate_university_grade', *[
+            f'tutor__{field_name}'
+            for field_name in tuitions.helpers.TUTOR_RANKING_FIELDS
+        ]
+    )
+    changed = []
+    for row in rows.iterator():
+        values = {
+            field_name: row[f'tutor__{field_name}']
+            for field_name in tuitions.helpers.TUTOR_RANKING_FIELDS
+        }
+        values['undergraduate_university_grade'] = row[
+            'undergraduate_university_grade'
+        ]
+        changed.append(TutorSearchIndex(
+            tutor_id=row['tutor_id'],
+            ranking_score=tuitions.helpers.get_tutor_ranking_score(values, now)
+        ))
+    TutorSearchIndex.objects.bulk_update(
+        changed, ['ranking_score'], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tuitions', '0010_area_coordinates_and_distances'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='tutorsearchindex',
+            name='tuitions_tu_country_431039_idx',
+        ),
+        migrations.AddField(
+            model_name='tutorsearchindex',
+            name='ranking_score',
+            field=models.IntegerField(default=0, help_text='Position of the tutor in the search results, higher first. Computed from the reviews, activity, profile completeness, profile views, and university grade.', verbose_name='ranking score'),
+        ),
+        migrations.RunPython(set_ranking_scores, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='tutorsearchindex',
+            index=models.Index(fields=['country', 'ranking_score', 'shuffle_key', 'tutor'], name='tuitions_tu_country_499226_idx'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 2.2.10 on 2026-10-18 13:10
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.contrib.postgres.search
+from django.db import migrations
+import tuitions.helpers
+
+
+# Same vectors as Tutor.update_search_vectors()
+SET_SEARCH_VECTORS = '''
+    UPDATE tuitions_tutor AS tutor SET search_vector =
+    setweight(to_tsvector(%s::regconfig, coalesce(tutor.full_name, '')), 'A') ||
+    setweight(to_tsvector(%s::regconfig, coalesce(tutor.about, '')), 'B') ||
+    setweight(to_tsvector(%s::regconfig, concat_ws(' ', (
+        SELECT NULLIF(name_of_institution, '')
+        FROM tuitions_academicbackground
+        WHERE id = tutor.undergraduate_university_academic_bg_id
+    ), (
+        SELECT NULLIF(name_of_institution, '')
+        FROM tuitions_academicbackground
+        WHERE id = tutor.school_academic_bg_id
+    ), (
+        SELECT NULLIF(name_of_institution, '')
+        FROM tuitions_academicbackground
+        WHERE id = tutor.college_academic_bg_id
+    ))), 'C')
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tuitions', '0011_tutor_search_ranking_score'),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.TrigramExtension(),
+        migrations.AddField(
+            model_name='tutor',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, help_text='Full-text search vector of the full name, the about text, and the academic institution names.', null=True, verbose_name='search vector'),
+        ),
+        migrations.RunSQL(
+            [(SET_SEARCH_VECTORS, [tuitions.helpers.TEXT_SEARCH_CONFIG] * 3)],
+            migrations.RunSQL.noop
+        ),
+        migrations.AddIndex(
+            model_name='tutor',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='tutor_search_vector_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tutor',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['full_name'], name='tutor_full_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 2.2.10 on 2026-10-18 13:11
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tuitions', '0012_tutor_text_search'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='academicbackground',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name_of_institution'], name='academic_bg_institution_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='parent',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['full_name'], name='parent_full_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='parent',
+            index=models.Index(fields=['phone_number'], name='parent_phone_number_like', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['full_name'], name='student_full_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['phone_number'], name='student_phone_number_like', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='tutor',
+            index=models.Index(fields=['phone_number'], name='tutor_phone_number_like', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
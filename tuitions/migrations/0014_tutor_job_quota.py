@@ -0,0 +1,82 @@
+# Generated by Django 2.2.10 on 2026-10-18 13:12
+
+import datetime
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# (JSON field, kind, key date format) of the counters
+JOB_COUNTERS = (
+    ('daily_direct_requests_accepted', 'daily_direct_requests', '%d-%m-%Y'),
+    ('daily_hot_jobs_applied', 'daily_hot_jobs', '%d-%m-%Y'),
+    ('monthly_direct_requests_accepted', 'monthly_direct_requests', '%m-%Y'),
+    ('monthly_hot_jobs_applied', 'monthly_hot_jobs', '%m-%Y'),
+)
+
+
+def add_job_quotas(apps, schema_editor):
+    Tutor = apps.get_model('tuitions', 'Tutor')
+    TutorJobQuota = apps.get_model('tuitions', 'TutorJobQuota')
+    tutors = Tutor.objects.values_list(
+        'id', *[field_name for field_name, kind, date_format in JOB_COUNTERS]
+    )
+
+    quotas = []
+    for tutor_id, *counters in tutors.iterator():
+        for counter, (field_name, kind, date_format) in zip(
+            counters, JOB_COUNTERS
+        ):
+            for key, number_of_jobs in (counter or {}).items():
+                try:
+                    period = datetime.datetime.strptime(key, date_format).date()
+                except (TypeError, ValueError):
+                    continue
+                if number_of_jobs:
+                    quotas.append(TutorJobQuota(
+                        tutor_id=tutor_id,
+                        period=period,
+                        kind=kind,
+                        number_of_jobs=number_of_jobs
+                    ))
+    TutorJobQuota.objects.bulk_create(quotas, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tuitions', '0013_ops_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TutorJobQuota',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.DateField(verbose_name='period')),
+                ('kind', models.CharField(choices=[('daily_direct_requests', 'Daily direct requests'), ('daily_hot_jobs', 'Daily hot jobs'), ('monthly_direct_requests', 'Monthly direct requests'), ('monthly_hot_jobs', 'Monthly hot jobs')], max_length=50, verbose_name='kind')),
+                ('number_of_jobs', models.PositiveIntegerField(default=0, verbose_name='number of jobs')),
+                ('tutor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_quotas', to='tuitions.Tutor')),
+            ],
+            options={
+                'unique_together': {('tutor', 'period', 'kind')},
+            },
+        ),
+        migrations.RunPython(add_job_quotas, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='tutor',
+            name='daily_direct_requests_accepted',
+        ),
+        migrations.RemoveField(
+            model_name='tutor',
+            name='daily_hot_jobs_applied',
+        ),
+        migrations.RemoveField(
+            model_name='tutor',
+            name='monthly_direct_requests_accepted',
+        ),
+        migrations.RemoveField(
+            model_name='tutor',
+            name='monthly_hot_jobs_applied',
+        ),
+    ]
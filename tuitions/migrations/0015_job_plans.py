@@ -0,0 +1,52 @@
+# Generated by Django 2.2.10 on 2026-10-18 13:15
+
+from django.db import migrations, models
+
+
+# Limits of the plans when they were moved to the database
+JOBS_LIMIT = {
+    'basic': {
+        'daily_direct_requests': 1,
+        'daily_hot_jobs': 0,
+        'monthly_direct_requests': 5,
+        'monthly_hot_jobs': 0
+    },
+    'premium': {
+        'daily_direct_requests': 3,
+        'daily_hot_jobs': 5,
+        'monthly_direct_requests': 5,
+        'monthly_hot_jobs': 10
+    }
+}
+
+
+def add_plans(apps, schema_editor):
+    Plan = apps.get_model('tuitions', 'Plan')
+    for name, jobs_limit in JOBS_LIMIT.items():
+        Plan.objects.get_or_create(name=name, defaults=jobs_limit)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tuitions', '0014_tutor_job_quota'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Plan',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(choices=[('basic', 'Basic'), ('premium', 'Premium')], max_length=50, unique=True, verbose_name='name')),
+                ('daily_direct_requests', models.PositiveIntegerField(verbose_name='daily direct requests')),
+                ('daily_hot_jobs', models.PositiveIntegerField(verbose_name='daily hot jobs')),
+                ('monthly_direct_requests', models.PositiveIntegerField(verbose_name='monthly direct requests')),
+                ('monthly_hot_jobs', models.PositiveIntegerField(verbose_name='monthly hot jobs')),
+            ],
+        ),
+        migrations.RunPython(add_plans, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='tutor',
+            index=models.Index(fields=['date_till_premium_account_valid'], name='tutor_premium_until'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 2.2.10 on 2026-10-18 13:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tuitions', '0015_job_plans'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='requestfortutor',
+            name='version',
+            field=models.PositiveIntegerField(default=0, help_text='Incremented by every transition of the job, to detect concurrent changes.', verbose_name='version'),
+        ),
+        migrations.AddField(
+            model_name='tuitionrequest',
+            name='version',
+            field=models.PositiveIntegerField(default=0, help_text='Incremented by every transition of the job, to detect concurrent changes.', verbose_name='version'),
+        ),
+    ]
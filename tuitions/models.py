@@ -1,11 +1,12 @@
 import arrow
 import jwt
 import random
-import threading
 import uuid
 
 from django.contrib.auth.models import User
 from django.contrib.postgres.fields import ArrayField, JSONField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import (
@@ -14,13 +15,22 @@ from django.core.validators import (
 from django_countries.fields import CountryField
 from django.db import models
 from django.db import transaction
-from django.db.models.signals import post_save
+from django.db.models.functions import Greatest
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from solo.models import SingletonModel
 
+from .activity import activity_tracker, DAILY_ACTIVITY_REWARD_POINTS
+from .caches import (
+	invalidate_principal, PLAN_TABLE_REFRESH_INTERVAL, PlanTable,
+	principal_cache, RevocationTable, REVOCATION_TABLE_REFRESH_INTERVAL
+)
+from .delivery import notification_delivery_engine
 from .env_variables_manager import get_auth_jwt_secret
 from .helpers import *
+from .lookups import ILikeContains
+from .notifications import NOTIFICATION_TEMPLATES
 from .validators import PHONE_NUMBER_VALIDATOR_COUNTRY_MAP
 
 
@@ -47,6 +57,64 @@ class SiteConfig(SingletonModel):
 		verbose_name = 'Site config'
 
 
+class Plan(models.Model):
+	"""Stores the job limits of an account type.
+
+	Notes:
+		- The limits are the JOBS_LIMIT keys, and JOBS_LIMIT is used for the
+		account types without a plan.
+		- Plans are cached in every process, and reloaded after a change.
+	"""
+	name = models.CharField(
+		_('name'),
+		max_length=50,
+		unique=True,
+		choices=(
+			('basic', 'Basic'),
+			('premium', 'Premium')
+		)
+	)
+	daily_direct_requests = models.PositiveIntegerField(
+		_('daily direct requests')
+	)
+	daily_hot_jobs = models.PositiveIntegerField(_('daily hot jobs'))
+	monthly_direct_requests = models.PositiveIntegerField(
+		_('monthly direct requests')
+	)
+	monthly_hot_jobs = models.PositiveIntegerField(_('monthly hot jobs'))
+
+	# Job limit fields, the same as the JOBS_LIMIT keys
+	JOBS_LIMIT_FIELDS = (
+		'daily_direct_requests', 'daily_hot_jobs', 'monthly_direct_requests',
+		'monthly_hot_jobs'
+	)
+
+	def __str__(self):
+		return self.name
+
+
+def load_plans():
+	"""Returns the job limits of the plans by name."""
+	for name, *limits in Plan.objects.values_list(
+		'name', *Plan.JOBS_LIMIT_FIELDS
+	):
+		yield name, dict(zip(Plan.JOBS_LIMIT_FIELDS, limits))
+
+job_plans = PlanTable(load_plans, JOBS_LIMIT, PLAN_TABLE_REFRESH_INTERVAL)
+
+def invalidate_plans(sender, instance, **kwargs):
+	"""Reloads the plans once a change has been committed."""
+	transaction.on_commit(job_plans.invalidate)
+
+post_save.connect(invalidate_plans, sender=Plan)
+post_delete.connect(invalidate_plans, sender=Plan)
+
+
+def get_jobs_limit(account_type):
+	"""Returns the job limits of an account type."""
+	return job_plans.get(account_type)
+
+
 class Account(models.Model):
 	"""Stores an account for a user."""
 	user = models.OneToOneField(
@@ -80,18 +148,68 @@ class Account(models.Model):
 		)
 	)
 	country = CountryField(_('country'), default='BD')
+	token_version = models.PositiveIntegerField(
+		_('token version'),
+		default=0,
+		help_text=_(
+			'Revocation counter of the authentication JWTs. Tokens signed '
+			'with a lower version are rejected.'
+		)
+	)
 
 	def __str__(self):
 		return self.user.username
 
 	def get_auth_jwt(self):
-		"""Get the authentication JWT for the user account."""
+		"""Get the authentication JWT for the user account.
+
+		Notes:
+			- The account type and country are signed as claims, so that the
+			ops permissions can authorize without loading the account.
+		"""
 		encoded = jwt.encode({
+			'version': AUTH_JWT_VERSION,
 			'id': self.id,
-			'user_type': self.account_type
+			'user_type': self.account_type,
+			'country': self.country.code,
+			'token_version': self.token_version
 		}, get_auth_jwt_secret())
 		return encoded.decode('utf-8')
 
+	def revoke_auth_jwts(self):
+		"""Revoke every authentication JWT issued for the account."""
+		Account.objects.filter(pk=self.pk).update(
+			token_version=models.F('token_version') + 1
+		)
+		self.refresh_from_db(fields=['token_version'])
+		auth_jwt_revocations.set(self.pk, self.token_version)
+
+	def save(self, *args, **kwargs):
+		"""Method overridden to revoke the issued authentication JWTs if
+		their claims have changed.
+		"""
+		claims_have_changed = False
+		if self.pk:
+			claims = Account.objects.filter(pk=self.pk).values(
+				'account_type', 'country'
+			).first()
+			claims_have_changed = bool(claims) and (
+				claims['account_type'] != self.account_type or
+				claims['country'] != self.country.code
+			)
+
+		super(Account, self).save(*args, **kwargs)
+
+		if claims_have_changed:
+			self.revoke_auth_jwts()
+
+auth_jwt_revocations = RevocationTable(
+	lambda: Account.objects.filter(token_version__gt=0).values_list(
+		'id', 'token_version'
+	),
+	REVOCATION_TABLE_REFRESH_INTERVAL
+)
+
 def create_account(sender, instance, **kwargs):
 	"""Create a user account post-save."""
 	if not Account.objects.filter(user=instance).exists():
@@ -159,6 +277,24 @@ class Area(models.Model):
 			'if the search filters are too restrictive. Only for internal use.'
 		)
 	)
+	latitude = models.DecimalField(
+		_('latitude'),
+		max_digits=9,
+		decimal_places=6,
+		blank=True,
+		null=True,
+		validators=[MinValueValidator(-90), MaxValueValidator(90)],
+		help_text=_('Optional. Latitude of the center of the area.')
+	)
+	longitude = models.DecimalField(
+		_('longitude'),
+		max_digits=9,
+		decimal_places=6,
+		blank=True,
+		null=True,
+		validators=[MinValueValidator(-180), MaxValueValidator(180)],
+		help_text=_('Optional. Longitude of the center of the area.')
+	)
 
 	def __str__(self):
 		return self.name
@@ -167,6 +303,74 @@ class Area(models.Model):
 		ordering = ('name',)
 
 
+class AreaDistance(models.Model):
+	"""Stores the distance between the centers of two areas of a country.
+
+	Notes:
+		- Only the pairs of areas with coordinates that are at most
+		AREA_DISTANCE_MAX_KM apart are stored, in both directions and with
+		every area paired with itself.
+		- The distances of a country are rebuilt when an area of the country
+		is saved.
+	"""
+	from_area = models.ForeignKey(
+		Area,
+		on_delete=models.CASCADE,
+		related_name='distances_from',
+		verbose_name=_('from area')
+	)
+	to_area = models.ForeignKey(
+		Area,
+		on_delete=models.CASCADE,
+		related_name='distances_to',
+		verbose_name=_('to area')
+	)
+	distance = models.FloatField(_('distance in km'))
+
+	def __str__(self):
+		return str(self.id)
+
+	class Meta:
+		unique_together = ('from_area', 'to_area')
+		indexes = [
+			models.Index(fields=['from_area', 'distance'])
+		]
+
+	@classmethod
+	def rebuild(cls, country):
+		"""Recomputes the distances between the areas of a country."""
+		areas = list(Area.objects.filter(
+			country=country, latitude__isnull=False, longitude__isnull=False
+		).values_list('id', 'latitude', 'longitude'))
+
+		area_distances = []
+		for from_area_id, from_latitude, from_longitude in areas:
+			for to_area_id, to_latitude, to_longitude in areas:
+				distance = get_distance_in_km(
+					from_latitude, from_longitude, to_latitude, to_longitude
+				)
+				if distance <= AREA_DISTANCE_MAX_KM:
+					area_distances.append(cls(
+						from_area_id=from_area_id,
+						to_area_id=to_area_id,
+						distance=distance
+					))
+
+		with transaction.atomic():
+			cls.objects.filter(from_area__country=country).delete()
+			cls.objects.bulk_create(area_distances, batch_size=1000)
+
+
+def rebuild_area_distances(sender, instance, **kwargs):
+	"""Rebuilds the distances of the country of a saved area once it has
+	been committed.
+	"""
+	country = instance.country
+	transaction.on_commit(lambda: AreaDistance.rebuild(country))
+
+post_save.connect(rebuild_area_distances, sender=Area)
+
+
 class BaseSubject(models.Model):
 	"""Base subject, extended by offline and online subjects."""
 	name = models.CharField(
@@ -520,24 +724,34 @@ class CustomUser(models.Model):
 		return self.full_name
 
 	def set_otp(self):
-		"""Set the one-time password, and save the user."""
+		"""Set the one-time password. The OTP is sent with send_otp(), after
+		the user has been saved.
+		"""
 		self.otp = random.randint(111111, 1000000)
 		now = arrow.utcnow()
 		otp_expiry = now.shift(hours=+24)
 		self.otp_expiry_timestamp = otp_expiry.timestamp
 
-		# Sending SMS
-		try:
-			if self.country.code in SMS_SENDER_COUNTRY_MAP:
-				SMS_SENDER_COUNTRY_MAP[self.country.code](
-					self.phone_number,
-					str(
-						f'YODA: Use the OTP {self.otp} to login to your '
-						f'account.'
-					)
-				)
-		except Exception as e:
-			pass
+	def send_otp(self):
+		"""Queue the one-time password SMS for delivery.
+
+		Notes:
+			- Only the SMS log is created here. The SMS is sent by the OTP
+			dispatcher workers, which track the delivery in the log.
+		"""
+		if not self.country.code in SMS_SENDER_COUNTRY_MAP:
+			return None
+
+		return SMSLog.objects.create(**{
+			self.__class__.__name__.lower(): self,
+			'message_type': 'otp',
+			'phone_number': self.phone_number,
+			'country': self.country,
+			'message': str(
+				f'YODA: Use the OTP {self.otp} to login to your account.'
+			),
+			'next_attempt_at': timezone.now()
+		})
 
 	def get_auth_jwt(self):
 		"""Get the authentication JWT for the user."""
@@ -548,40 +762,47 @@ class CustomUser(models.Model):
 		return encoded.decode('utf-8')
 
 	def active_daily(self):
-		"""Add points and update last_active_at for login."""
-		needs_to_be_saved = False
+		"""Add points and update last_active_at for login.
+
+		Notes:
+			- The changes are recorded by the activity tracker and written in
+			bulk, so that no row is saved on the read path of the request.
+		"""
+		now = arrow.utcnow()
+		last_active_at = activity_tracker.get_last_active_at(self)
+		needs_to_be_recorded = False
 		self.is_eligible_for_daily_reward = False
 
-		if self.last_active_at:
-			if not self.last_active_at.date() == arrow.utcnow().date():
+		if last_active_at:
+			if not last_active_at.date() == now.date():
 				# Date not same, therefore we update activity, and award points
-				self.last_active_at = arrow.utcnow().datetime
-				self.points += 5
 				self.is_eligible_for_daily_reward = True
-				needs_to_be_saved = True
+				needs_to_be_recorded = True
 			else:
 				# Last activity less than 2 hours ago, so we update activity
-				if arrow.utcnow().shift(hours=-2) >= self.last_active_at:
-					self.last_active_at = arrow.utcnow().datetime
-					needs_to_be_saved = True
+				if now.shift(hours=-2) >= last_active_at:
+					needs_to_be_recorded = True
 		else:
 			# First time activity, therefore we update activity, and award points
-			self.last_active_at = arrow.utcnow().datetime
-			self.points += 5
 			self.is_eligible_for_daily_reward = True
-			needs_to_be_saved = True
-
-		if needs_to_be_saved:
-			self.save()
+			needs_to_be_recorded = True
+
+		if needs_to_be_recorded:
+			self.last_active_at = now.datetime
+			if self.is_eligible_for_daily_reward:
+				self.points += DAILY_ACTIVITY_REWARD_POINTS
+			activity_tracker.record_activity(
+				self, self.last_active_at, self.is_eligible_for_daily_reward
+			)
 
 	def update_mobile_user_id(self, new_mobile_user_id):
 		"""Updates the mobile user ID of the custom user. Called from the
-		permissions module.
+		permissions module, and written in bulk by the activity tracker.
 		"""
 		if new_mobile_user_id:
 			if self.mobile_user_id != new_mobile_user_id:
 				self.mobile_user_id = new_mobile_user_id
-				self.save()
+				activity_tracker.record_mobile_user_id(self, new_mobile_user_id)
 
 	class Meta:
 		abstract = True
@@ -597,10 +818,37 @@ class Parent(CustomUser):
 		null=True
 	)
 
+	class Meta(CustomUser.Meta):
+		indexes = [
+			GinIndex(
+				fields=['full_name'],
+				name='parent_full_name_trgm',
+				opclasses=['gin_trgm_ops']
+			),
+			models.Index(
+				fields=['phone_number'],
+				name='parent_phone_number_like',
+				opclasses=['varchar_pattern_ops']
+			)
+		]
+
 
 class Student(CustomUser):
 	"""Stores a student."""
-	pass
+
+	class Meta(CustomUser.Meta):
+		indexes = [
+			GinIndex(
+				fields=['full_name'],
+				name='student_full_name_trgm',
+				opclasses=['gin_trgm_ops']
+			),
+			models.Index(
+				fields=['phone_number'],
+				name='student_phone_number_like',
+				opclasses=['varchar_pattern_ops']
+			)
+		]
 
 
 class AcademicBackground(models.Model):
@@ -813,6 +1061,15 @@ class AcademicBackground(models.Model):
 		self.check_if_changed_or_completed()
 		super(AcademicBackground, self).save(*args, **kwargs)
 
+	class Meta:
+		indexes = [
+			GinIndex(
+				fields=['name_of_institution'],
+				name='academic_bg_institution_trgm',
+				opclasses=['gin_trgm_ops']
+			)
+		]
+
 
 class Tutor(CustomUser):
 	"""Stores a tutor.
@@ -1073,46 +1330,6 @@ class Tutor(CustomUser):
 		blank=True,
 		null=True
 	)
-	daily_direct_requests_accepted = JSONField(
-		_('daily direct requests accepted'),
-		default=dict,
-		blank=True,
-		encoder=DjangoJSONEncoder,
-		help_text=_(
-			'Stores a dictionary where the keys are days, and the values are '
-			'the number of directed reqeusts accepted that day.'
-		)
-	)
-	monthly_direct_requests_accepted = JSONField(
-		_('monthly direct requests accepted'),
-		default=dict,
-		blank=True,
-		encoder=DjangoJSONEncoder,
-		help_text=_(
-			'Stores a dictionary where the keys are months, and the values '
-			'are the number of directed reqeusts accepted that month.'
-		)
-	)
-	daily_hot_jobs_applied = JSONField(
-		_('daily hot jobs applied'),
-		default=dict,
-		blank=True,
-		encoder=DjangoJSONEncoder,
-		help_text=_(
-			'Stores a dictionary where the keys are days, and the values are '
-			'the number of hot jobs the tutor applied to that day.'
-		)
-	)
-	monthly_hot_jobs_applied = JSONField(
-		_('monthly hot jobs applied'),
-		default=dict,
-		blank=True,
-		encoder=DjangoJSONEncoder,
-		help_text=_(
-			'Stores a dictionary where the keys are months, and the values '
-			'are the number of hot jobs the tutor applied to that month.'
-		)
-	)
 	last_hot_job_received_at = models.DateTimeField(
 		_('last hot job received at'),
 		blank=True,
@@ -1167,6 +1384,41 @@ class Tutor(CustomUser):
 		blank=True,
 		encoder=DjangoJSONEncoder
 	)
+	search_vector = SearchVectorField(
+		_('search vector'),
+		blank=True,
+		null=True,
+		editable=False,
+		help_text=_(
+			'Full-text search vector of the full name, the about text, and '
+			'the academic institution names.'
+		)
+	)
+
+	# Fields the search vector is built from
+	TEXT_SEARCH_FIELDS = (
+		'full_name', 'about', 'undergraduate_university_academic_bg',
+		'school_academic_bg', 'college_academic_bg'
+	)
+
+	class Meta(CustomUser.Meta):
+		indexes = [
+			GinIndex(fields=['search_vector'], name='tutor_search_vector_gin'),
+			GinIndex(
+				fields=['full_name'],
+				name='tutor_full_name_trgm',
+				opclasses=['gin_trgm_ops']
+			),
+			models.Index(
+				fields=['phone_number'],
+				name='tutor_phone_number_like',
+				opclasses=['varchar_pattern_ops']
+			),
+			models.Index(
+				fields=['date_till_premium_account_valid'],
+				name='tutor_premium_until'
+			)
+		]
 	offline_preferred_teaching_subjects_arr = ArrayField(
 		models.BigIntegerField(),
 		default=get_empty_list,
@@ -1182,11 +1434,6 @@ class Tutor(CustomUser):
 		help_text=_('Used for searching.')
 	)
 
-	# Random fields
-	random_1 = models.SmallIntegerField(default=get_random_for_tutor_filter)
-	random_2 = models.SmallIntegerField(default=get_random_for_tutor_filter)
-	random_3 = models.SmallIntegerField(default=get_random_for_tutor_filter)
-
 
 	def check_if_personal_information_changed_or_completed(self):
 		"""Validate the personal information and generate the check and
@@ -1308,6 +1555,55 @@ class Tutor(CustomUser):
 
 		super(Tutor, self).save(*args, **kwargs)
 
+		# Search index, unless none of its fields have been saved
+		update_fields = kwargs.get('update_fields')
+		if update_fields is None:
+			deferred_fields = self.get_deferred_fields()
+			update_fields = [
+				field.name for field in self._meta.concrete_fields
+				if field.attname not in deferred_fields
+			]
+		update_fields = {
+			self._meta.get_field(field_name).name
+			for field_name in update_fields
+		}
+		if update_fields & set(TutorSearchIndex.TUTOR_FIELDS):
+			TutorSearchIndex.update_for_tutor(self)
+
+		# Search vector, unless none of its fields have been saved
+		if update_fields & set(self.TEXT_SEARCH_FIELDS):
+			Tutor.update_search_vectors([self.pk])
+
+	@classmethod
+	def update_search_vectors(cls, tutor_ids):
+		"""Rebuilds the search vectors of the tutors, with the full name
+		weighted above the about text, and the about text above the academic
+		institution names.
+		"""
+		tutors = cls.objects.filter(pk__in=tutor_ids).values_list(
+			'pk', 'full_name', 'about',
+			'undergraduate_university_academic_bg__name_of_institution',
+			'school_academic_bg__name_of_institution',
+			'college_academic_bg__name_of_institution'
+		)
+
+		def get_text_vector(text, weight):
+			return SearchVector(
+				models.Value(text or '', output_field=models.TextField()),
+				config=TEXT_SEARCH_CONFIG,
+				weight=weight
+			)
+
+		for tutor_id, full_name, about, *names_of_institutions in tutors:
+			search_vector = (
+				get_text_vector(full_name, 'A') +
+				get_text_vector(about, 'B') +
+				get_text_vector(
+					' '.join(filter(None, names_of_institutions)), 'C'
+				)
+			)
+			cls.objects.filter(pk=tutor_id).update(search_vector=search_vector)
+
 	@transaction.atomic
 	def delete(self, *args, **kwargs):
 		"""Method overridden to create the related academic backgrounds."""
@@ -1326,81 +1622,427 @@ class Tutor(CustomUser):
 		super(Tutor, self).delete(*args, **kwargs)
 
 	def get_account_type(self):
-		"""Returns the account type."""
-		if self.date_till_premium_account_valid:
-			if arrow.utcnow().datetime <= self.date_till_premium_account_valid:
-				return 'premium'
-			else:
-				return 'basic'
-		else:
-			return 'basic'
+		"""Returns the account type.
+
+		Notes:
+			- Memoized on the instance until the premium validity changes, as
+			it is asked for several times in a request. Principal cache hits
+			are copies, so the memo does not outlive the request.
+		"""
+		premium_until = self.date_till_premium_account_valid
+		memo = getattr(self, '_account_type_memo', None)
+		if memo is not None and memo[0] == premium_until:
+			return memo[1]
+
+		account_type = 'basic'
+		if premium_until and timezone.now() <= premium_until:
+			account_type = 'premium'
+		self._account_type_memo = (premium_until, account_type)
+		return account_type
+
+	@staticmethod
+	def get_account_type_q(account_type, now=None):
+		"""Returns the filters of the tutors with an account type, which the
+		premium validity index can answer.
+		"""
+		now = now or timezone.now()
+		if account_type == 'premium':
+			return models.Q(date_till_premium_account_valid__gte=now)
+		return models.Q(date_till_premium_account_valid__lt=now)
 
 	def get_jobs_left(self):
 		"""Returns a dict of the jobs left for the tutor in that given day and
 		month.
 		"""
 		now = arrow.utcnow()
-		current_date = now.format('DD-MM-YYYY')
-		current_month = now.format('MM-YYYY')
-
-		# Getting the currect values or zero if they don't exist
-		daily_dr_accepted = self.daily_direct_requests_accepted.get(
-			current_date, 0
-		)
-		daily_hj_applied = self.daily_hot_jobs_applied.get(
-			current_date, 0
-		)
-		monthly_dr_accepted = self.monthly_direct_requests_accepted.get(
-			current_month, 0
-		)
-		monthly_hj_applied = self.monthly_hot_jobs_applied.get(
-			current_month, 0
-		)
-
-		# Making the calculations
-		daily_dr_left = get_positive_or_zero(
-			JOBS_LIMIT[self.get_account_type()]['daily_direct_requests'] -
-			daily_dr_accepted
-		)
-		daily_hj_left = get_positive_or_zero(
-			JOBS_LIMIT[self.get_account_type()]['daily_hot_jobs'] -
-			daily_hj_applied
-		)
-		monthly_dr_left = get_positive_or_zero(
-			JOBS_LIMIT[self.get_account_type()]['monthly_direct_requests'] -
-			monthly_dr_accepted
-		)
-		monthly_hj_left = get_positive_or_zero(
-			JOBS_LIMIT[self.get_account_type()]['monthly_hot_jobs'] -
-			monthly_hj_applied
-		)
+		jobs_limit = get_jobs_limit(self.get_account_type())
+		numbers_of_jobs = TutorJobQuota.get_numbers_of_jobs(self.pk, now)
 
 		# Returning the result
 		return {
-			'current_date': current_date,
-			'current_month': current_month,
-			'daily_direct_requests_left': daily_dr_left,
-			'daily_hot_jobs_left': daily_hj_left,
-			'monthly_direct_requests_left': monthly_dr_left,
-			'monthly_hot_jobs_left': monthly_hj_left
+			'current_date': now.format('DD-MM-YYYY'),
+			'current_month': now.format('MM-YYYY'),
+			**{
+				f'{kind}_left': get_positive_or_zero(
+					jobs_limit[kind] - number_of_jobs
+				) for kind, number_of_jobs in numbers_of_jobs.items()
+			}
 		}
 
 	def upgrade_to_premium(self, is_paid=False):
 		"""Upgrades the tutor to a premium account."""
 		now = arrow.utcnow()
-		current_date = now.format('DD-MM-YYYY')
-		current_month = now.format('MM-YYYY')
-
 		self.date_till_premium_account_valid = now.shift(days=90).datetime
-
-		self.daily_direct_requests_accepted[current_date] = 0
-		self.monthly_direct_requests_accepted[current_month] = 0
-		self.daily_hot_jobs_applied[current_date] = 0
-		self.monthly_hot_jobs_applied[current_month] = 0
+		TutorJobQuota.reset(self.pk)
 
 		if is_paid:
 			self.premium_type = 'paid'
 
+post_save.connect(invalidate_principal, sender=Parent)
+post_delete.connect(invalidate_principal, sender=Parent)
+post_save.connect(invalidate_principal, sender=Student)
+post_delete.connect(invalidate_principal, sender=Student)
+post_save.connect(invalidate_principal, sender=Tutor)
+post_delete.connect(invalidate_principal, sender=Tutor)
+
+def invalidate_principal_for_academic_background(sender, instance, **kwargs):
+	"""Drop the tutors of an academic background from the principal cache,
+	as cached tutors carry their academic backgrounds with them.
+	"""
+	if kwargs.get('created'):
+		return
+
+	tutors = Tutor.objects.filter(
+		models.Q(undergraduate_university_academic_bg=instance) |
+		models.Q(school_academic_bg=instance) |
+		models.Q(college_academic_bg=instance)
+	)
+	for tutor in tutors.only('id', 'uuid'):
+		invalidate_principal(Tutor, tutor)
+
+post_save.connect(
+	invalidate_principal_for_academic_background, sender=AcademicBackground
+)
+
+def update_search_vectors_for_academic_background(sender, instance,
+	**kwargs):
+	"""Rebuilds the search vectors of the tutors of an academic background,
+	as they include the name of the institution.
+	"""
+	if kwargs.get('created'):
+		return
+
+	Tutor.update_search_vectors(Tutor.objects.filter(
+		models.Q(undergraduate_university_academic_bg=instance) |
+		models.Q(school_academic_bg=instance) |
+		models.Q(college_academic_bg=instance)
+	).values_list('id', flat=True))
+
+post_save.connect(
+	update_search_vectors_for_academic_background, sender=AcademicBackground
+)
+
+def invalidate_principal_for_teaching_preferences(sender, instance, action,
+	reverse, pk_set, **kwargs):
+	"""Drop tutors from the principal cache when their teaching preferences
+	change, as cached tutors can carry their prefetched preferences with them.
+	"""
+	if not action.startswith('post_'):
+		return
+
+	if not reverse:
+		invalidate_principal(Tutor, instance)
+		return
+
+	# Changed from the area or subject side, so the tutors are in pk_set,
+	# unless every tutor was removed with clear()
+	if pk_set is None:
+		principal_cache.clear()
+		return
+
+	for tutor in Tutor.objects.filter(pk__in=pk_set).only('id', 'uuid'):
+		invalidate_principal(Tutor, tutor)
+
+for field_name in (
+	'offline_preferred_teaching_areas',
+	'offline_preferred_teaching_subjects',
+	'online_preferred_teaching_subjects'
+):
+	m2m_changed.connect(
+		invalidate_principal_for_teaching_preferences,
+		sender=getattr(Tutor, field_name).through
+	)
+
+
+class TutorSearchIndex(models.Model):
+	"""Stores the searchable fields of the tutors that can be found with the
+	tutor filter.
+
+	Notes:
+		- Only the verified, not suspended, and not deleted tutors have a row,
+		so the filter never reads the wide tutor rows to check them.
+		- The rows are kept in sync by Tutor.save(), and the university grade
+		by University.save().
+		- The array fields have GIN indexes for the contains and overlap
+		lookups.
+		- The ranking score is set when the row is created, and recomputed
+		for every row by the update_tutor_ranking_scores() batch job.
+		- The shuffle key is set once, so a tutor keeps their position in the
+		shuffled results of a seed.
+		- The public card is rebuilt once a change of the tutor or their
+		academic backgrounds has been committed.
+	"""
+	tutor = models.OneToOneField(
+		Tutor,
+		on_delete=models.CASCADE,
+		primary_key=True,
+		related_name='search_index'
+	)
+	country = CountryField(_('country'), default='BD')
+	gender = models.CharField(_('gender'), max_length=50, blank=True)
+	academic_medium = models.CharField(
+		_('academic medium'),
+		max_length=50,
+		blank=True
+	)
+	undergraduate_university = models.ForeignKey(
+		University,
+		on_delete=models.CASCADE,
+		related_name='+',
+		verbose_name=_('undergraduate university')
+	)
+	undergraduate_university_grade = models.IntegerField(
+		_('undergraduate university grade'),
+		blank=True,
+		null=True
+	)
+	salary_range_start = models.DecimalField(
+		_('salary range start'),
+		max_digits=12,
+		decimal_places=2,
+		blank=True,
+		null=True
+	)
+	salary_range_end = models.DecimalField(
+		_('salary range end'),
+		max_digits=12,
+		decimal_places=2,
+		blank=True,
+		null=True
+	)
+	offline_preferred_teaching_subjects_arr = ArrayField(
+		models.BigIntegerField(),
+		default=get_empty_list,
+		blank=True
+	)
+	offline_preferred_teaching_areas_arr = ArrayField(
+		models.BigIntegerField(),
+		default=get_empty_list,
+		blank=True
+	)
+	ranking_score = models.IntegerField(
+		_('ranking score'),
+		default=0,
+		help_text=_(
+			'Position of the tutor in the search results, higher first. '
+			'Computed from the reviews, activity, profile completeness, '
+			'profile views, and university grade.'
+		)
+	)
+	shuffle_key = models.IntegerField(
+		_('shuffle key'),
+		default=get_tutor_shuffle_key,
+		help_text=_(
+			'Random position of the tutor in the shuffled search results.'
+		)
+	)
+	public_card = JSONField(
+		_('public card'),
+		default=dict,
+		blank=True,
+		encoder=DjangoJSONEncoder,
+		help_text=_(
+			'The tutor serialized for the public search and details. Empty '
+			'until it is built.'
+		)
+	)
+
+	# Tutor fields copied to the index
+	TUTOR_FIELDS = (
+		'country', 'gender', 'academic_medium', 'undergraduate_university',
+		'salary_range_start', 'salary_range_end',
+		'offline_preferred_teaching_subjects_arr',
+		'offline_preferred_teaching_areas_arr', 'is_verified_by_ops',
+		'is_suspended_by_ops', 'is_deleted'
+	)
+
+	class Meta:
+		verbose_name_plural = 'tutor search index'
+		indexes = [
+			models.Index(fields=[
+				'country', 'ranking_score', 'shuffle_key', 'tutor'
+			]),
+			GinIndex(
+				fields=['offline_preferred_teaching_subjects_arr'],
+				name='tutor_search_subjects_gin'
+			),
+			GinIndex(
+				fields=['offline_preferred_teaching_areas_arr'],
+				name='tutor_search_areas_gin'
+			)
+		]
+
+	def __str__(self):
+		return str(self.tutor_id)
+
+	@classmethod
+	def update_for_tutor(cls, tutor):
+		"""Creates, updates, or deletes the row of the tutor. The row is only
+		saved if one of its fields has changed.
+		"""
+		if (not tutor.is_verified_by_ops or tutor.is_suspended_by_ops or
+			tutor.is_deleted):
+			cls.objects.filter(tutor_id=tutor.pk).delete()
+			return
+
+		values = {
+			'country': tutor.country,
+			'gender': tutor.gender,
+			'academic_medium': tutor.academic_medium,
+			'undergraduate_university_id': tutor.undergraduate_university_id,
+			'undergraduate_university_grade': University.objects.filter(
+				pk=tutor.undergraduate_university_id
+			).values_list('grade', flat=True).first(),
+			'salary_range_start': tutor.salary_range_start,
+			'salary_range_end': tutor.salary_range_end,
+			'offline_preferred_teaching_subjects_arr':
+			tutor.offline_preferred_teaching_subjects_arr or [],
+			'offline_preferred_teaching_areas_arr':
+			tutor.offline_preferred_teaching_areas_arr or []
+		}
+
+		search_index = cls.objects.filter(tutor_id=tutor.pk).first()
+		if search_index is None:
+			cls.objects.create(
+				tutor_id=tutor.pk,
+				ranking_score=cls.get_ranking_score(tutor, values),
+				**values
+			)
+			return
+
+		changed_fields = [
+			field_name for field_name, value in values.items()
+			if getattr(search_index, field_name) != value
+		]
+		if changed_fields:
+			for field_name in changed_fields:
+				setattr(search_index, field_name, values[field_name])
+			search_index.save(update_fields=changed_fields)
+
+	@classmethod
+	def get_ranking_score(cls, tutor, values):
+		"""Returns the ranking score of a tutor getting a new row."""
+		ranking_values = {
+			field_name: getattr(tutor, field_name)
+			for field_name in TUTOR_RANKING_FIELDS if '__' not in field_name
+		}
+		ranking_values[
+			'undergraduate_university_academic_bg__is_complete'
+		] = AcademicBackground.objects.filter(
+			pk=tutor.undergraduate_university_academic_bg_id
+		).values_list('is_complete', flat=True).first()
+		ranking_values['undergraduate_university_grade'] = values[
+			'undergraduate_university_grade'
+		]
+		return get_tutor_ranking_score(ranking_values, timezone.now())
+
+
+def update_tutor_search_index_university_grade(sender, instance, **kwargs):
+	"""Copies a changed university grade to the tutor search index."""
+	TutorSearchIndex.objects.filter(
+		undergraduate_university=instance
+	).exclude(
+		undergraduate_university_grade=instance.grade
+	).update(undergraduate_university_grade=instance.grade)
+
+post_save.connect(update_tutor_search_index_university_grade, sender=University)
+
+
+class TutorJobQuota(models.Model):
+	"""Stores the number of jobs a tutor has taken in a day or a month, with
+	one row per (tutor, period, kind).
+
+	Notes:
+		- The kinds are the JOBS_LIMIT keys. The period is the day for the
+		daily kinds, and the first day of the month for the monthly kinds, in
+		UTC.
+		- Jobs are counted with a conditional UPDATE, so the count never goes
+		above the limit, even with concurrent requests.
+	"""
+	tutor = models.ForeignKey(
+		Tutor,
+		on_delete=models.CASCADE,
+		related_name='job_quotas'
+	)
+	period = models.DateField(_('period'))
+	kind = models.CharField(
+		_('kind'),
+		max_length=50,
+		choices=(
+			('daily_direct_requests', 'Daily direct requests'),
+			('daily_hot_jobs', 'Daily hot jobs'),
+			('monthly_direct_requests', 'Monthly direct requests'),
+			('monthly_hot_jobs', 'Monthly hot jobs')
+		)
+	)
+	number_of_jobs = models.PositiveIntegerField(
+		_('number of jobs'),
+		default=0
+	)
+
+	class Meta:
+		unique_together = ('tutor', 'period', 'kind')
+
+	def __str__(self):
+		return f'{self.tutor_id} {self.kind} {self.period}'
+
+	@staticmethod
+	def get_periods(now=None):
+		"""Returns the (day, first day of the month) periods of a time."""
+		now = now or arrow.utcnow()
+		return now.date(), now.floor('month').date()
+
+	@classmethod
+	def get_kind_period(cls, kind, now=None):
+		day, month = cls.get_periods(now)
+		return day if kind.startswith('daily_') else month
+
+	@classmethod
+	def get_numbers_of_jobs(cls, tutor_id, now=None):
+		"""Returns the number of jobs taken by the tutor in the current day
+		and month, by kind.
+		"""
+		day, month = cls.get_periods(now)
+		numbers_of_jobs = {
+			kind: 0 for kind, name in cls._meta.get_field('kind').choices
+		}
+		quotas = cls.objects.filter(
+			tutor_id=tutor_id, period__in={day, month}
+		).values_list('period', 'kind', 'number_of_jobs')
+		for period, kind, number_of_jobs in quotas:
+			if period == cls.get_kind_period(kind, now):
+				numbers_of_jobs[kind] = number_of_jobs
+		return numbers_of_jobs
+
+	@classmethod
+	def increment(cls, tutor_id, kind, limit, now=None):
+		"""Counts one more job of a kind in the current period, unless the
+		limit has been reached. Returns True if the job has been counted.
+		"""
+		period = cls.get_kind_period(kind, now)
+		cls.objects.bulk_create(
+			[cls(tutor_id=tutor_id, period=period, kind=kind)],
+			ignore_conflicts=True
+		)
+		return cls.objects.filter(
+			tutor_id=tutor_id,
+			period=period,
+			kind=kind,
+			number_of_jobs__lt=limit
+		).update(number_of_jobs=models.F('number_of_jobs') + 1) == 1
+
+	@classmethod
+	def reset(cls, tutor_id):
+		"""Resets the numbers of jobs of the tutor in the current day and
+		month.
+		"""
+		day, month = cls.get_periods()
+		cls.objects.filter(
+			models.Q(period=day, kind__startswith='daily_') |
+			models.Q(period=month, kind__startswith='monthly_'),
+			tutor_id=tutor_id
+		).update(number_of_jobs=0)
+
 
 class Notification(models.Model):
 	"""Stores a notification."""
@@ -1457,40 +2099,222 @@ class Notification(models.Model):
 	def __str__(self):
 		return str(self.id)
 
-	def handle_extra_notifications(self, target_user):
-		"""Handles the extra notifications, such as sending SMS."""
-		if target_user.country.code in SMS_SENDER_COUNTRY_MAP:
-			SMS_SENDER_COUNTRY_MAP[target_user.country.code](
-				target_user.phone_number,
-				str(f'YODA: {self.title}\n{self.url}')
+	@classmethod
+	def build(cls, notification_type, user, create_extra_notifications,
+		**context):
+		"""Builds an unsaved notification for a parent, student, or tutor from
+		the notification template of the type.
+		"""
+		created_for = user.__class__.__name__.lower()
+		template = NOTIFICATION_TEMPLATES[(notification_type, created_for)]
+		return cls(**{
+			'notification_type': notification_type,
+			created_for: user,
+			'created_for': created_for,
+			'title': template['title'],
+			'body': template['body'],
+			'url': template['url'].format(**context),
+			'create_extra_notifications': create_extra_notifications
+		})
+
+	@classmethod
+	def create_many(cls, notifications):
+		"""Inserts built notifications with one query, and queues all of their
+		extra notifications as one batch once they have been committed.
+		"""
+		deliveries = []
+		for notification in notifications:
+			if notification.create_extra_notifications:
+				deliveries += notification.get_extra_deliveries(
+					notification.get_target_user()
+				)
+
+		notifications = cls.objects.bulk_create(notifications)
+		UnreadNotificationCounter.add_unread(notifications)
+
+		if deliveries:
+			transaction.on_commit(
+				lambda: notification_delivery_engine.deliver(deliveries)
 			)
+		return notifications
+
+	def get_target_user(self):
+		if self.created_for == 'parent':
+			return self.parent
+		elif self.created_for == 'student':
+			return self.student
+		elif self.created_for == 'tutor':
+			return self.tutor
+		return None
+
+	def get_extra_deliveries(self, target_user):
+		"""Returns the (channel, delivery) pairs of the extra notifications
+		for the notification delivery engine.
+		"""
+		deliveries = [('sms', (
+			target_user.country.code,
+			target_user.phone_number,
+			str(f'YODA: {self.title}\n{self.url}')
+		))]
+		if target_user.email and target_user.is_email_verified:
+			deliveries.append(('email', (
+				target_user.email,
+				str(f'YODA: {self.title}'),
+				str(f'{self.body}<br><br>{self.url}')
+			)))
+		if target_user.mobile_user_id:
+			deliveries.append(('push', (
+				target_user.mobile_user_id, self.title, self.url
+			)))
+		return deliveries
 
 	def save(self, *args, **kwargs):
-		"""Method overridden to create and send the extra notifications."""
-		if self.create_extra_notifications and not self.pk:
-			if self.created_for == 'parent':
-				target_user = self.parent
-			elif self.created_for == 'student':
-				target_user = self.student
-			elif self.created_for == 'tutor':
-				target_user = self.tutor
-			else:
+		"""Method overridden to send the extra notifications.
+
+		Notes:
+			- The extra notifications are queued in the notification delivery
+			engine once the notification has been committed.
+		"""
+		is_new = not self.pk
+		deliveries = None
+		if self.create_extra_notifications and is_new:
+			if not self.created_for in ('parent', 'student', 'tutor'):
 				return
 
-			# Sending the SMS using a thread
-			try:
-				th = threading.Thread(
-					target=self.handle_extra_notifications,
-					args=(target_user,)
-				)
-				th.start()
-			except Exception as e:
-				pass
+			deliveries = self.get_extra_deliveries(self.get_target_user())
 
 		super(Notification, self).save(*args, **kwargs)
 
+		if is_new:
+			UnreadNotificationCounter.add_unread([self])
+
+		if deliveries:
+			transaction.on_commit(
+				lambda: notification_delivery_engine.deliver(deliveries)
+			)
+
 	class Meta:
 		ordering = ('-created_at',)
+		indexes = [
+			models.Index(fields=['parent', '-created_at', '-id']),
+			models.Index(fields=['student', '-created_at', '-id']),
+			models.Index(fields=['tutor', '-created_at', '-id'])
+		]
+
+
+class UnreadNotificationCounter(models.Model):
+	"""Stores the number of unread notifications of a parent, student, or
+	tutor.
+
+	Notes:
+		- The counters are kept in their own table, so that saving a user
+		never overwrites a counter with a stale value.
+		- Counters are changed with UPDATE statements only. A missing counter
+		is created from the notifications table when it is first read.
+	"""
+	parent = models.OneToOneField(
+		Parent,
+		on_delete=models.CASCADE,
+		blank=True,
+		null=True,
+		related_name='unread_notification_counter'
+	)
+	student = models.OneToOneField(
+		Student,
+		on_delete=models.CASCADE,
+		blank=True,
+		null=True,
+		related_name='unread_notification_counter'
+	)
+	tutor = models.OneToOneField(
+		Tutor,
+		on_delete=models.CASCADE,
+		blank=True,
+		null=True,
+		related_name='unread_notification_counter'
+	)
+	unread_notifications_count = models.PositiveIntegerField(
+		_('unread notifications count'),
+		default=0
+	)
+
+	def __str__(self):
+		return str(self.id)
+
+	@classmethod
+	def get_count(cls, user):
+		"""Returns the number of unread notifications of the user."""
+		user_type = user.__class__.__name__.lower()
+		counts = cls.objects.filter(**{user_type: user}).values_list(
+			'unread_notifications_count', flat=True
+		)
+		if counts:
+			return counts[0]
+
+		counter, created = cls.objects.get_or_create(**{
+			user_type: user,
+			'defaults': {
+				'unread_notifications_count': Notification.objects.filter(**{
+					user_type: user,
+					'is_read': False
+				}).count()
+			}
+		})
+		return counter.unread_notifications_count
+
+	@classmethod
+	def add_unread(cls, notifications):
+		"""Counts new notifications, with one UPDATE per user type and
+		number of new notifications.
+		"""
+		new_counts = {}
+		for notification in notifications:
+			key = (
+				notification.created_for,
+				getattr(notification, f'{notification.created_for}_id', None)
+			)
+			if not notification.is_read and key[1] is not None:
+				new_counts[key] = new_counts.get(key, 0) + 1
+
+		user_ids = {}
+		for (user_type, user_id), new_count in new_counts.items():
+			user_ids.setdefault((user_type, new_count), []).append(user_id)
+
+		for (user_type, new_count), ids in user_ids.items():
+			cls.objects.filter(**{f'{user_type}_id__in': ids}).update(
+				unread_notifications_count=models.F(
+					'unread_notifications_count'
+				) + new_count
+			)
+
+	@classmethod
+	def remove_unread(cls, user, number_of_notifications=1):
+		"""Uncounts notifications that have just been read."""
+		cls.objects.filter(**{user.__class__.__name__.lower(): user}).update(
+			unread_notifications_count=Greatest(
+				models.F('unread_notifications_count') -
+				number_of_notifications,
+				0
+			)
+		)
+
+	@classmethod
+	def reset(cls, user):
+		"""Sets the counter to zero, once every notification is read."""
+		cls.objects.filter(**{user.__class__.__name__.lower(): user}).update(
+			unread_notifications_count=0
+		)
+
+def create_unread_notification_counter(sender, instance, created, **kwargs):
+	"""Create the unread notification counter of a new user."""
+	if created:
+		UnreadNotificationCounter.objects.create(
+			**{sender.__name__.lower(): instance}
+		)
+
+post_save.connect(create_unread_notification_counter, sender=Parent)
+post_save.connect(create_unread_notification_counter, sender=Student)
+post_save.connect(create_unread_notification_counter, sender=Tutor)
 
 
 class BaseTuitionRequest(models.Model):
@@ -1629,6 +2453,14 @@ class BaseTuitionRequest(models.Model):
 		encoder=DjangoJSONEncoder
 	)
 	country = CountryField(_('country'), default='BD')
+	version = models.PositiveIntegerField(
+		_('version'),
+		default=0,
+		help_text=_(
+			'Incremented by every transition of the job, to detect concurrent '
+			'changes.'
+		)
+	)
 
 	def __str__(self):
 		return str(self.uuid)
@@ -1693,6 +2525,11 @@ class RequestForTutor(BaseTuitionRequest):
 	)
 	is_confirmed = models.BooleanField(_('confirmation status'), default=False)
 
+	class Meta(BaseTuitionRequest.Meta):
+		indexes = [
+			models.Index(fields=['parent', '-created_at', '-id'])
+		]
+
 
 class TuitionRequest(BaseTuitionRequest):
 	"""Stores a tuition request."""
@@ -1755,6 +2592,14 @@ class TuitionRequest(BaseTuitionRequest):
 
 	class Meta(BaseTuitionRequest.Meta):
 		unique_together = ('tutor', 'parent_rft')
+		indexes = [
+			models.Index(fields=['parent', '-created_at', '-id']),
+			models.Index(fields=['parent', '-updated_at', '-id']),
+			models.Index(fields=['parent', '-confirmation_date', '-id']),
+			models.Index(fields=['tutor', '-created_at', '-id']),
+			models.Index(fields=['tutor', '-updated_at', '-id']),
+			models.Index(fields=['tutor', '-confirmation_date', '-id'])
+		]
 
 
 class Review(models.Model):
@@ -1887,6 +2732,11 @@ class Review(models.Model):
 
 	class Meta:
 		ordering = ('-created_at',)
+		indexes = [
+			models.Index(fields=['-created_at', '-id']),
+			models.Index(fields=['parent', '-created_at', '-id']),
+			models.Index(fields=['tutor', '-created_at', '-id'])
+		]
 
 
 class Transaction(models.Model):
@@ -1959,6 +2809,11 @@ class Transaction(models.Model):
 
 	class Meta:
 		ordering = ('-created_at',)
+		indexes = [
+			models.Index(fields=['parent', '-created_at', '-id']),
+			models.Index(fields=['student', '-created_at', '-id']),
+			models.Index(fields=['tutor', '-created_at', '-id'])
+		]
 
 
 class SMSLog(models.Model):
@@ -1992,10 +2847,55 @@ class SMSLog(models.Model):
 	)
 	created_at = models.DateTimeField(_('created at'), auto_now_add=True)
 	message = models.TextField(_('message'))
+	message_type = models.CharField(
+		_('message type'),
+		max_length=20,
+		choices=(
+			('ops', 'Ops'),
+			('otp', 'OTP')
+		),
+		default='ops'
+	)
+	phone_number = models.CharField(
+		_('phone number'),
+		max_length=50,
+		blank=True
+	)
+	country = CountryField(_('country'), default='BD')
+	status = models.CharField(
+		_('status'),
+		max_length=20,
+		choices=(
+			('pending', 'Pending'),
+			('sending', 'Sending'),
+			('sent', 'Sent'),
+			('failed', 'Failed')
+		),
+		default='pending'
+	)
+	attempts = models.PositiveSmallIntegerField(_('attempts'), default=0)
+	next_attempt_at = models.DateTimeField(
+		_('next attempt at'),
+		blank=True,
+		null=True,
+		help_text=_(
+			'Time after which a pending SMS can be sent, or a sending SMS can '
+			'be claimed again by another worker.'
+		)
+	)
+	sent_at = models.DateTimeField(_('sent at'), blank=True, null=True)
+	last_error = models.TextField(_('last error'), blank=True)
 
 	def __str__(self):
 		return str(self.uuid)
 
 	class Meta:
 		ordering = ('-created_at',)
+		indexes = [
+			models.Index(fields=['status', 'next_attempt_at']),
+			models.Index(fields=['phone_number', 'message_type', 'created_at']),
+			models.Index(fields=['parent', '-created_at', '-id']),
+			models.Index(fields=['student', '-created_at', '-id']),
+			models.Index(fields=['tutor', '-created_at', '-id'])
+		]
 
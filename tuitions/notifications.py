@@ -0,0 +1,112 @@
+# Constants
+
+JOB_DETAILS_URLS = {
+	'parent': 'https://app.yoda.com/parent/job-details/{tuition_request_uuid}/',
+	'tutor': 'https://app.yoda.com/tutor/job-details/{tuition_request_uuid}/'
+}
+
+
+# Notification templates
+
+# Keyed by (notification type, created for). The URLs are formatted with the
+# context given when building the notifications.
+NOTIFICATION_TEMPLATES = {
+	('direct-request-create', 'tutor'): {
+		'title': 'New direct request',
+		'body': str(
+			'A parent has directly requested you to be the potential tutor '
+			'for their children!'
+		),
+		'url': JOB_DETAILS_URLS['tutor']
+	},
+	('direct-request-accept', 'parent'): {
+		'title': 'Direct request accepted by tutor',
+		'body': str(
+			'A tutor you directly requested has accepted the job offer. '
+			'Please expect a call from them before finalizing the details and '
+			'confirming the job.'
+		),
+		'url': JOB_DETAILS_URLS['parent']
+	},
+	('direct-request-accept', 'tutor'): {
+		'title': 'Direct request accepted',
+		'body': str(
+			'You have accepted the direct request. Please call the parent to '
+			'finalize and confirm the job.'
+		),
+		'url': JOB_DETAILS_URLS['tutor']
+	},
+	('hot-job-apply', 'parent'): {
+		'title': 'A tutor applied to your job post',
+		'body': str(
+			'A tutor has applied to a job post you made. Please expect a call '
+			'from them before finalizing the details and confirming the job.'
+		),
+		'url': JOB_DETAILS_URLS['parent']
+	},
+	('hot-job-apply', 'tutor'): {
+		'title': 'Successfully applied to hot job',
+		'body': str(
+			'You have applied to the hot job. Please call the parent to '
+			'finalize and confirm the job.'
+		),
+		'url': JOB_DETAILS_URLS['tutor']
+	},
+	('new-hot-job', 'tutor'): {
+		'title': 'New hot job',
+		'body': 'You have a new job you can apply to.',
+		'url': JOB_DETAILS_URLS['tutor']
+	},
+	('waiting-for-parent', 'parent'): {
+		'title': 'A tutor is waiting for you to confirm a job',
+		'body': str(
+			'A tutor is waiting for you to confirm a job you posted. Please '
+			'confirm if you have talked over the phone and finalized '
+			'everything.'
+		),
+		'url': JOB_DETAILS_URLS['parent']
+	},
+	('waiting-for-parent', 'tutor'): {
+		'title': 'Waiting for parent',
+		'body': str(
+			'You have confirmed the job from your side. Please wait for the '
+			'parent to confirm the job from their side.'
+		),
+		'url': JOB_DETAILS_URLS['tutor']
+	},
+	('waiting-for-tutor', 'parent'): {
+		'title': 'Waiting for tutor',
+		'body': str(
+			'You have confirmed the job from your side. Please wait for the '
+			'tutor to confirm the job from their side.'
+		),
+		'url': JOB_DETAILS_URLS['parent']
+	},
+	('waiting-for-tutor', 'tutor'): {
+		'title': 'A parent is waiting for you to confirm a job',
+		'body': str(
+			'A parent is waiting for you to confirm a job you accepted or '
+			'applied to. Please confirm if you have talked over the phone and '
+			'finalized everything.'
+		),
+		'url': JOB_DETAILS_URLS['tutor']
+	},
+	('ops-verification', 'tutor'): {
+		'title': 'Profile verification successful',
+		'body': str(
+			'Congratulations. Your profile has been successfully verified by '
+			'Yoda!'
+		),
+		'url': 'https://app.yoda.com/tutor/dashboard/'
+	},
+	('confirmed', 'parent'): {
+		'title': 'Job confirmed',
+		'body': 'Job has been confirmed successfully.',
+		'url': JOB_DETAILS_URLS['parent']
+	},
+	('confirmed', 'tutor'): {
+		'title': 'Job confirmed',
+		'body': 'Job has been confirmed successfully.',
+		'url': JOB_DETAILS_URLS['tutor']
+	}
+}
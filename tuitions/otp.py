@@ -0,0 +1,205 @@
+import threading
+
+from datetime import timedelta
+from django.db import close_old_connections, models, transaction
+from django.db.models.signals import post_save
+from django.utils import timezone
+
+from .helpers import send_many
+from .models import SMSLog
+
+
+# Constants
+
+OTP_DISPATCH_WORKERS = 2
+OTP_DISPATCH_BATCH_SIZE = 10
+OTP_DISPATCH_POLL_INTERVAL = 5 # Seconds
+OTP_SEND_TIMEOUT = 60 # Seconds, before a claimed SMS can be claimed again
+OTP_MAX_ATTEMPTS = 5
+OTP_RETRY_BACKOFF = 5 # Seconds, doubled after every failed attempt
+OTP_RETRY_MAX_BACKOFF = 300 # Seconds
+OTP_RATE_LIMIT = 5 # OTPs per phone number in the window
+OTP_RATE_LIMIT_WINDOW = 3600 # Seconds
+
+
+# OTP dispatcher
+
+class OTPDispatcher(object):
+	"""Sends the queued OTP SMSs with a pool of worker threads.
+
+	Notes:
+		- The queue is the SMS log table. An OTP is queued by creating a
+		pending SMS log, and its delivery state is written back to the log.
+		- Workers claim pending logs with row locks that skip the logs claimed
+		by other workers, so several processes can share the queue. A claim
+		expires after OTP_SEND_TIMEOUT seconds, so logs claimed by a crashed
+		process are sent again.
+		- The claimed OTPs of a country are sent with one send_many() call,
+		so they are coalesced into batched gateway submissions.
+		- Failed sends are retried with exponential backoff, and marked as
+		failed after OTP_MAX_ATTEMPTS attempts.
+	"""
+	def __init__(self, send_many, number_of_workers, batch_size,
+		poll_interval):
+		self.send_many = send_many
+		self.number_of_workers = number_of_workers
+		self.batch_size = batch_size
+		self.poll_interval = poll_interval
+		self._threads = []
+		self._lock = threading.Lock()
+		self._wake = threading.Event()
+
+	def is_rate_limited(self, phone_number):
+		"""Checks if the phone number has been sent too many OTPs."""
+		return SMSLog.objects.filter(
+			phone_number=phone_number,
+			message_type='otp',
+			created_at__gte=timezone.now() - timedelta(
+				seconds=OTP_RATE_LIMIT_WINDOW
+			)
+		).count() >= OTP_RATE_LIMIT
+
+	def wake(self):
+		"""Starts the workers if needed, and wakes them up."""
+		self.start()
+		self._wake.set()
+
+	def start(self):
+		"""Starts the worker threads if they are not running."""
+		if self._threads:
+			return
+
+		with self._lock:
+			if not self._threads:
+				for i in range(self.number_of_workers):
+					thread = threading.Thread(
+						target=self._run,
+						name=f'otp-dispatcher-{i}',
+						daemon=True
+					)
+					thread.start()
+					self._threads.append(thread)
+
+	def _run(self):
+		while True:
+			self._wake.wait(self.poll_interval)
+			self._wake.clear()
+			try:
+				close_old_connections()
+				while self.dispatch() == self.batch_size:
+					pass
+			except Exception as e:
+				pass
+
+	def dispatch(self):
+		"""Claims and sends a batch of due OTPs. Returns the number of OTPs
+		claimed.
+		"""
+		sms_logs = self.claim()
+
+		sms_logs_by_country = {}
+		for sms_log in sms_logs:
+			sms_logs_by_country.setdefault(
+				sms_log.country.code, []
+			).append(sms_log)
+
+		for country_code, country_sms_logs in sms_logs_by_country.items():
+			self.send(country_code, country_sms_logs)
+		return len(sms_logs)
+
+	def claim(self):
+		now = timezone.now()
+		with transaction.atomic():
+			sms_logs = list(SMSLog.objects.select_for_update(
+				skip_locked=True
+			).filter(
+				message_type='otp',
+				status__in=('pending', 'sending'),
+				next_attempt_at__lte=now
+			).order_by('next_attempt_at')[:self.batch_size])
+
+			SMSLog.objects.filter(
+				pk__in=[sms_log.pk for sms_log in sms_logs]
+			).update(
+				status='sending',
+				next_attempt_at=now + timedelta(seconds=OTP_SEND_TIMEOUT)
+			)
+		return sms_logs
+
+	def send(self, country_code, sms_logs):
+		"""Sends the OTPs of a country and writes the delivery state to their
+		logs.
+		"""
+		try:
+			self.send_many(country_code, [
+				(sms_log.phone_number, sms_log.message) for sms_log in sms_logs
+			])
+		except Exception as e:
+			for sms_log in sms_logs:
+				self.retry_or_fail(sms_log, e)
+		else:
+			SMSLog.objects.filter(
+				pk__in=[sms_log.pk for sms_log in sms_logs]
+			).update(
+				status='sent',
+				attempts=models.F('attempts') + 1,
+				next_attempt_at=None,
+				sent_at=timezone.now()
+			)
+
+	def retry_or_fail(self, sms_log, error):
+		attempts = sms_log.attempts + 1
+		if attempts >= OTP_MAX_ATTEMPTS:
+			changes = {'status': 'failed', 'next_attempt_at': None}
+		else:
+			backoff = min(
+				OTP_RETRY_BACKOFF * 2 ** (attempts - 1), OTP_RETRY_MAX_BACKOFF
+			)
+			changes = {
+				'status': 'pending',
+				'next_attempt_at': timezone.now() + timedelta(seconds=backoff)
+			}
+
+		SMSLog.objects.filter(pk=sms_log.pk).update(
+			attempts=attempts, last_error=str(error), **changes
+		)
+
+
+otp_dispatcher = OTPDispatcher(
+	send_many,
+	OTP_DISPATCH_WORKERS,
+	OTP_DISPATCH_BATCH_SIZE,
+	OTP_DISPATCH_POLL_INTERVAL
+)
+
+
+def wake_otp_dispatcher(sender, instance, created, **kwargs):
+	"""Wakes the OTP dispatcher up once a queued OTP has been committed."""
+	if created and instance.message_type == 'otp':
+		transaction.on_commit(otp_dispatcher.wake)
+
+post_save.connect(wake_otp_dispatcher, sender=SMSLog)
+
+
+# Fake gateway
+
+class FakeSMSGateway(object):
+	"""Records SMSs instead of sending them. Used in place of send_many()
+	when testing, eg: OTPDispatcher(FakeSMSGateway().send_many, ...).
+
+	Notes:
+		- The first number_of_failures calls raise an exception, to test the
+		retries.
+	"""
+	def __init__(self, number_of_failures=0):
+		self.number_of_failures = number_of_failures
+		self.sent = []
+		self._lock = threading.Lock()
+
+	def send_many(self, country_code, messages):
+		with self._lock:
+			if self.number_of_failures > 0:
+				self.number_of_failures -= 1
+				raise Exception('Fake gateway failure.')
+			for phone_number, message in messages:
+				self.sent.append((country_code, phone_number, message))
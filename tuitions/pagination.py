@@ -0,0 +1,145 @@
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+# Pagination
+
+class KeysetPagination(PageNumberPagination):
+	"""Page number pagination that switches to keyset pagination when the
+	request has ?pagination=keyset, so that old app versions keep getting
+	page numbers.
+
+	Notes:
+		- Keyset pages are ordered by the ordering field of the queryset, or
+		of the model, with the ID as a tiebreaker. The next page starts after
+		the (ordering value, ID) of the last result, so there is no COUNT(*)
+		and no OFFSET.
+		- Nulls are ordered the way the database orders them by default
+		(on Postgres, first in descending order and last in ascending order),
+		so that the composite (ordering field, ID) indexes match the ordering.
+	"""
+	pagination_query_param = 'pagination'
+	keyset_pagination_query_value = 'keyset'
+	cursor_query_param = 'cursor'
+	invalid_cursor_message = 'Invalid cursor.'
+
+	def is_keyset_pagination(self, request):
+		return request.query_params.get(
+			self.pagination_query_param
+		) == self.keyset_pagination_query_value
+
+	def paginate_queryset(self, queryset, request, view=None):
+		if not self.is_keyset_pagination(request):
+			self.keyset_page = None
+			return super(KeysetPagination, self).paginate_queryset(
+				queryset, request, view
+			)
+
+		self.request = request
+		ordering = self.get_keyset_ordering(queryset)
+		field_name = ordering.lstrip('-')
+		is_descending = ordering.startswith('-')
+
+		# Ordering, with the ID as a tiebreaker
+		queryset = queryset.order_by(
+			ordering, '-id' if is_descending else 'id'
+		)
+
+		# Continuing after the cursor
+		cursor = request.query_params.get(self.cursor_query_param)
+		if cursor:
+			value, id = self.decode_cursor(
+				cursor, queryset.model._meta.get_field(field_name)
+			)
+			queryset = queryset.filter(self.get_after_cursor_filter(
+				queryset, field_name, is_descending, value, id
+			))
+
+		results = list(queryset[:self.page_size + 1])
+		self.keyset_page = results[:self.page_size]
+		self.next_cursor = None
+		if len(results) > self.page_size:
+			last = self.keyset_page[-1]
+			self.next_cursor = self.encode_cursor(
+				getattr(last, field_name), last.id
+			)
+		return self.keyset_page
+
+	def get_paginated_response(self, data):
+		if self.keyset_page is None:
+			return super(KeysetPagination, self).get_paginated_response(data)
+
+		return Response({
+			'next': self.get_next_cursor_link(),
+			'next_cursor': self.next_cursor,
+			'results': data
+		})
+
+	def get_keyset_ordering(self, queryset):
+		ordering = (
+			queryset.query.order_by or queryset.model._meta.ordering
+		)
+		if len(ordering) != 1 or not isinstance(ordering[0], str):
+			raise ValueError(
+				'Keyset pagination needs a single field ordering.'
+			)
+		return ordering[0]
+
+	def get_after_cursor_filter(self, queryset, field_name, is_descending,
+		value, id):
+		lookup = 'lt' if is_descending else 'gt'
+		nulls_order_largest = connections[
+			queryset.db
+		].features.nulls_order_largest
+		nulls_first = is_descending == nulls_order_largest
+
+		if value is None:
+			after_cursor = Q(**{
+				f'{field_name}__isnull': True, f'id__{lookup}': id
+			})
+			if nulls_first:
+				after_cursor |= Q(**{f'{field_name}__isnull': False})
+			return after_cursor
+
+		after_cursor = (
+			Q(**{f'{field_name}__{lookup}': value}) |
+			Q(**{field_name: value, f'id__{lookup}': id})
+		)
+		if not nulls_first:
+			after_cursor |= Q(**{f'{field_name}__isnull': True})
+		return after_cursor
+
+	def encode_cursor(self, value, id):
+		if hasattr(value, 'isoformat'):
+			value = value.isoformat()
+		cursor = json.dumps({'value': value, 'id': id})
+		return base64.urlsafe_b64encode(cursor.encode('utf-8')).decode('ascii')
+
+	def decode_cursor(self, cursor, field):
+		try:
+			cursor = json.loads(
+				base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+			)
+			value = cursor['value']
+			if value is not None:
+				value = field.to_python(value)
+			return value, int(cursor['id'])
+		except (KeyError, TypeError, ValueError, ValidationError):
+			raise NotFound(self.invalid_cursor_message)
+
+	def get_next_cursor_link(self):
+		if self.next_cursor is None:
+			return None
+
+		url = self.request.build_absolute_uri()
+		return replace_query_param(
+			url, self.cursor_query_param, self.next_cursor
+		)
@@ -1,9 +1,25 @@
+import copy
 import jwt
 import uuid
 
+from django.utils.functional import SimpleLazyObject
+from functools import partial
+
+from .caches import principal_cache, get_principal_cache_key
 from .env_variables_manager import get_main_api_key, get_auth_jwt_secret
+from .fetching import LoadPlan
 from .models import *
 
+# Constants
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+USER_LOAD_PLAN_REQUIRED_FIELDS = (
+	'id', 'uuid', 'country', 'points', 'last_active_at', 'mobile_user_id',
+	'is_verified_by_ops', 'is_suspended_by_ops', 'is_deleted'
+)
+
+
 # Permissions
 
 class BasePermission(object):
@@ -32,30 +48,76 @@ class CorrectAPIKeyPermission(BasePermission):
 		return False
 
 
+class UserLoadPlan(LoadPlan):
+	"""Describes how the authenticated user is loaded for a view, so that the
+	user is fetched in one query shaped for what the view needs.
+
+	Notes:
+		- The fields needed by the permission class itself are always loaded,
+		along with the fields of the load plan.
+	"""
+	def get_only(self):
+		return USER_LOAD_PLAN_REQUIRED_FIELDS + super(
+			UserLoadPlan, self
+		).get_only()
+
+
 class UserPermission(BasePermission):
-	"""JWT based auth permission for parents, tutors, and students."""
+	"""JWT based auth permission for parents, tutors, and students.
 
-	def get_parent(self, payload):
-		return Parent.objects.get(
-			uuid=uuid.UUID(payload['uuid']),
-			is_suspended_by_ops=False,
-			is_deleted=False
-		)
+	Notes:
+		- Views can set a user_load_plan to shape the query that loads the
+		user into view.user. The full row is loaded otherwise.
+	"""
 
-	def get_student(self, payload):
-		return Student.objects.get(
-			uuid=uuid.UUID(payload['uuid']),
-			is_suspended_by_ops=False,
-			is_deleted=False
-		)
+	def get_load_plan(self, view):
+		return getattr(view, 'user_load_plan', DEFAULT_USER_LOAD_PLAN)
 
-	def get_tutor(self, payload):
-		return Tutor.objects.get(
+	def get_user(self, model_class, payload, load_plan):
+		return load_plan.apply(model_class.objects.all()).get(
 			uuid=uuid.UUID(payload['uuid']),
 			is_suspended_by_ops=False,
 			is_deleted=False
 		)
 
+	def get_parent(self, payload, load_plan):
+		return self.get_user(Parent, payload, load_plan)
+
+	def get_student(self, payload, load_plan):
+		return self.get_user(Student, payload, load_plan)
+
+	def get_tutor(self, payload, load_plan):
+		return self.get_user(Tutor, payload, load_plan)
+
+	def get_cached_user(self, request, payload, load_plan, get_user):
+		"""Returns a copy of the cached user for the payload and load plan,
+		loading and caching the user with the given getter on a miss.
+
+		Notes:
+			- The cache is invalidated by the post_save and post_delete
+			signals of the user models, so suspensions and deletions take
+			effect right away.
+			- Every cache entry holds the user as loaded by each load plan.
+			- Views get their own copy, as they are free to modify the user.
+			- Only safe methods are served from the cache, so that views
+			which save the user never write back a stale copy.
+		"""
+		if request.method not in SAFE_METHODS:
+			return get_user(payload, load_plan)
+
+		key = get_principal_cache_key(payload['user_type'], payload['uuid'])
+		cached_users = principal_cache.get(key, {})
+		user = cached_users.get(load_plan.key)
+		if user is not None:
+			return copy.deepcopy(user)
+
+		generation = principal_cache.generation
+		user = get_user(payload, load_plan)
+		cached_users = dict(cached_users)
+		cached_users[load_plan.key] = copy.deepcopy(user)
+		principal_cache.set(key, cached_users, generation=generation)
+		return user
+
 	def has_permission(self, request, view):
 		if request.user.is_authenticated:
 			if request.user.is_superuser:
@@ -69,31 +131,40 @@ class UserPermission(BasePermission):
 					get_auth_jwt_secret()
 				)
 
+				# Get the load plan of the view
+				load_plan = self.get_load_plan(view)
+
 				# If user is a parent
 				if payload['user_type'] == 'parent':
-					view.user = self.get_parent(payload)
+					view.user = self.get_cached_user(
+						request, payload, load_plan, self.get_parent
+					)
 					view.user.update_mobile_user_id(
 						request.META.get('HTTP_MOBILE_USER_ID')
 					)
-					view.user.active_daily() # Saves if required
+					view.user.active_daily() # Recorded by the activity tracker
 					return True
 
 				# If user is a student
 				elif payload['user_type'] == 'student':
-					view.user = self.get_student(payload)
+					view.user = self.get_cached_user(
+						request, payload, load_plan, self.get_student
+					)
 					view.user.update_mobile_user_id(
 						request.META.get('HTTP_MOBILE_USER_ID')
 					)
-					view.user.active_daily() # Saves if required
+					view.user.active_daily() # Recorded by the activity tracker
 					return True
 
 				# If user is a tutor
 				elif payload['user_type'] == 'tutor':
-					view.user = self.get_tutor(payload)
+					view.user = self.get_cached_user(
+						request, payload, load_plan, self.get_tutor
+					)
 					view.user.update_mobile_user_id(
 						request.META.get('HTTP_MOBILE_USER_ID')
 					)
-					view.user.active_daily() # Saves if required
+					view.user.active_daily() # Recorded by the activity tracker
 					return True
 
 				# Otherwise, return False
@@ -109,26 +180,23 @@ class UserPermission(BasePermission):
 		return False
 
 
-class UserPermissionTutorSelectRelated(UserPermission):
-	"""Extended UserPermission where related objects for the tutor is returned
-	for faster loads.
-	"""
-	def get_tutor(self, payload):
-		return Tutor.objects.select_related(
-			'undergraduate_university_academic_bg', 'school_academic_bg',
-			'college_academic_bg'
-		).get(
-			uuid=uuid.UUID(payload['uuid']),
-			is_suspended_by_ops=False,
-			is_deleted=False
-		)
-
-
 class OpsPermission(BasePermission):
-	"""JWT based auth permission for operations team, and admin."""
+	"""JWT based auth permission for operations team, and admin.
+
+	Notes:
+		- Current tokens are authorized from their claims and the revocation
+		table, and the account is only loaded if the view uses it.
+		- Tokens issued before the claims were added still load the account
+		to check its type.
+	"""
 	def get_accepted_user_types(self):
 		return ['operations', 'admin']
 
+	def get_account(self, account_id):
+		return Account.objects.select_related(
+			'user', 'university'
+		).get(id=account_id)
+
 	def has_permission(self, request, view):
 		if request.user.is_authenticated:
 			if request.user.is_superuser:
@@ -142,13 +210,25 @@ class OpsPermission(BasePermission):
 					get_auth_jwt_secret()
 				)
 
-				# Get the account
-				view.account = Account.objects.select_related(
-					'user', 'university'
-				).get(id=payload['id'])
+				if payload.get('version') == AUTH_JWT_VERSION:
+					# Check if the token has been revoked or not
+					if payload['token_version'] < auth_jwt_revocations.get(
+						payload['id']
+					):
+						return False
+
+					view.auth_claims = payload
+					view.account = SimpleLazyObject(
+						partial(self.get_account, payload['id'])
+					)
+					user_type = payload['user_type']
+				else:
+					# Get the account
+					view.account = self.get_account(payload['id'])
+					user_type = view.account.account_type
 
 				# Check if the user type is acceptable or not
-				if view.account.account_type in self.get_accepted_user_types():
+				if user_type in self.get_accepted_user_types():
 					return True
 				else:
 					return False
@@ -172,3 +252,28 @@ class CampusAmbassadorPermission(OpsPermission):
 	def get_accepted_user_types(self):
 		return ['campus-ambassador']
 
+
+# User load plans
+
+DEFAULT_USER_LOAD_PLAN = UserLoadPlan()
+
+USER_IDENTITY_LOAD_PLAN = UserLoadPlan(only=('full_name',))
+
+TUTOR_ACADEMIC_BACKGROUNDS_LOAD_PLAN = UserLoadPlan(
+	select_related=(
+		'undergraduate_university_academic_bg', 'school_academic_bg',
+		'college_academic_bg'
+	)
+)
+
+TUTOR_TEACHING_PREFERENCES_LOAD_PLAN = UserLoadPlan(
+	select_related=(
+		'undergraduate_university_academic_bg', 'school_academic_bg',
+		'college_academic_bg'
+	),
+	prefetch_related=(
+		'offline_preferred_teaching_areas',
+		'offline_preferred_teaching_subjects',
+		'online_preferred_teaching_subjects'
+	)
+)
@@ -0,0 +1,84 @@
+import arrow
+
+from django.db import transaction
+from rest_framework import status
+
+from .models import get_jobs_limit, TutorJobQuota
+
+
+# Constants
+
+# (detail, status) of the reached limits, by (kind, account type)
+JOB_LIMIT_ERRORS = {
+	('daily_direct_requests', 'basic'): (
+		'Daily direct requests limit reached. Please upgrade to premium to '
+		'accept more jobs.',
+		status.HTTP_402_PAYMENT_REQUIRED
+	),
+	('daily_direct_requests', 'premium'): (
+		'Daily direct requests limit reached.',
+		status.HTTP_400_BAD_REQUEST
+	),
+	('monthly_direct_requests', 'basic'): (
+		'Monthly direct requests limit reached. Please upgrade to premium to '
+		'accept more jobs.',
+		status.HTTP_402_PAYMENT_REQUIRED
+	),
+	('monthly_direct_requests', 'premium'): (
+		'Monthly direct requests limit reached.',
+		status.HTTP_400_BAD_REQUEST
+	),
+	('daily_hot_jobs', 'basic'): (
+		'Please upgrade to premium to apply to hot jobs.',
+		status.HTTP_402_PAYMENT_REQUIRED
+	),
+	('daily_hot_jobs', 'premium'): (
+		'Daily hot jobs limit reached.',
+		status.HTTP_400_BAD_REQUEST
+	),
+	('monthly_hot_jobs', 'basic'): (
+		'Please upgrade to premium to apply to hot jobs.',
+		status.HTTP_402_PAYMENT_REQUIRED
+	),
+	('monthly_hot_jobs', 'premium'): (
+		'Monthly hot jobs limit reached.',
+		status.HTTP_400_BAD_REQUEST
+	)
+}
+
+
+# Quota enforcement
+
+class JobLimitReached(Exception):
+	def __init__(self, kind):
+		super(JobLimitReached, self).__init__(kind)
+		self.kind = kind
+
+
+def reserve_job(tutor, job_type):
+	"""Counts a direct request or hot job (job_type 'direct_requests' or
+	'hot_jobs') of the tutor in the current day and month. Returns None, or
+	the (detail, status) of the limit that has been reached.
+
+	Notes:
+		- Every count is one conditional UPDATE of the tutor's quota row, so
+		concurrent requests can never take more jobs than the limits.
+		- The daily and monthly counts are taken in a savepoint, so the daily
+		count is given back if the monthly limit has been reached.
+		- Meant to be called in the transaction that changes the job, before
+		the change, so that the job is given back if the change fails.
+	"""
+	now = arrow.utcnow()
+	account_type = tutor.get_account_type()
+	jobs_limit = get_jobs_limit(account_type)
+
+	try:
+		with transaction.atomic():
+			for kind in (f'daily_{job_type}', f'monthly_{job_type}'):
+				if not TutorJobQuota.increment(
+					tutor.pk, kind, jobs_limit[kind], now
+				):
+					raise JobLimitReached(kind)
+	except JobLimitReached as e:
+		return JOB_LIMIT_ERRORS[(e.kind, account_type)]
+	return None
@@ -0,0 +1,965 @@
+import arrow
+import bisect
+import json
+import math
+import threading
+import time
+import zlib
+
+from collections import namedtuple
+from django.contrib.postgres.search import (
+	SearchQuery, SearchRank, TrigramSimilarity
+)
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, connections, models, transaction
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from .caches import tutor_card_cache, tutor_filter_result_cache
+from .helpers import (
+	AREA_DISTANCE_BAND_KM, AREA_DISTANCE_MAX_KM, TEXT_SEARCH_CONFIG,
+	TEXT_SEARCH_MAX_LENGTH, TUTOR_RANKING_FIELDS,
+	TUTOR_RANKING_WEIGHTS, TUTOR_SHUFFLE_KEY_RANGE, get_tutor_ranking_score
+)
+from .models import (
+	AcademicBackground, AreaDistance, Tutor, TutorSearchIndex, University
+)
+from .serializers import TutorPublicSerializer
+
+
+# Constants
+
+TUTOR_BITMAP_SEARCH_ENABLED = False
+TUTOR_BITMAP_SEARCH_MAX_AGE = 60 # Seconds, before a full rebuild
+TUTOR_SEARCH_SEEDS = 64 # Distinct shuffles, so that results can be cached
+TUTOR_RANKING_BATCH_SIZE = 2000 # Rows per ranking score batch
+
+# (facet name, bitmap index bitset name) pairs
+TUTOR_SEARCH_FACETS = (
+	('offline_preferred_teaching_areas', 'areas'),
+	('offline_preferred_teaching_subjects', 'subjects'),
+	('gender', 'gender'),
+	('undergraduate_university', 'undergraduate_university')
+)
+
+TutorSearchRow = namedtuple('TutorSearchRow', (
+	'tutor_id', 'country', 'gender', 'academic_medium',
+	'undergraduate_university_id', 'undergraduate_university_grade',
+	'salary_range_start', 'salary_range_end',
+	'offline_preferred_teaching_subjects_arr',
+	'offline_preferred_teaching_areas_arr', 'ranking_score', 'shuffle_key'
+))
+
+
+# Text search
+
+def get_tutor_text_search_q(text, prefix=''):
+	"""Returns the filters of the tutors matching a text query: the words
+	match the search vector, or the full name is similar to the text. The
+	prefix is the path to the tutor, eg: 'tutor__'.
+	"""
+	return (
+		models.Q(**{
+			f'{prefix}search_vector':
+			SearchQuery(text, config=TEXT_SEARCH_CONFIG)
+		}) |
+		models.Q(**{f'{prefix}full_name__trigram_similar': text})
+	)
+
+
+def get_tutor_text_search_rank(text, prefix=''):
+	"""Returns the relevance of the tutors to a text query, the best of the
+	text search rank and the full name similarity.
+	"""
+	return Greatest(
+		SearchRank(
+			models.F(f'{prefix}search_vector'),
+			SearchQuery(text, config=TEXT_SEARCH_CONFIG)
+		),
+		TrigramSimilarity(f'{prefix}full_name', text)
+	)
+
+
+def get_text_search_query(data):
+	"""Returns the normalized text query (q) of a request, None if there is
+	none, or raises ValueError if it is not a string.
+	"""
+	text = data.get('q')
+	if text is None:
+		return None
+	if not isinstance(text, str):
+		raise ValueError('Not a valid string.')
+	return ' '.join(text.split())[:TEXT_SEARCH_MAX_LENGTH] or None
+
+
+# Search parameters
+
+def get_area_bands(area_ids, within_km):
+	"""Returns the IDs of the areas at most within_km km from the given
+	areas, in bands of AREA_DISTANCE_BAND_KM km, nearest band first. The
+	given areas are the first band.
+	"""
+	distances = {area_id: 0 for area_id in area_ids}
+	area_distances = AreaDistance.objects.filter(
+		from_area__in=area_ids,
+		distance__lte=min(within_km, AREA_DISTANCE_MAX_KM)
+	).values_list('to_area_id', 'distance')
+	for area_id, distance in area_distances:
+		distances[area_id] = min(distances.get(area_id, distance), distance)
+
+	area_bands = {}
+	for area_id, distance in distances.items():
+		area_bands.setdefault(
+			math.ceil(distance / AREA_DISTANCE_BAND_KM), []
+		).append(area_id)
+	return [sorted(area_bands[band]) for band in sorted(area_bands)]
+
+
+def get_tutor_search_q(search):
+	"""Returns the filters of the tutor search index for a search dict with
+	the keys country, gender, academic_medium, undergraduate_university,
+	salary_range, areas or area_bands, subjects, and q.
+	"""
+	filters = models.Q(country=search['country'])
+
+	if search.get('gender'):
+		filters &= models.Q(gender=search['gender'])
+
+	if search.get('academic_medium'):
+		filters &= models.Q(academic_medium=search['academic_medium'])
+
+	if search.get('undergraduate_university') is not None:
+		filters &= models.Q(
+			undergraduate_university=search['undergraduate_university']
+		)
+
+	if search.get('salary_range'):
+		salary_range_start, salary_range_end = search['salary_range']
+		filters &= models.Q(
+			salary_range_start__gte=salary_range_start,
+			salary_range_start__lte=salary_range_end,
+			salary_range_end__gte=salary_range_start,
+			salary_range_end__lte=salary_range_end
+		)
+
+	if search.get('areas'):
+		filters &= models.Q(
+			offline_preferred_teaching_areas_arr__contains=search['areas']
+		)
+
+	# Tutors teaching in any area of any band
+	if search.get('area_bands'):
+		filters &= models.Q(offline_preferred_teaching_areas_arr__overlap=[
+			area_id for area_band in search['area_bands']
+			for area_id in area_band
+		])
+
+	if search.get('subjects'):
+		filters &= models.Q(
+			offline_preferred_teaching_subjects_arr__overlap=search['subjects']
+		)
+
+	if search.get('q'):
+		filters &= get_tutor_text_search_q(search['q'], 'tutor__')
+
+	return filters
+
+
+def get_tutor_search_bands(search):
+	"""Returns the filters of the area bands of a search, nearest first."""
+	return [
+		models.Q(offline_preferred_teaching_areas_arr__overlap=area_band)
+		for area_band in search.get('area_bands') or ()
+	]
+
+
+def get_tutor_search_seed(data):
+	"""Returns the shuffle seed of a tutor filter request, or None if there
+	is none.
+
+	Notes:
+		- Clients send a random seed and keep it for the session, so that the
+		pages of a session come from the same shuffle.
+		- Old app versions send random_ordering instead. It is hashed with the
+		current date, so that their shuffle still changes every day.
+		- Seeds are reduced to TUTOR_SEARCH_SEEDS evenly spread rotations, so
+		that sessions share cached results.
+	"""
+	seed = data.get('seed')
+	if isinstance(seed, int) and not isinstance(seed, bool):
+		pass
+	elif data.get('random_ordering', []):
+		seed = zlib.crc32(json.dumps([
+			data['random_ordering'], arrow.utcnow().format('YYYY-MM-DD')
+		]).encode('utf-8'))
+	else:
+		return None
+
+	return (
+		seed % TUTOR_SEARCH_SEEDS *
+		(TUTOR_SHUFFLE_KEY_RANGE // TUTOR_SEARCH_SEEDS)
+	)
+
+
+def get_tutor_filter_cache_key(search, *args):
+	"""Returns the result cache key of a search, eg: with the seed, page
+	number, and page size of a page.
+	"""
+	search = dict(search)
+	# The order of the areas and subjects does not change the results
+	for name in ('areas', 'subjects'):
+		if search.get(name):
+			search[name] = sorted(set(search[name]))
+	return json.dumps(
+		[search, *[str(arg) for arg in args]],
+		sort_keys=True,
+		cls=DjangoJSONEncoder
+	)
+
+
+def get_tutor_search_facets(search):
+	"""Returns the number of tutors matching a search for every area,
+	subject, gender, and university, with one query.
+	"""
+	facets = {facet_name: {} for facet_name, bitset_name in TUTOR_SEARCH_FACETS}
+	queryset = TutorSearchIndex.objects.filter(
+		get_tutor_search_q(search)
+	).values(
+		'gender', 'undergraduate_university_id',
+		'offline_preferred_teaching_areas_arr',
+		'offline_preferred_teaching_subjects_arr'
+	)
+	sql, params = queryset.query.sql_with_params()
+
+	with connections[queryset.db].cursor() as cursor:
+		cursor.execute(f"""
+			WITH matches AS ({sql})
+			SELECT 'offline_preferred_teaching_areas', area::text, COUNT(*)
+			FROM matches, unnest(offline_preferred_teaching_areas_arr) AS area
+			GROUP BY area
+			UNION ALL
+			SELECT 'offline_preferred_teaching_subjects', subject::text, COUNT(*)
+			FROM matches,
+			unnest(offline_preferred_teaching_subjects_arr) AS subject
+			GROUP BY subject
+			UNION ALL
+			SELECT 'gender', gender, COUNT(*)
+			FROM matches WHERE gender <> ''
+			GROUP BY gender
+			UNION ALL
+			SELECT 'undergraduate_university',
+			undergraduate_university_id::text, COUNT(*)
+			FROM matches
+			GROUP BY undergraduate_university_id
+		""", params)
+		for facet_name, key, count in cursor.fetchall():
+			if facet_name != 'gender':
+				key = int(key)
+			facets[facet_name][key] = count
+
+	return facets
+
+
+class ShuffledTutorIds(object):
+	"""The tutor IDs of a search index queryset, ordered by the ranking
+	score (highest first) and then shuffled by a seed. Can be paginated.
+
+	Notes:
+		- The shuffle rotates the shuffle keys by the seed, so every ranking
+		score is split into two segments: the shuffle keys from the seed up,
+		then the shuffle keys below the seed.
+		- Every segment is read in (shuffle key, tutor) order, which the
+		(country, ranking score, shuffle key, tutor) index already has, so a
+		page never sorts the whole result.
+		- The segment sizes come from one grouped COUNT query, and are used
+		to skip the segments before the page.
+		- If filters of bands are given, the tutors are first ordered by the
+		first band they match, eg: the distance bands of the areas.
+	"""
+	def __init__(self, queryset, seed, bands=None):
+		self.queryset = queryset
+		self.seed = seed
+		self.bands = bands or []
+		self._segments = None
+
+	def get_segments(self):
+		"""Returns the (filters, size) of the segments, in order."""
+		if self._segments is not None:
+			return self._segments
+
+		search_band = models.Value(0, output_field=models.IntegerField())
+		if self.bands:
+			search_band = models.Case(
+				*[
+					models.When(band_filter, then=models.Value(band))
+					for band, band_filter in enumerate(self.bands)
+				],
+				output_field=models.IntegerField()
+			)
+		groups = self.queryset.order_by().annotate(
+			search_band=search_band
+		).values(
+			'search_band', 'ranking_score'
+		).annotate(
+			above_seed=models.Count(
+				'pk', filter=models.Q(shuffle_key__gte=self.seed)
+			),
+			total=models.Count('pk')
+		)
+		groups = sorted(groups, key=lambda group: (
+			group['search_band'], -group['ranking_score']
+		))
+
+		self._segments = []
+		for group in groups:
+			# Tutors are in the first band they match
+			segment_filter = models.Q()
+			if self.bands:
+				segment_filter = self.bands[group['search_band']]
+				for band_filter in self.bands[:group['search_band']]:
+					segment_filter &= ~band_filter
+
+			segment_filter &= models.Q(ranking_score=group['ranking_score'])
+
+			self._segments += [
+				(
+					segment_filter & models.Q(shuffle_key__gte=self.seed),
+					group['above_seed']
+				),
+				(
+					segment_filter & models.Q(shuffle_key__lt=self.seed),
+					group['total'] - group['above_seed']
+				)
+			]
+		return self._segments
+
+	def count(self):
+		return sum(size for segment, size in self.get_segments())
+
+	def __len__(self):
+		return self.count()
+
+	def __getitem__(self, index):
+		if not isinstance(index, slice):
+			return self[index:index + 1][0]
+
+		start = index.start or 0
+		stop = self.count() if index.stop is None else index.stop
+		tutor_ids = []
+		for segment, size in self.get_segments():
+			if stop <= 0:
+				break
+			if start < size:
+				tutor_ids += self.queryset.filter(segment).order_by(
+					'shuffle_key', 'tutor_id'
+				).values_list('tutor_id', flat=True)[start:stop]
+			start = max(start - size, 0)
+			stop -= size
+		return tutor_ids
+
+
+def get_ranked_tutor_ids(search):
+	"""Returns the tutor IDs matching a search with a text query, ordered by
+	their relevance to the text, and then by the ranking score.
+	"""
+	return TutorSearchIndex.objects.filter(
+		get_tutor_search_q(search)
+	).annotate(
+		text_rank=get_tutor_text_search_rank(search['q'], 'tutor__')
+	).order_by(
+		'-text_rank', '-ranking_score', 'tutor_id'
+	).values_list('tutor_id', flat=True)
+
+
+class CachedTutorIds(object):
+	"""A cached page of tutor IDs, which can be paginated like the full list
+	of tutor IDs it came from.
+	"""
+	def __init__(self, count, offset, tutor_ids):
+		self._count = count
+		self.offset = offset
+		self.tutor_ids = tutor_ids
+
+	def count(self):
+		return self._count
+
+	def __len__(self):
+		return self._count
+
+	def __getitem__(self, index):
+		return self.tutor_ids[
+			index.start - self.offset:index.stop - self.offset
+		]
+
+
+# Bitsets
+
+def get_bitset(slots, size):
+	"""Returns an int with the bits of the slots set."""
+	bits = bytearray((size + 7) // 8)
+	for slot in slots:
+		bits[slot >> 3] |= 1 << (slot & 7)
+	return int.from_bytes(bits, 'little')
+
+
+def get_slots(bitset):
+	"""Returns the slots of the set bits of an int, in ascending order."""
+	bits = bin(bitset)[:1:-1]
+	slots = []
+	slot = bits.find('1')
+	while slot != -1:
+		slots.append(slot)
+		slot = bits.find('1', slot + 1)
+	return slots
+
+
+# Bitmap index
+
+class TutorBitmapIndex(object):
+	"""Stores the tutor search index rows of a country in memory, with one
+	bitset per gender, academic medium, university, area, and subject.
+
+	Notes:
+		- Every row has a slot, and bit n of a bitset is set if the row in
+		slot n has that value. The slots of removed rows are reused.
+		- The salaries are kept in sorted (salary, slot) arrays, which are
+		sorted again on the next salary search after a change.
+	"""
+	def __init__(self):
+		self.slots = {}
+		self.rows = []
+		self.free_slots = []
+		self.all = 0
+		self.bitsets = {
+			'gender': {},
+			'academic_medium': {},
+			'undergraduate_university': {},
+			'areas': {},
+			'subjects': {}
+		}
+		self._salary_starts = None
+		self._salary_ends = None
+
+	def get_row_keys(self, row):
+		"""Returns the (bitset name, key) pairs of a row."""
+		keys = [
+			('gender', row.gender),
+			('academic_medium', row.academic_medium),
+			('undergraduate_university', row.undergraduate_university_id)
+		]
+		keys += [
+			('areas', area) for area in set(
+				row.offline_preferred_teaching_areas_arr
+			)
+		]
+		keys += [
+			('subjects', subject) for subject in set(
+				row.offline_preferred_teaching_subjects_arr
+			)
+		]
+		return keys
+
+	def add(self, row):
+		"""Adds or replaces the row of a tutor."""
+		self.remove(row.tutor_id)
+
+		if self.free_slots:
+			slot = self.free_slots.pop()
+			self.rows[slot] = row
+		else:
+			slot = len(self.rows)
+			self.rows.append(row)
+		self.slots[row.tutor_id] = slot
+
+		bit = 1 << slot
+		self.all |= bit
+		for name, key in self.get_row_keys(row):
+			bitsets = self.bitsets[name]
+			bitsets[key] = bitsets.get(key, 0) | bit
+		self._salary_starts = self._salary_ends = None
+
+	def remove(self, tutor_id):
+		"""Removes the row of a tutor, if there is one."""
+		slot = self.slots.pop(tutor_id, None)
+		if slot is None:
+			return
+
+		row = self.rows[slot]
+		self.rows[slot] = None
+		self.free_slots.append(slot)
+
+		bit = 1 << slot
+		self.all &= ~bit
+		for name, key in self.get_row_keys(row):
+			bitsets = self.bitsets[name]
+			bitsets[key] &= ~bit
+			if not bitsets[key]:
+				del bitsets[key]
+		self._salary_starts = self._salary_ends = None
+
+	def get_salary_bitset(self, salary_range_start, salary_range_end):
+		if self._salary_starts is None:
+			self._salary_starts = sorted(
+				(row.salary_range_start, slot)
+				for slot, row in enumerate(self.rows)
+				if row and row.salary_range_start is not None
+			)
+			self._salary_ends = sorted(
+				(row.salary_range_end, slot)
+				for slot, row in enumerate(self.rows)
+				if row and row.salary_range_end is not None
+			)
+
+		bitset = self.all
+		for salaries in (self._salary_starts, self._salary_ends):
+			# Every (salary, slot) pair with salary_range_start <= salary <=
+			# salary_range_end, as slots are never negative
+			start = bisect.bisect_left(salaries, (salary_range_start, -1))
+			end = bisect.bisect_left(salaries, (salary_range_end, len(self.rows)))
+			bitset &= get_bitset(
+				(slot for salary, slot in salaries[start:end]), len(self.rows)
+			)
+		return bitset
+
+	def get_area_bands_bitset(self, area_bands):
+		bitset = 0
+		for area_band in area_bands:
+			for area in area_band:
+				bitset |= self.bitsets['areas'].get(area, 0)
+		return bitset
+
+	def get_bitset(self, search):
+		"""Returns the bitset of the rows matching a search."""
+		bitset = self.all
+
+		for name in ('gender', 'academic_medium'):
+			if search.get(name):
+				bitset &= self.bitsets[name].get(search[name], 0)
+
+		if search.get('undergraduate_university') is not None:
+			bitset &= self.bitsets['undergraduate_university'].get(
+				search['undergraduate_university'], 0
+			)
+
+		# Contains every area
+		for area in search.get('areas') or ():
+			bitset &= self.bitsets['areas'].get(area, 0)
+
+		# Teaches in any area of any band
+		if search.get('area_bands'):
+			bitset &= self.get_area_bands_bitset(search['area_bands'])
+
+		# Overlaps the subjects
+		if search.get('subjects'):
+			subjects = 0
+			for subject in search['subjects']:
+				subjects |= self.bitsets['subjects'].get(subject, 0)
+			bitset &= subjects
+
+		if bitset and search.get('salary_range'):
+			bitset &= self.get_salary_bitset(*search['salary_range'])
+		return bitset
+
+	def search(self, search, seed):
+		"""Returns the tutor IDs matching a search, ordered by the area band,
+		the ranking score (highest first), and then shuffled by the seed,
+		like ShuffledTutorIds.
+		"""
+		bitset = self.get_bitset(search)
+
+		# Slots by the first area band they match
+		search_bands = {}
+		unbanded = bitset
+		for band, area_band in enumerate(search.get('area_bands') or ()):
+			band_bitset = unbanded & self.get_area_bands_bitset([area_band])
+			for slot in get_slots(band_bitset):
+				search_bands[slot] = band
+			unbanded &= ~band_bitset
+
+		rows = [
+			(search_bands.get(slot, 0), self.rows[slot])
+			for slot in get_slots(bitset)
+		]
+		rows.sort(key=lambda row: (
+			row[0],
+			-row[1].ranking_score,
+			(row[1].shuffle_key - seed) % TUTOR_SHUFFLE_KEY_RANGE,
+			row[1].tutor_id
+		))
+		return [row.tutor_id for band, row in rows]
+
+	def get_facets(self, search):
+		"""Returns the facet counts of a search, like
+		get_tutor_search_facets().
+		"""
+		bitset = self.get_bitset(search)
+		facets = {}
+		for facet_name, bitset_name in TUTOR_SEARCH_FACETS:
+			facets[facet_name] = {}
+			for key, bits in self.bitsets[bitset_name].items():
+				count = bin(bitset & bits).count('1')
+				if count and key not in ('', None):
+					facets[facet_name][key] = count
+		return facets
+
+
+# Search engine
+
+class TutorBitmapSearchEngine(object):
+	"""Answers tutor filter searches from in-memory bitmap indexes of the
+	tutor search index table, one per country.
+
+	Notes:
+		- The indexes are built in a background thread, and are updated from
+		the saved and deleted search index rows once they are committed.
+		- The indexes are fully rebuilt every max_age seconds, as rows can be
+		changed by other processes. While they are stale or being built,
+		search() returns None so that the SQL search is used instead.
+		- Searches with a text query are always left to the SQL search.
+	"""
+	def __init__(self, enabled, max_age):
+		self.enabled = enabled
+		self.max_age = max_age
+		self.indexes = None
+		self.built_at = None
+		self._pending = None
+		self._lock = threading.Lock()
+
+	def is_stale(self):
+		return (
+			self.built_at is None or
+			time.monotonic() - self.built_at > self.max_age
+		)
+
+	def search(self, search, seed):
+		"""Returns the ordered tutor IDs matching a search, or None if the
+		SQL search has to be used.
+		"""
+		if not self.enabled or search.get('q'):
+			return None
+
+		if self.is_stale():
+			self.start_rebuild()
+			return None
+
+		with self._lock:
+			index = self.indexes.get(search['country'])
+			if index is None:
+				return []
+			return index.search(search, seed)
+
+	def get_facets(self, search):
+		"""Returns the facet counts of a search, or None if the SQL facets
+		have to be used.
+		"""
+		if not self.enabled or search.get('q'):
+			return None
+
+		if self.is_stale():
+			self.start_rebuild()
+			return None
+
+		with self._lock:
+			index = self.indexes.get(search['country'])
+			if index is None:
+				return {
+					facet_name: {}
+					for facet_name, bitset_name in TUTOR_SEARCH_FACETS
+				}
+			return index.get_facets(search)
+
+	def start_rebuild(self):
+		"""Rebuilds the indexes in a background thread, unless a rebuild is
+		already running.
+		"""
+		with self._lock:
+			if self._pending is not None:
+				return
+			self._pending = []
+
+		threading.Thread(
+			target=self._rebuild, name='tutor-bitmap-search', daemon=True
+		).start()
+
+	def _rebuild(self):
+		try:
+			close_old_connections()
+			self.rebuild()
+		except Exception as e:
+			with self._lock:
+				self._pending = None
+
+	def rebuild(self):
+		"""Builds the indexes from the tutor search index table."""
+		with self._lock:
+			if self._pending is None:
+				self._pending = []
+
+		indexes = {}
+		rows = TutorSearchIndex.objects.values_list(*TutorSearchRow._fields)
+		for row in rows.iterator():
+			row = TutorSearchRow(*row)
+			country_code = str(row.country)
+			if country_code not in indexes:
+				indexes[country_code] = TutorBitmapIndex()
+			indexes[country_code].add(row)
+
+		# Rows changed while the table was being read
+		with self._lock:
+			for tutor_id, row in self._pending:
+				self._apply(indexes, tutor_id, row)
+			self.indexes = indexes
+			self.built_at = time.monotonic()
+			self._pending = None
+
+	def update(self, tutor_id, row):
+		"""Adds, replaces, or removes (if row is None) the row of a tutor."""
+		with self._lock:
+			if self._pending is not None:
+				self._pending.append((tutor_id, row))
+			if self.indexes is not None:
+				self._apply(self.indexes, tutor_id, row)
+
+	def _apply(self, indexes, tutor_id, row):
+		for index in indexes.values():
+			index.remove(tutor_id)
+		if row is not None:
+			country_code = str(row.country)
+			if country_code not in indexes:
+				indexes[country_code] = TutorBitmapIndex()
+			indexes[country_code].add(row)
+
+	def invalidate(self):
+		"""Marks the indexes as stale."""
+		with self._lock:
+			self.built_at = None
+
+
+tutor_search_engine = TutorBitmapSearchEngine(
+	TUTOR_BITMAP_SEARCH_ENABLED,
+	TUTOR_BITMAP_SEARCH_MAX_AGE
+)
+
+
+def update_tutor_search_engine(sender, instance, **kwargs):
+	"""Copies a saved or deleted search index row to the search engine once
+	it has been committed.
+	"""
+	if not tutor_search_engine.enabled:
+		return
+
+	if kwargs.get('signal') is post_delete:
+		row = None
+	else:
+		row = TutorSearchRow(*[
+			getattr(instance, field_name) for field_name in TutorSearchRow._fields
+		])
+	transaction.on_commit(
+		lambda: tutor_search_engine.update(instance.tutor_id, row)
+	)
+
+post_save.connect(update_tutor_search_engine, sender=TutorSearchIndex)
+post_delete.connect(update_tutor_search_engine, sender=TutorSearchIndex)
+
+
+def invalidate_tutor_search_engine(sender, instance, **kwargs):
+	"""Rebuilds the search engine after a university is saved, as the grades
+	are copied to the search index rows without saving them.
+	"""
+	if tutor_search_engine.enabled:
+		transaction.on_commit(tutor_search_engine.invalidate)
+
+post_save.connect(invalidate_tutor_search_engine, sender=University)
+
+
+# Result cache invalidation
+
+def invalidate_tutor_filter_results(sender, instance, **kwargs):
+	"""Drops the cached results of a country once a search index row of the
+	country has been committed. Rows are only created, deleted, or saved
+	when a tutor is verified, suspended, or deleted, or their search fields
+	change.
+	"""
+	country_code = str(instance.country)
+	transaction.on_commit(
+		lambda: tutor_filter_result_cache.invalidate_tag(country_code)
+	)
+
+post_save.connect(invalidate_tutor_filter_results, sender=TutorSearchIndex)
+post_delete.connect(invalidate_tutor_filter_results, sender=TutorSearchIndex)
+
+
+def clear_tutor_filter_results():
+	"""Drops every cached result and rebuilds the search engine, after the
+	search index rows have been updated without saving them.
+	"""
+	tutor_filter_result_cache.clear()
+	if tutor_search_engine.enabled:
+		tutor_search_engine.invalidate()
+
+
+# Ranking
+
+def update_tutor_ranking_scores(weights=TUTOR_RANKING_WEIGHTS,
+	batch_size=TUTOR_RANKING_BATCH_SIZE):
+	"""Recomputes the ranking scores of every search index row. Returns the
+	number of changed scores.
+
+	Notes:
+		- Meant to be run as a batch job, eg: daily, as the activity
+		component decays with time and the review and profile view counters
+		are changed without saving the tutors.
+		- The rows are read in batches of tutor IDs, and only the changed
+		scores are written, with one bulk UPDATE per batch.
+	"""
+	now = timezone.now()
+	queryset = TutorSearchIndex.objects.order_by('tutor_id').values(
+		'tutor_id', 'ranking_score', 'undergraduate_university_grade',
+		*[f'tutor__{field_name}' for field_name in TUTOR_RANKING_FIELDS]
+	)
+
+	number_of_changes = 0
+	last_tutor_id = None
+	while True:
+		rows = queryset
+		if last_tutor_id is not None:
+			rows = rows.filter(tutor_id__gt=last_tutor_id)
+		rows = list(rows[:batch_size])
+		if not rows:
+			break
+		last_tutor_id = rows[-1]['tutor_id']
+
+		changed = []
+		for row in rows:
+			values = {
+				field_name: row[f'tutor__{field_name}']
+				for field_name in TUTOR_RANKING_FIELDS
+			}
+			values['undergraduate_university_grade'] = row[
+				'undergraduate_university_grade'
+			]
+			ranking_score = get_tutor_ranking_score(values, now, weights)
+			if ranking_score != row['ranking_score']:
+				changed.append(TutorSearchIndex(
+					tutor_id=row['tutor_id'], ranking_score=ranking_score
+				))
+
+		if changed:
+			TutorSearchIndex.objects.bulk_update(changed, ['ranking_score'])
+			number_of_changes += len(changed)
+
+	if number_of_changes:
+		transaction.on_commit(clear_tutor_filter_results)
+	return number_of_changes
+
+
+# Public tutor cards
+
+def update_tutor_public_cards(tutor_ids):
+	"""Builds and stores the public cards of the tutors that have a search
+	index row. Returns the cards by tutor ID.
+	"""
+	tutors = Tutor.objects.select_related(
+		'undergraduate_university_academic_bg', 'school_academic_bg',
+		'college_academic_bg'
+	).filter(id__in=tutor_ids, search_index__isnull=False)
+
+	public_cards = {}
+	for tutor in tutors:
+		public_cards[tutor.id] = TutorPublicSerializer(tutor).data
+		TutorSearchIndex.objects.filter(tutor_id=tutor.id).update(
+			public_card=public_cards[tutor.id]
+		)
+	return public_cards
+
+
+def get_tutor_public_cards(tutor_ids):
+	"""Returns the public cards of the tutors, in order, from the card cache
+	or else the search index. Missing cards are built, and tutors without a
+	search index row are left out.
+	"""
+	public_cards = {}
+	missing_tutor_ids = []
+	for tutor_id in tutor_ids:
+		public_card = tutor_card_cache.get(tutor_id)
+		if public_card is None:
+			missing_tutor_ids.append(tutor_id)
+		else:
+			public_cards[tutor_id] = public_card
+
+	if missing_tutor_ids:
+		generation = tutor_card_cache.generation
+		stored_public_cards = dict(TutorSearchIndex.objects.filter(
+			tutor_id__in=missing_tutor_ids
+		).values_list('tutor_id', 'public_card'))
+
+		# Rows created before their card has been built
+		unbuilt_tutor_ids = [
+			tutor_id for tutor_id, public_card in stored_public_cards.items()
+			if not public_card
+		]
+		if unbuilt_tutor_ids:
+			stored_public_cards.update(
+				update_tutor_public_cards(unbuilt_tutor_ids)
+			)
+
+		for tutor_id, public_card in stored_public_cards.items():
+			if public_card:
+				public_cards[tutor_id] = public_card
+				tutor_card_cache.set(tutor_id, public_card, generation=generation)
+
+	return [
+		public_cards[tutor_id] for tutor_id in tutor_ids
+		if tutor_id in public_cards
+	]
+
+
+def rebuild_tutor_public_cards(tutor_ids):
+	"""Rebuilds the stored cards, then drops the cached ones, so that a card
+	cached in between is dropped as well.
+	"""
+	try:
+		update_tutor_public_cards(tutor_ids)
+	except Exception as e:
+		pass
+
+	for tutor_id in tutor_ids:
+		tutor_card_cache.delete(tutor_id)
+
+
+def rebuild_tutor_public_card(sender, instance, **kwargs):
+	"""Rebuilds the card of a tutor once the tutor has been committed."""
+	tutor_ids = [instance.id]
+	transaction.on_commit(lambda: rebuild_tutor_public_cards(tutor_ids))
+
+post_save.connect(rebuild_tutor_public_card, sender=Tutor)
+
+
+def invalidate_tutor_public_card(sender, instance, **kwargs):
+	"""Drops the cached card of a deleted tutor."""
+	tutor_id = instance.id
+	transaction.on_commit(lambda: tutor_card_cache.delete(tutor_id))
+
+post_delete.connect(invalidate_tutor_public_card, sender=Tutor)
+
+
+def rebuild_tutor_public_cards_for_academic_background(sender, instance,
+	**kwargs):
+	"""Rebuilds the cards of the tutors of an academic background, as the
+	cards show the academic backgrounds.
+	"""
+	if kwargs.get('created'):
+		return
+
+	tutor_ids = list(Tutor.objects.filter(
+		models.Q(undergraduate_university_academic_bg=instance) |
+		models.Q(school_academic_bg=instance) |
+		models.Q(college_academic_bg=instance)
+	).values_list('id', flat=True))
+	transaction.on_commit(lambda: rebuild_tutor_public_cards(tutor_ids))
+
+post_save.connect(
+	rebuild_tutor_public_cards_for_academic_background,
+	sender=AcademicBackground
+)
@@ -17,6 +17,7 @@ class ParentSignUpSerializer(serializers.ModelSerializer):
 		instance = Parent(**validated_data)
 		instance.set_otp()
 		instance.save()
+		instance.send_otp()
 		return instance
 
 
@@ -31,6 +32,7 @@ class StudentSignUpSerializer(serializers.ModelSerializer):
 		instance = Student(**validated_data)
 		instance.set_otp()
 		instance.save()
+		instance.send_otp()
 		return instance
 
 
@@ -394,7 +396,7 @@ class TuitionRequestSerializer(serializers.ModelSerializer):
 			'teaching_place_preference', 'number_of_days_per_week', 'salary',
 			'is_salary_negotiable', 'subjects', 'confirmation_date',
 			'find_similar_tutors_for_parent', 'parent_rft', 'job_origin',
-			'review', 'country', 'show_tutors_phone_number',
+			'review', 'country', 'show_tutors_phone_number', 'version',
 		]
 
 
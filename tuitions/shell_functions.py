@@ -2,7 +2,7 @@ import arrow
 import json
 
 from decimal import Decimal
-from django.db import transaction
+from django.db import connection, transaction
 
 from .serializers import *
 from .models import *
@@ -1474,3 +1474,496 @@ def validate_data():
 	validate_tuition_request()
 	# validate_tutor()
 	# validate_parent()
+
+def benchmark_tutor_search(number_of_tutors=100000, number_of_queries=200):
+	'''
+	COMPARES THE FIRST PAGE OF THE TUTOR FILTER FROM THE SEARCH INDEX TABLE
+	AND FROM THE IN-MEMORY BITMAP SEARCH ENGINE, ON SYNTHETIC TUTORS.
+	EVERYTHING IS ROLLED BACK AT THE END. POSTGRES CHECKS THE FOREIGN KEYS AT
+	COMMIT, SO THE SYNTHETIC ROWS DO NOT NEED REAL TUTORS.
+	'''
+	import random
+	import statistics
+	import time
+
+	from .search import (
+		get_tutor_search_q, ShuffledTutorIds, TutorBitmapSearchEngine,
+		TUTOR_BITMAP_SEARCH_MAX_AGE
+	)
+
+	random.seed(0)
+	area_ids = list(range(1, 117))
+	subject_ids = list(range(1, 251))
+
+	def get_salary_range():
+		salary_range_start = Decimal(random.randint(1, 20) * 500)
+		return (
+			salary_range_start,
+			salary_range_start + Decimal(random.randint(0, 10) * 500)
+		)
+
+	with transaction.atomic():
+		universities = [
+			University.objects.create(
+				name=f'Benchmark university {i}',
+				grade=random.choice([None, 1, 2, 3])
+			) for i in range(40)
+		]
+
+		rows = []
+		for i in range(number_of_tutors):
+			university = random.choice(universities)
+			salary_range_start, salary_range_end = get_salary_range()
+			rows.append(TutorSearchIndex(
+				tutor_id=10 ** 9 + i,
+				country='BD',
+				gender=random.choice(['male', 'female']),
+				academic_medium=random.choice([
+					'english-medium', 'bangla-medium', ''
+				]),
+				undergraduate_university=university,
+				undergraduate_university_grade=university.grade,
+				salary_range_start=salary_range_start,
+				salary_range_end=salary_range_end,
+				offline_preferred_teaching_subjects_arr=random.sample(
+					subject_ids, random.randint(1, 8)
+				),
+				offline_preferred_teaching_areas_arr=random.sample(
+					area_ids, random.randint(1, 6)
+				),
+				shuffle_key=get_tutor_shuffle_key()
+			))
+		TutorSearchIndex.objects.bulk_create(rows, batch_size=5000)
+		with connection.cursor() as cursor:
+			cursor.execute(f'ANALYZE {TutorSearchIndex._meta.db_table}')
+
+		started_at = time.perf_counter()
+		engine = TutorBitmapSearchEngine(True, TUTOR_BITMAP_SEARCH_MAX_AGE)
+		engine.rebuild()
+		build_time = time.perf_counter() - started_at
+
+		searches = []
+		for i in range(number_of_queries):
+			search = {'country': 'BD'}
+			if random.random() < 0.5:
+				search['gender'] = random.choice(['male', 'female'])
+			if random.random() < 0.8:
+				search['areas'] = random.sample(area_ids, random.randint(1, 2))
+			if random.random() < 0.8:
+				search['subjects'] = random.sample(
+					subject_ids, random.randint(1, 5)
+				)
+			if random.random() < 0.5:
+				search['salary_range'] = get_salary_range()
+			searches.append(search)
+		seed = get_tutor_shuffle_key()
+
+		def run(get_first_page):
+			times = []
+			for search in searches:
+				started_at = time.perf_counter()
+				get_first_page(search)
+				times.append((time.perf_counter() - started_at) * 1000)
+			times.sort()
+			return (
+				statistics.mean(times),
+				times[int(len(times) * 0.95) - 1]
+			)
+
+		def get_sql_first_page(search):
+			tutor_ids = ShuffledTutorIds(
+				TutorSearchIndex.objects.filter(get_tutor_search_q(search)),
+				seed
+			)
+			return tutor_ids.count(), tutor_ids[:20]
+
+		def get_engine_first_page(search):
+			tutor_ids = engine.search(search, seed)
+			return len(tutor_ids), tutor_ids[:20]
+
+		print(f'Tutors: {number_of_tutors}, searches: {number_of_queries}')
+		print(f'Bitmap engine build: {build_time * 1000:.0f} ms')
+		for name, get_first_page in (
+			('Postgres', get_sql_first_page),
+			('Bitmap engine', get_engine_first_page)
+		):
+			mean, p95 = run(get_first_page)
+			print(f'{name}: mean {mean:.2f} ms, p95 {p95:.2f} ms')
+
+		transaction.set_rollback(True)
+
+
+def benchmark_tutor_ranking(number_of_tutors=100000, number_of_queries=200):
+	'''
+	COMPARES THE FIRST PAGE OF THE TUTOR FILTER ORDERED BY THE OLD
+	MULTI-COLUMN SORT (UNIVERSITY GRADE, NULLS LAST, THEN THE SHUFFLE KEY)
+	AND BY THE INDEXED RANKING SCORE, ON SYNTHETIC TUTORS. EVERYTHING IS
+	ROLLED BACK AT THE END. POSTGRES CHECKS THE FOREIGN KEYS AT COMMIT, SO THE
+	SYNTHETIC ROWS DO NOT NEED REAL TUTORS.
+	'''
+	import random
+	import statistics
+	import time
+
+	from datetime import timedelta
+	from django.db.models import F
+	from django.utils import timezone
+	from .search import get_tutor_search_q, ShuffledTutorIds
+
+	random.seed(0)
+	area_ids = list(range(1, 117))
+	subject_ids = list(range(1, 251))
+	now = timezone.now()
+
+	def get_ranking_score(grade):
+		number_of_reviews = random.choice([0, 0, 1, 3, 10, 40])
+		return get_tutor_ranking_score({
+			'tutor_behavior': number_of_reviews * random.randint(1, 5),
+			'way_of_teaching': number_of_reviews * random.randint(1, 5),
+			'communication_skills': number_of_reviews * random.randint(1, 5),
+			'time_management': number_of_reviews * random.randint(1, 5),
+			'number_of_reviews': number_of_reviews,
+			'last_active_at': now - timedelta(days=random.randint(0, 120)),
+			'number_of_public_profile_views': random.randint(0, 2000),
+			'is_personal_information_complete': random.random() < 0.8,
+			'is_teaching_preferences_complete': random.random() < 0.7,
+			'undergraduate_university_academic_bg__is_complete':
+			random.random() < 0.6,
+			'undergraduate_university_grade': grade
+		}, now)
+
+	with transaction.atomic():
+		universities = [
+			University.objects.create(
+				name=f'Benchmark university {i}',
+				grade=random.choice([None, 1, 2, 3])
+			) for i in range(40)
+		]
+
+		rows = []
+		for i in range(number_of_tutors):
+			university = random.choice(universities)
+			rows.append(TutorSearchIndex(
+				tutor_id=10 ** 9 + i,
+				country='BD',
+				gender=random.choice(['male', 'female']),
+				undergraduate_university=university,
+				undergraduate_university_grade=university.grade,
+				offline_preferred_teaching_subjects_arr=random.sample(
+					subject_ids, random.randint(1, 8)
+				),
+				offline_preferred_teaching_areas_arr=random.sample(
+					area_ids, random.randint(1, 6)
+				),
+				ranking_score=get_ranking_score(university.grade),
+				shuffle_key=get_tutor_shuffle_key()
+			))
+		TutorSearchIndex.objects.bulk_create(rows, batch_size=5000)
+		with connection.cursor() as cursor:
+			cursor.execute(f'ANALYZE {TutorSearchIndex._meta.db_table}')
+
+		searches = []
+		for i in range(number_of_queries):
+			search = {'country': 'BD'}
+			if random.random() < 0.5:
+				search['gender'] = random.choice(['male', 'female'])
+			if random.random() < 0.5:
+				search['areas'] = random.sample(area_ids, 1)
+			if random.random() < 0.5:
+				search['subjects'] = random.sample(
+					subject_ids, random.randint(1, 5)
+				)
+			searches.append(search)
+		seed = get_tutor_shuffle_key()
+
+		def run(get_first_page):
+			times = []
+			for search in searches:
+				started_at = time.perf_counter()
+				get_first_page(search)
+				times.append((time.perf_counter() - started_at) * 1000)
+			times.sort()
+			return (
+				statistics.mean(times),
+				times[int(len(times) * 0.95) - 1]
+			)
+
+		def get_multi_column_sort_first_page(search):
+			return list(TutorSearchIndex.objects.filter(
+				get_tutor_search_q(search)
+			).order_by(
+				F('undergraduate_university_grade').asc(nulls_last=True),
+				'shuffle_key', 'tutor_id'
+			).values_list('tutor_id', flat=True)[:20])
+
+		def get_ranking_index_first_page(search):
+			return list(TutorSearchIndex.objects.filter(
+				get_tutor_search_q(search)
+			).order_by(
+				'-ranking_score', '-shuffle_key', '-tutor_id'
+			).values_list('tutor_id', flat=True)[:20])
+
+		def get_shuffled_ranking_first_page(search):
+			tutor_ids = ShuffledTutorIds(
+				TutorSearchIndex.objects.filter(get_tutor_search_q(search)),
+				seed
+			)
+			return tutor_ids.count(), tutor_ids[:20]
+
+		print(f'Tutors: {number_of_tutors}, searches: {number_of_queries}')
+		for name, get_first_page in (
+			('Multi-column sort', get_multi_column_sort_first_page),
+			('Ranking score index', get_ranking_index_first_page),
+			('Shuffled ranking score segments', get_shuffled_ranking_first_page)
+		):
+			mean, p95 = run(get_first_page)
+			print(f'{name}: mean {mean:.2f} ms, p95 {p95:.2f} ms')
+
+		transaction.set_rollback(True)
+
+
+def check_ops_lookup_indexes():
+	'''
+	CHECKS WITH EXPLAIN THAT THE OPS USER FILTER LOOKUPS CAN USE THEIR
+	INDEXES. SEQUENTIAL SCANS ARE DISABLED FOR THE CHECK, SO THAT SMALL
+	TABLES DO NOT HIDE A MISSING INDEX. RAISES AN ASSERTION ERROR LISTING THE
+	LOOKUPS THAT DO NOT USE THEIR INDEX.
+	'''
+	from .search import get_tutor_text_search_q
+
+	checks = []
+	for model, prefix in (
+		(Parent, 'parent'), (Student, 'student'), (Tutor, 'tutor')
+	):
+		checks += [
+			(
+				f'{prefix} full name',
+				model.objects.filter(full_name__ilike_contains='rahman'),
+				[f'{prefix}_full_name_trgm']
+			),
+			(
+				f'{prefix} phone number prefix',
+				model.objects.filter(phone_number__startswith='01712'),
+				[f'{prefix}_phone_number_like']
+			)
+		]
+	checks += [
+		(
+			'academic background institution name',
+			AcademicBackground.objects.filter(
+				name_of_institution__ilike_contains='notre dame'
+			),
+			['academic_bg_institution_trgm']
+		),
+		(
+			'tutor text query',
+			Tutor.objects.filter(get_tutor_text_search_q('rahman physics')),
+			['tutor_search_vector_gin', 'tutor_full_name_trgm']
+		)
+	]
+
+	failures = []
+	with transaction.atomic():
+		with connection.cursor() as cursor:
+			cursor.execute('SET LOCAL enable_seqscan = off')
+		for name, queryset, index_names in checks:
+			plan = queryset.order_by().explain()
+			missing_index_names = [
+				index_name for index_name in index_names
+				if index_name not in plan
+			]
+			print(f'{name}: {"FAIL" if missing_index_names else "OK"}')
+			if missing_index_names:
+				failures.append(f'{name} ({", ".join(missing_index_names)})')
+				print(plan)
+		transaction.set_rollback(True)
+
+	assert not failures, f'Lookups not using their index: {", ".join(failures)}'
+
+
+def check_job_quota_concurrency(tutor_id, job_type='direct_requests',
+	number_of_requests=50):
+	'''
+	RESERVES JOBS FOR A TUTOR FROM MANY THREADS AT ONCE, AND CHECKS THAT THE
+	NUMBER OF RESERVED JOBS IS EXACTLY WHAT THE DAILY AND MONTHLY LIMITS
+	ALLOW. THE QUOTA ROWS OF THE TUTOR ARE RESTORED AT THE END.
+	'''
+	import threading
+
+	from django.db import close_old_connections
+	from .quotas import reserve_job
+
+	tutor = Tutor.objects.get(id=tutor_id)
+	quotas = list(TutorJobQuota.objects.filter(tutor=tutor))
+	TutorJobQuota.objects.filter(tutor=tutor).delete()
+
+	jobs_limit = get_jobs_limit(tutor.get_account_type())
+	expected = min(
+		jobs_limit[f'daily_{job_type}'], jobs_limit[f'monthly_{job_type}']
+	)
+	results = []
+	start = threading.Barrier(number_of_requests)
+
+	def request():
+		try:
+			start.wait()
+			with transaction.atomic():
+				results.append(reserve_job(tutor, job_type))
+		finally:
+			close_old_connections()
+
+	try:
+		threads = [
+			threading.Thread(target=request)
+			for i in range(number_of_requests)
+		]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+
+		reserved = results.count(None)
+		numbers_of_jobs = TutorJobQuota.get_numbers_of_jobs(tutor.id)
+		print(f'Requests: {number_of_requests}, reserved: {reserved}, '
+			f'expected: {expected}, counts: {numbers_of_jobs}')
+		assert reserved == expected
+		assert numbers_of_jobs[f'daily_{job_type}'] == expected
+		assert numbers_of_jobs[f'monthly_{job_type}'] == expected
+		assert len(results) == number_of_requests
+	finally:
+		with transaction.atomic():
+			TutorJobQuota.objects.filter(tutor=tutor).delete()
+			TutorJobQuota.objects.bulk_create(quotas)
+
+
+def check_tuition_request_transition_concurrency(tuition_request_id,
+	transition='tutor-confirm', number_of_requests=20):
+	'''
+	APPLIES THE SAME TRANSITION TO A TUITION REQUEST FROM MANY THREADS AT
+	ONCE, AND CHECKS THAT EXACTLY ONE OF THEM CHANGES IT. THE SIDE EFFECTS
+	ARE NOT RUN, AND THE TUITION REQUEST IS RESTORED AT THE END.
+	'''
+	import threading
+
+	from django.db import close_old_connections
+	from .transitions import (
+		JobTransitionEffects, transition_tuition_requests,
+		TUITION_REQUEST_TRANSITIONS
+	)
+
+	tuition_request = TuitionRequest.objects.get(id=tuition_request_id)
+	assert tuition_request.status in TUITION_REQUEST_TRANSITIONS[transition]
+
+	results = []
+	start = threading.Barrier(number_of_requests)
+
+	def request():
+		try:
+			start.wait()
+			with transaction.atomic():
+				results.append(transition_tuition_requests(
+					TuitionRequest.objects.filter(id=tuition_request.id),
+					transition, JobTransitionEffects(), tuition_request.version
+				))
+		finally:
+			close_old_connections()
+
+	try:
+		threads = [
+			threading.Thread(target=request)
+			for i in range(number_of_requests)
+		]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+
+		changed = [rows for rows in results if rows]
+		changed_tuition_request = TuitionRequest.objects.get(
+			id=tuition_request.id
+		)
+		print(f'Requests: {number_of_requests}, changed: {len(changed)}, '
+			f'status: {changed_tuition_request.status}, '
+			f'version: {changed_tuition_request.version}')
+		assert len(changed) == 1
+		assert changed_tuition_request.version == tuition_request.version + 1
+		assert changed_tuition_request.status == TUITION_REQUEST_TRANSITIONS[
+			transition][tuition_request.status]
+	finally:
+		TuitionRequest.objects.filter(id=tuition_request.id).update(
+			status=tuition_request.status,
+			confirmation_date=tuition_request.confirmation_date,
+			version=tuition_request.version
+		)
+
+
+def check_endpoint_query_counts(tuition_request_id, ops_account_id):
+	'''
+	REQUESTS THE DETAILS ENDPOINTS OF A TUITION REQUEST, ITS PARENT RFT, ITS
+	TUTOR AND ITS REVIEW, AND CHECKS THAT EVERY ENDPOINT STAYS WITHIN ITS
+	NUMBER OF QUERIES, AND THAT UNKNOWN UUIDS GET A 404 IN ONE QUERY. EVERY
+	ENDPOINT IS REQUESTED ONCE BEFORE COUNTING, SO THAT THE USER CACHES ARE
+	WARM.
+	'''
+	import uuid
+
+	from django.test import Client
+	from django.test.utils import CaptureQueriesContext
+	from .env_variables_manager import get_main_api_key
+
+	tuition_request = TuitionRequest.objects.select_related(
+		'parent', 'tutor', 'parent_rft', 'review'
+	).get(id=tuition_request_id)
+	parent = tuition_request.parent
+	tutor = tuition_request.tutor
+	account = Account.objects.get(id=ops_account_id)
+	client = Client()
+
+	# (user, url, maximum number of queries)
+	endpoints = [
+		(parent, f'/api/parent-tuition-request-details/'
+			f'{tuition_request.uuid}/', 2),
+		(tutor, f'/api/tutor-tuition-request-details/'
+			f'{tuition_request.uuid}/', 2),
+		(account, f'/api/ops-tuition-request-details/'
+			f'{tuition_request.uuid}/', 2),
+		(account, f'/api/ops-tutor-transaction-list/{tutor.uuid}/', 2),
+		(account, f'/api/ops-parent-sms-log-list/{parent.uuid}/', 2),
+		(account, f'/api/ops-tutor-sms-log-list/{tutor.uuid}/', 2)
+	]
+	if tuition_request.parent_rft:
+		rft = tuition_request.parent_rft
+		endpoints += [
+			(parent, f'/api/rft-details/{rft.uuid}/', 2),
+			(account, f'/api/ops-rft-details/{rft.uuid}/', 2),
+			(parent, f'/api/parent-hot-jobs-list-from-rft/{rft.uuid}/', 4),
+			(account, f'/api/ops-hot-jobs-list-from-rft/{rft.uuid}/', 4)
+		]
+	if tuition_request.review:
+		review = tuition_request.review
+		endpoints += [
+			(parent, f'/api/parent-review-details/{review.uuid}/', 1),
+			(tutor, f'/api/tutor-review-details/{review.uuid}/', 1),
+			(account, f'/api/ops-review-details/{review.uuid}/', 1)
+		]
+
+	def request(user, url):
+		return client.get(
+			url, secure=True, HTTP_X_API_KEY=get_main_api_key(),
+			HTTP_AUTH_JWT=user.get_auth_jwt()
+		)
+
+	unknown_uuid = str(uuid.uuid4())
+	for user, url, max_number_of_queries in endpoints:
+		for expected_status, endpoint_url, max_queries in (
+			(200, url, max_number_of_queries),
+			(404, url.rsplit('/', 2)[0] + f'/{unknown_uuid}/', 1)
+		):
+			request(user, endpoint_url)
+			with CaptureQueriesContext(connection) as context:
+				response = request(user, endpoint_url)
+			number_of_queries = len(context.captured_queries)
+			print(f'{endpoint_url}: {response.status_code}, '
+				f'queries: {number_of_queries}, maximum: {max_queries}')
+			assert response.status_code == expected_status
+			assert number_of_queries <= max_queries
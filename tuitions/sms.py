@@ -0,0 +1,83 @@
+import itertools
+import requests
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+
+from .env_variables_manager import get_bd_sms_sender_password
+
+
+# Constants
+
+SSL_WIRELESS_URL = 'http://sms.sslwireless.com/pushapi/dynamic/server.php'
+SSL_WIRELESS_BATCH_SIZE = 100 # Messages per submission
+SMS_CONNECTION_POOL_SIZE = 10
+SMS_REQUEST_TIMEOUT = (5, 30) # Seconds, (connect, read)
+
+
+# Transports
+
+class SSLWirelessTransport(object):
+	"""Sends SMSs through the SSL Wireless push API.
+
+	Notes:
+		- One session is shared by every thread, so the keep-alive
+		connections to the gateway are pooled and reused.
+		- The API takes an indexed sms[i][...] array, so the messages are
+		submitted in batches of up to batch_size messages per request.
+		- A submission that fails raises an exception for the whole batch.
+	"""
+	def __init__(self, url, user, sid, batch_size, pool_size, timeout):
+		self.url = url
+		self.user = user
+		self.sid = sid
+		self.batch_size = batch_size
+		self.timeout = timeout
+		self.submissions = 0
+		self.messages_sent = 0
+		self._csms_ids = itertools.count(int(time.time() * 1000))
+		self._lock = threading.Lock()
+
+		adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+		self.session = requests.Session()
+		self.session.mount('http://', adapter)
+		self.session.mount('https://', adapter)
+
+	def get_csms_id(self):
+		"""Returns a unique client side ID for a message."""
+		with self._lock:
+			return next(self._csms_ids)
+
+	def send_many(self, messages):
+		"""Sends a list of (phone number, message) pairs."""
+		for i in range(0, len(messages), self.batch_size):
+			self.submit(messages[i:i + self.batch_size])
+
+	def submit(self, messages):
+		data = {
+			'user': self.user,
+			'pass': get_bd_sms_sender_password(),
+			'sid': self.sid
+		}
+		for i, (phone_number, message) in enumerate(messages):
+			data[f'sms[{i}][0]'] = phone_number
+			data[f'sms[{i}][1]'] = message
+			data[f'sms[{i}][2]'] = self.get_csms_id()
+
+		response = self.session.post(self.url, data=data, timeout=self.timeout)
+		response.raise_for_status()
+
+		with self._lock:
+			self.submissions += 1
+			self.messages_sent += len(messages)
+
+
+ssl_wireless_transport = SSLWirelessTransport(
+	SSL_WIRELESS_URL,
+	'Yoda',
+	'Yoda',
+	SSL_WIRELESS_BATCH_SIZE,
+	SMS_CONNECTION_POOL_SIZE,
+	SMS_REQUEST_TIMEOUT
+)
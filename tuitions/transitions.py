@@ -0,0 +1,261 @@
+import arrow
+
+from django.db import connections, models, transaction
+from django.db.models import Case, F, Value, When
+from django.db.models.sql import UpdateQuery
+from rest_framework import status
+
+from .caches import invalidate_principal
+from .models import Notification, Parent, RequestForTutor, Tutor
+
+
+# Constants
+
+# New status of a tuition request, by transition and current status
+TUITION_REQUEST_TRANSITIONS = {
+	'tutor-confirm': {
+		'in-process': 'waiting-for-parent',
+		'waiting-for-tutor': 'confirmed'
+	},
+	'parent-confirm': {
+		'in-process': 'waiting-for-tutor',
+		'waiting-for-parent': 'confirmed'
+	}
+}
+
+# User getting the extra notifications of a transition, by transition
+TUITION_REQUEST_TRANSITION_NOTIFIED_USERS = {
+	'tutor-confirm': 'parent',
+	'parent-confirm': 'tutor'
+}
+
+# Fields returned by the transitions of the jobs
+JOB_TRANSITION_RETURNING = ('id', 'uuid', 'parent', 'version', 'updated_at')
+TUITION_REQUEST_TRANSITION_RETURNING = JOB_TRANSITION_RETURNING + (
+	'status', 'confirmation_date', 'tutor', 'parent_rft'
+)
+
+# (detail, status) of a job changed since its version was read
+JOB_CHANGED_ERROR = (
+	'This job has been changed. Please reload it and try again.',
+	status.HTTP_409_CONFLICT
+)
+
+
+# Methods
+
+def get_job_version(data):
+	"""Returns the version of a job sent by the app, or None."""
+	version = data.get('version')
+	if isinstance(version, int) and not isinstance(version, bool):
+		return version
+	return None
+
+
+def is_job_changed(queryset, version):
+	"""Returns whether a transition of the jobs of the queryset, which has
+	not changed any job, failed because the version has changed.
+	"""
+	return version is not None and queryset.exists()
+
+
+def update_returning(queryset, values, returning):
+	"""Updates the rows of the queryset with one UPDATE ... RETURNING, and
+	returns the (attname: value) dicts of the returned fields of the rows.
+
+	Notes:
+		- The queryset must filter related models with subqueries, eg:
+		parent__in=Parent.objects.filter(...), instead of joins. The ORM moves
+		every filter of a joined update into an id IN (SELECT ...), and
+		Postgres does not recheck those filters against rows changed by a
+		concurrent transaction.
+		- The returned values go through the converters of the backend and of
+		the fields, like values loaded by the ORM.
+	"""
+	if queryset.query.count_active_tables() > 1:
+		raise ValueError(
+			'Related models must be filtered with subqueries, not joins.'
+		)
+
+	connection = connections[queryset.db]
+	query = queryset.query.chain(UpdateQuery)
+	query.add_update_values(values)
+	# Clearing the annotations, so that they are not in the subqueries
+	query._annotations = None
+	sql, params = query.get_compiler(queryset.db).as_sql()
+
+	table = queryset.model._meta.db_table
+	fields = [queryset.model._meta.get_field(name) for name in returning]
+	columns = [field.get_col(table) for field in fields]
+	converters = [
+		connection.ops.get_db_converters(column) +
+		field.get_db_converters(connection)
+		for field, column in zip(fields, columns)
+	]
+	returning_sql = ', '.join(
+		connection.ops.quote_name(field.column) for field in fields
+	)
+
+	with transaction.mark_for_rollback_on_error(using=queryset.db):
+		with connection.cursor() as cursor:
+			cursor.execute(f'{sql} RETURNING {returning_sql}', params)
+			results = cursor.fetchall()
+
+	rows = []
+	for result in results:
+		row = {}
+		for field, column, field_converters, value in zip(
+			fields, columns, converters, result
+		):
+			for converter in field_converters:
+				value = converter(value, column, connection)
+			row[field.attname] = value
+		rows.append(row)
+	return rows
+
+
+def transition_jobs(queryset, values, version=None,
+	returning=JOB_TRANSITION_RETURNING):
+	"""Applies a transition to the request for tutors or tuition requests of
+	the queryset with one conditional UPDATE, and returns the changed rows.
+
+	Notes:
+		- The queryset must only match the jobs the transition is allowed
+		from, so that a concurrent transition of a job makes the UPDATE skip
+		it, instead of overwriting it.
+		- Every transition increments the version of the job. If a version is
+		given, jobs changed since that version are skipped.
+	"""
+	if version is not None:
+		queryset = queryset.filter(version=version)
+
+	return update_returning(queryset, {
+		**values,
+		'version': F('version') + 1,
+		'updated_at': arrow.utcnow().datetime
+	}, returning)
+
+
+def transition_tuition_requests(queryset, transition, effects, version=None,
+	values=None):
+	"""Applies a status transition (a key of TUITION_REQUEST_TRANSITIONS) to
+	the tuition requests of the queryset with one conditional
+	UPDATE ... WHERE status IN (...) RETURNING, and collects its side effects
+	in effects (a JobTransitionEffects).
+	"""
+	statuses = TUITION_REQUEST_TRANSITIONS[transition]
+	now = arrow.utcnow().datetime
+	confirmed_from = [
+		current_status for current_status, new_status in statuses.items()
+		if new_status == 'confirmed'
+	]
+
+	rows = transition_jobs(queryset.filter(status__in=list(statuses)), {
+		'status': Case(
+			*[
+				When(status=current_status, then=Value(new_status))
+				for current_status, new_status in statuses.items()
+			],
+			output_field=models.CharField()
+		),
+		'confirmation_date': Case(
+			When(status__in=confirmed_from, then=Value(now)),
+			default=F('confirmation_date'),
+			output_field=models.DateTimeField()
+		),
+		**(values or {})
+	}, version, TUITION_REQUEST_TRANSITION_RETURNING)
+
+	for row in rows:
+		effects.add_tuition_request_transition(transition, row, now)
+	return rows
+
+
+# Side effects
+
+class JobTransitionEffects:
+	"""Collects the side effects of job transitions, and runs them in batch
+	once the transaction of the transitions has been committed.
+
+	Notes:
+		- Notifications are created with one query for all of the
+		transitions, and parents and request for tutors are updated with one
+		query each.
+		- The effects only run for the transitions which have been committed,
+		so a rolled back transition does not notify anyone.
+	"""
+	def __init__(self):
+		self.notifications = []
+		self.confirmed_at = None
+		self.confirmed_parent_ids = set()
+		self.confirmed_rft_ids = set()
+
+	def add_tuition_request_transition(self, transition, row, now):
+		notified_user = TUITION_REQUEST_TRANSITION_NOTIFIED_USERS[transition]
+		for created_for in ('parent', 'tutor'):
+			self.notifications.append((
+				row['status'], created_for, row[f'{created_for}_id'],
+				created_for == notified_user, row['uuid']
+			))
+
+		if row['status'] == 'confirmed':
+			self.confirmed_at = now
+			self.confirmed_parent_ids.add(row['parent_id'])
+			if row['parent_rft_id']:
+				self.confirmed_rft_ids.add(row['parent_rft_id'])
+
+	def run_on_commit(self):
+		transaction.on_commit(self.run)
+
+	def run(self):
+		if not self.notifications:
+			return
+
+		# Parents and tutors of the transitions
+		users = {
+			'parent': Parent.objects.in_bulk({
+				user_id for notification_type, created_for, user_id,
+				create_extra_notifications, tuition_request_uuid
+				in self.notifications if created_for == 'parent'
+			}),
+			'tutor': Tutor.objects.in_bulk({
+				user_id for notification_type, created_for, user_id,
+				create_extra_notifications, tuition_request_uuid
+				in self.notifications if created_for == 'tutor'
+			})
+		}
+
+		with transaction.atomic():
+			# Updating the confirmed parents, and dropping them from the
+			# principal cache
+			if self.confirmed_parent_ids:
+				Parent.objects.filter(
+					id__in=self.confirmed_parent_ids
+				).update(last_confirmed_job_at=self.confirmed_at)
+				for parent_id in self.confirmed_parent_ids:
+					users['parent'][parent_id].last_confirmed_job_at = (
+						self.confirmed_at
+					)
+					invalidate_principal(Parent, users['parent'][parent_id])
+
+			# Confirming the parent RFTs
+			if self.confirmed_rft_ids:
+				RequestForTutor.objects.filter(
+					id__in=self.confirmed_rft_ids, is_confirmed=False
+				).update(
+					is_confirmed=True,
+					confirmation_date=self.confirmed_at,
+					version=F('version') + 1,
+					updated_at=self.confirmed_at
+				)
+
+			# Notifications for parents and tutors
+			Notification.create_many([
+				Notification.build(
+					notification_type, users[created_for][user_id],
+					create_extra_notifications,
+					tuition_request_uuid=tuition_request_uuid
+				) for notification_type, created_for, user_id,
+				create_extra_notifications, tuition_request_uuid
+				in self.notifications
+			])
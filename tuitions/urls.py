@@ -71,6 +71,9 @@ urlpatterns = [
 	url(r'^parent-read-notification/(?P<notification_id>[0-9]+)/$', views.ParentReadNotification.as_view()),
 	url(r'^student-read-notification/(?P<notification_id>[0-9]+)/$', views.StudentReadNotification.as_view()),
 	url(r'^tutor-read-notification/(?P<notification_id>[0-9]+)/$', views.TutorReadNotification.as_view()),
+	url(r'^parent-read-all-notifications/$', views.ParentReadAllNotifications.as_view()),
+	url(r'^student-read-all-notifications/$', views.StudentReadAllNotifications.as_view()),
+	url(r'^tutor-read-all-notifications/$', views.TutorReadAllNotifications.as_view()),
 
 	# Transaction URLs
 	url(r'^parent-transaction-list/$', views.ParentTransactionList.as_view()),
@@ -163,6 +166,12 @@ urlpatterns = [
 	url(r'^ops-student-sms-log-list/(?P<user_uuid>'+uuid_regex_pattern+r')/$', views.OpsStudentSMSLogList.as_view()),
 	url(r'^ops-tutor-sms-log-list/(?P<user_uuid>'+uuid_regex_pattern+r')/$', views.OpsTutorSMSLogList.as_view()),
 
+	# Ops notification delivery metrics URL
+	url(r'^ops-notification-delivery-metrics/$', views.OpsNotificationDeliveryMetrics.as_view()),
+
+	# Ops tutor filter cache stats URL
+	url(r'^ops-tutor-filter-cache-stats/$', views.OpsTutorFilterCacheStats.as_view()),
+
 	# Tutor slug to UUID
 	url(r'^tutor-slug-to-uuid/(?P<tutor_slug>[0-9a-zA-Z-]+)/$', views.TutorSlugToUUID.as_view()),
 
@@ -18,11 +18,33 @@ from rest_framework.views import APIView
 from six import string_types
 from urllib.parse import urlparse
 
+from .caches import tutor_card_cache, tutor_filter_result_cache
+from .delivery import notification_delivery_engine
 from .env_variables_manager import get_auth_jwt_secret, get_bkash_credentials
+from .fetching import (
+	fetch, fetch_or_404, ID_LOAD_PLAN, NOTIFICATION_READ_STATUS_LOAD_PLAN,
+	OPS_REQUEST_FOR_TUTOR_LOAD_PLAN, REQUEST_FOR_TUTOR_LOAD_PLAN,
+	REVIEW_LOAD_PLAN, SMS_RECIPIENT_LOAD_PLAN, TUITION_REQUEST_LOAD_PLAN,
+	TUITION_REQUEST_USERS_LOAD_PLAN, USER_UUID_LOAD_PLAN
+)
 from .helpers import *
 from .models import *
+from .otp import otp_dispatcher
+from .pagination import KeysetPagination
 from .permissions import *
+from .quotas import reserve_job
+from .search import (
+	CachedTutorIds, get_area_bands, get_ranked_tutor_ids,
+	get_text_search_query, get_tutor_filter_cache_key,
+	get_tutor_public_cards, get_tutor_search_bands, get_tutor_search_facets,
+	get_tutor_search_q, get_tutor_search_seed, get_tutor_text_search_q,
+	get_tutor_text_search_rank, ShuffledTutorIds, tutor_search_engine
+)
 from .serializers import *
+from .transitions import (
+	get_job_version, is_job_changed, JOB_CHANGED_ERROR, JobTransitionEffects,
+	transition_jobs, transition_tuition_requests, TUITION_REQUEST_TRANSITIONS
+)
 
 
 # Methods
@@ -105,12 +127,17 @@ class UserSignUp(APIView):
 				status=status.HTTP_400_BAD_REQUEST
 			)
 
+		# Check if too many OTPs have been sent to the phone number
+		if otp_dispatcher.is_rate_limited(request.data['phone_number']):
+			return Response({
+				'detail': 'Too many OTPs requested. Please try again later.'
+			}, status=status.HTTP_429_TOO_MANY_REQUESTS)
+
 		# Make sure no other verified user with the same phone number exists
-		if self.get_model_class().objects.filter(
-			phone_number=request.data['phone_number']).exists():
-			obj = self.get_model_class().objects.get(
-				phone_number=request.data['phone_number']
-			)
+		obj = fetch(
+			self.get_model_class(), phone_number=request.data['phone_number']
+		)
+		if obj is not None:
 			if obj.is_phone_number_verified:
 				return Response({
 					'phone_number':
@@ -120,6 +147,7 @@ class UserSignUp(APIView):
 				obj.full_name = request.data['full_name']
 				obj.set_otp()
 				obj.save()
+				obj.send_otp()
 				return Response({
 					'detail': 'Confirm sign up by signing in using the OTP.',
 					'phone_number': request.data['phone_number']
@@ -193,13 +221,18 @@ class UserLoginSetOTP(APIView):
 				status=status.HTTP_400_BAD_REQUEST
 			)
 
+		# Check if too many OTPs have been sent to the phone number
+		if otp_dispatcher.is_rate_limited(request.data['phone_number']):
+			return Response({
+				'detail': 'Too many OTPs requested. Please try again later.'
+			}, status=status.HTTP_429_TOO_MANY_REQUESTS)
+
 		# Check if the user exists or not
-		if self.get_model_class().objects.filter(
-			phone_number=request.data['phone_number']).exists():
+		obj = fetch(
+			self.get_model_class(), phone_number=request.data['phone_number']
+		)
+		if obj is not None:
 			# User exists, so set OTP and send success response
-			obj = self.get_model_class().objects.get(
-				phone_number=request.data['phone_number']
-			)
 
 			# Check if suspended
 			if obj.is_suspended_by_ops:
@@ -224,9 +257,10 @@ class UserLoginSetOTP(APIView):
 					'phone_number': request.data['phone_number']
 				}, status=status.HTTP_200_OK)
 
-			# Set OTP, save, and return response
+			# Set OTP, save, queue the SMS, and return response
 			obj.set_otp()
 			obj.save()
+			obj.send_otp()
 			return Response({
 				'detail':
 				'Success! Sign in using the OTP sent to your number.',
@@ -266,9 +300,7 @@ class UserLoginConfirmOTP(APIView):
 		)
 
 	def get_obj(self, phone_number):
-		return self.get_model_class().objects.get(
-			phone_number=phone_number
-		)
+		return fetch(self.get_model_class(), phone_number=phone_number)
 
 	def get_user_details_serializer_class(self):
 		raise NotImplementedError(
@@ -310,10 +342,9 @@ class UserLoginConfirmOTP(APIView):
 			)
 
 		# Check if the user exists or not
-		if self.get_model_class().objects.filter(
-			phone_number=request.data['phone_number']).exists():
+		obj = self.get_obj(request.data['phone_number'])
+		if obj is not None:
 			# User exists, so check OTP
-			obj = self.get_obj(request.data['phone_number'])
 			if obj.otp == request.data['otp']:
 				# OTP matched, check if it has expired or not
 				if obj.otp_expiry_timestamp < arrow.utcnow().timestamp:
@@ -383,7 +414,7 @@ class TutorLoginConfirmOTP(UserLoginConfirmOTP):
 # User details views
 
 class UserDetails(APIView):
-	permission_classes = (UserPermissionTutorSelectRelated,)
+	permission_classes = (UserPermission,)
 
 	def get_serializer_class(self):
 		raise NotImplementedError(
@@ -425,6 +456,8 @@ class StudentDetails(UserDetails):
 
 
 class TutorDetails(UserDetails):
+	user_load_plan = TUTOR_ACADEMIC_BACKGROUNDS_LOAD_PLAN
+
 	def get_serializer_class(self):
 		return TutorDetailsSerializer
 
@@ -437,7 +470,7 @@ class TutorDetails(UserDetails):
 # Tutor profile views
 
 class TutorProfile(APIView):
-	permission_classes = (UserPermissionTutorSelectRelated,)
+	permission_classes = (UserPermission,)
 
 	def get_serializer_class(self):
 		raise NotImplementedError(
@@ -475,6 +508,8 @@ class TutorProfile(APIView):
 
 
 class TutorPersonalInformation(TutorProfile):
+	user_load_plan = TUTOR_ACADEMIC_BACKGROUNDS_LOAD_PLAN
+
 	def get_serializer_class(self):
 		return TutorPersonalInformationSerializer
 
@@ -483,6 +518,8 @@ class TutorPersonalInformation(TutorProfile):
 
 
 class TutorTeachingPreferences(TutorProfile):
+	user_load_plan = TUTOR_TEACHING_PREFERENCES_LOAD_PLAN
+
 	def get_serializer_class(self):
 		return TutorTeachingPreferencesSerializer
 
@@ -541,7 +578,8 @@ class TutorTeachingPreferences(TutorProfile):
 
 
 class TutorAcademicBackground(APIView):
-	permission_classes = (UserPermissionTutorSelectRelated,)
+	permission_classes = (UserPermission,)
+	user_load_plan = TUTOR_ACADEMIC_BACKGROUNDS_LOAD_PLAN
 
 	def get(self, request, format=None):
 		tutor = self.user
@@ -669,79 +707,147 @@ class TutorFilter(APIView, PageNumberPagination):
 	max_page_size = 20
 	permission_classes = (CorrectAPIKeyPermission,)
 
+	def get_facets(self, search):
+		"""Returns the cached facet counts of the search, or counts them with
+		the in-memory search engine or else SQL.
+		"""
+		cache_key = get_tutor_filter_cache_key(search, 'facets')
+		facets = tutor_filter_result_cache.get(cache_key)
+		if facets is None:
+			generation = tutor_filter_result_cache.generation
+			facets = tutor_search_engine.get_facets(search)
+			if facets is None:
+				facets = get_tutor_search_facets(search)
+			tutor_filter_result_cache.set(
+				cache_key,
+				facets,
+				generation=generation,
+				tags=(search['country'],)
+			)
+		return facets
+
 	def post(self, request, country, format=None):
 		# Init serializer
 		filter_serializer = TutorFilterSerializer(data=request.data)
 
 		if filter_serializer.is_valid():
-			filters = models.Q()
-
-			# Add the country filter (required from URL) and checks
-			filters &= models.Q(
-				country=Country(country),
-				is_suspended_by_ops=False,
-				is_deleted=False,
-				is_verified_by_ops=True
-			)
+			# Add the country filter (required from URL). The search index
+			# only has the verified, not suspended, and not deleted tutors.
+			search = {'country': Country(country).code}
 
 			# Adding the extra filters
 			if request.data.get('gender', ''):
-				filters &= models.Q(gender=request.data['gender'],)
+				search['gender'] = request.data['gender']
 
 			if request.data.get('academic_medium', ''):
-				filters &= models.Q(
-					academic_medium=request.data['academic_medium'],
-				)
+				search['academic_medium'] = request.data['academic_medium']
 
 			if 'undergraduate_university' in request.data:
 				if isinstance(request.data['undergraduate_university'], int):
-					filters &= models.Q(
-						undergraduate_university=
-						request.data['undergraduate_university'],
-					)
+					search['undergraduate_university'] = request.data[
+						'undergraduate_university'
+					]
 
 			if request.data.get('salary_range_start', '') and request.data.get('salary_range_end', ''):
-				request.data['salary_range_start'] = decimal.Decimal(request.data['salary_range_start'])
-				request.data['salary_range_end'] = decimal.Decimal(request.data['salary_range_end'])
-				filters &= models.Q(
-					salary_range_start__gte=request.data['salary_range_start'],
-					salary_range_start__lte=request.data['salary_range_end'],
-					salary_range_end__gte=request.data['salary_range_start'],
-					salary_range_end__lte=request.data['salary_range_end'],
+				search['salary_range'] = (
+					decimal.Decimal(request.data['salary_range_start']),
+					decimal.Decimal(request.data['salary_range_end'])
 				)
 
 			if request.data.get('offline_preferred_teaching_areas', []):
-				filters &= models.Q(
-					offline_preferred_teaching_areas_arr__contains=
-					request.data['offline_preferred_teaching_areas'],
-				)
+				search['areas'] = request.data[
+					'offline_preferred_teaching_areas'
+				]
+
+				# Within N km of the areas, nearest first
+				if 'within_km' in request.data:
+					within_km = request.data['within_km']
+					if (isinstance(within_km, bool) or
+						not isinstance(within_km, (int, float)) or
+						within_km <= 0):
+						return Response({
+							'within_km': ['A valid positive number is required.']
+						}, status=status.HTTP_400_BAD_REQUEST)
+					search['area_bands'] = get_area_bands(
+						search.pop('areas'), within_km
+					)
 
 			if request.data.get('offline_preferred_teaching_subjects', []):
-				filters &= models.Q(
-					offline_preferred_teaching_subjects_arr__overlap=
-					request.data['offline_preferred_teaching_subjects'],
-				)
+				search['subjects'] = request.data[
+					'offline_preferred_teaching_subjects'
+				]
+
+			# Text query over the names, about texts, and institutions
+			try:
+				text = get_text_search_query(request.data)
+			except ValueError as e:
+				return Response({
+					'q': [str(e)]
+				}, status=status.HTTP_400_BAD_REQUEST)
+			if text:
+				search['q'] = text
 
-			# Getting the queryset
-			if request.data.get('random_ordering', []):
-				tutors = Tutor.objects.select_related(
-					'undergraduate_university_academic_bg',
-					'school_academic_bg', 'college_academic_bg',
-					'undergraduate_university'
-				).filter(filters).order_by(
-					'undergraduate_university__grade',
-					*request.data['random_ordering']
-				).distinct()
-			else:
+			# Getting the shuffle seed of the session
+			seed = get_tutor_search_seed(request.data)
+			if seed is None:
 				return Response({
-					'random_ordering': ['This field is required.']
+					'seed': ['This field is required.']
 				}, status=status.HTTP_400_BAD_REQUEST)
 
-			# Init paginated serializer and return
-			paginated_serializer = TutorPublicSerializer(
-				self.paginate_queryset(tutors, self.request), many=True
+			# Getting the page of tutor IDs from the result cache
+			cache_key = get_tutor_filter_cache_key(
+				search,
+				seed,
+				request.query_params.get(self.page_query_param, 1),
+				self.page_size
 			)
-			return self.get_paginated_response(paginated_serializer.data)
+			cached_page = tutor_filter_result_cache.get(cache_key)
+			if cached_page is not None:
+				page_tutor_ids = self.paginate_queryset(
+					CachedTutorIds(*cached_page), self.request
+				)
+			else:
+				generation = tutor_filter_result_cache.generation
+
+				# Getting the ordered tutor IDs from the in-memory search
+				# engine, or from the search index table if the engine is not
+				# ready. Text queries are ordered by relevance instead.
+				if search.get('q'):
+					tutor_ids = get_ranked_tutor_ids(search)
+				else:
+					tutor_ids = tutor_search_engine.search(search, seed)
+				if tutor_ids is None:
+					tutor_ids = ShuffledTutorIds(
+						TutorSearchIndex.objects.filter(
+							get_tutor_search_q(search)
+						),
+						seed,
+						get_tutor_search_bands(search)
+					)
+
+				page_tutor_ids = self.paginate_queryset(
+					tutor_ids, self.request
+				)
+				tutor_filter_result_cache.set(
+					cache_key,
+					(
+						self.page.paginator.count,
+						self.page.start_index() - 1,
+						page_tutor_ids
+					),
+					generation=generation,
+					tags=(search['country'],)
+				)
+
+			# Init paginated serializer
+			response = self.get_paginated_response(
+				get_tutor_public_cards(page_tutor_ids)
+			)
+
+			# Adding the facet counts of the search if asked for
+			if request.data.get('facets', False):
+				response.data['facets'] = self.get_facets(search)
+			return response
 
 		return Response(
 			filter_serializer.errors, status=status.HTTP_400_BAD_REQUEST
@@ -754,32 +860,19 @@ class TutorPublicDetails(APIView):
 	permission_classes = (CorrectAPIKeyPermission,)
 
 	def get(self, request, tutor_uuid, format=None):
-		# Only return if the tutor is verified, not suspended, and has not
-		# deleted their profile.
-		if Tutor.objects.filter(
-				uuid=uuid.UUID(tutor_uuid),
-				is_verified_by_ops=True,
-				is_suspended_by_ops=False,
-				is_deleted=False
-			).exists():
-			tutor = Tutor.objects.select_related(
-				'undergraduate_university_academic_bg', 'school_academic_bg',
-				'college_academic_bg'
-			).get(
-				uuid=uuid.UUID(tutor_uuid),
-				is_verified_by_ops=True,
-				is_suspended_by_ops=False,
-				is_deleted=False
-			)
-		else:
+		# Only the verified, not suspended, and not deleted tutors have a
+		# search index row, and so a public card
+		tutor_ids = TutorSearchIndex.objects.filter(
+			tutor__uuid=uuid.UUID(tutor_uuid)
+		).values_list('tutor_id', flat=True)
+		public_cards = get_tutor_public_cards(list(tutor_ids))
+		if not public_cards:
 			return Response({
 				'detail': 'Tutor not found.'
 			}, status=status.HTTP_404_NOT_FOUND)
 
-		serializer = TutorPublicSerializer(tutor)
-
 		return Response({
-			'tutor': serializer.data
+			'tutor': public_cards[0]
 		})
 
 
@@ -788,22 +881,13 @@ class TutorPublicAddView(APIView):
 
 	def post(self, request, tutor_uuid, format=None):
 		# Get tutor or 404
-		if Tutor.objects.filter(
-				uuid=uuid.UUID(tutor_uuid),
-				is_verified_by_ops=True,
-				is_suspended_by_ops=False,
-				is_deleted=False
-			).exists():
-			tutor = Tutor.objects.get(
-				uuid=uuid.UUID(tutor_uuid),
-				is_verified_by_ops=True,
-				is_suspended_by_ops=False,
-				is_deleted=False
-			)
-		else:
-			return Response({
-				'detail': 'Tutor not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		tutor = fetch_or_404(
+			Tutor, detail='Tutor not found.',
+			uuid=uuid.UUID(tutor_uuid),
+			is_verified_by_ops=True,
+			is_suspended_by_ops=False,
+			is_deleted=False
+		)
 
 		tutor.number_of_public_profile_views += 1
 		tutor.save()
@@ -817,6 +901,7 @@ class TutorPublicAddView(APIView):
 
 class RequestForTutorCreate(APIView):
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
 	def post(self, request, format=None):
 		request.data['parent'] = self.user.id
@@ -830,10 +915,11 @@ class RequestForTutorCreate(APIView):
 		return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class RequestForTutorList(APIView, PageNumberPagination):
+class RequestForTutorList(APIView, KeysetPagination):
 	page_size = 10
 	max_page_size = 10
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
 	def get(self, request, format=None):
 		parent = self.user
@@ -854,25 +940,18 @@ class RequestForTutorList(APIView, PageNumberPagination):
 
 class RequestForTutorDetails(APIView):
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
 	def get(self, request, rft_uuid, format=None):
 		parent = self.user
 
 		# Getting the RFT
-		if RequestForTutor.objects.filter(
-			uuid=uuid.UUID(rft_uuid), parent=parent, is_rejected_by_ops=False
-		).exists():
-			request_for_tutor = RequestForTutor.objects.select_related(
-				'tuition_area', 'tutor_undergraduate_university'
-			).get(
-				uuid=uuid.UUID(rft_uuid),
-				parent=parent,
-				is_rejected_by_ops=False
-			)
-		else:
-			return Response({
-				'detail': 'RFT not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		request_for_tutor = fetch_or_404(
+			RequestForTutor, REQUEST_FOR_TUTOR_LOAD_PLAN, 'RFT not found.',
+			uuid=uuid.UUID(rft_uuid),
+			parent=parent,
+			is_rejected_by_ops=False
+		)
 
 		# Creating and returning the serializer data
 		serializer = RequestForTutorSerializer(request_for_tutor)
@@ -883,6 +962,7 @@ class RequestForTutorDetails(APIView):
 
 class DirectRequestCreate(APIView):
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
 	def post(self, request, tutor_uuid, format=None):
 		# Setting the parent
@@ -890,13 +970,10 @@ class DirectRequestCreate(APIView):
 		request.data['parent'] = parent.id
 
 		# Checking if tutor exists
-		if Tutor.objects.filter(uuid=uuid.UUID(tutor_uuid)).exists():
-			tutor = Tutor.objects.get(uuid=uuid.UUID(tutor_uuid))
-			request.data['tutor'] = tutor.id
-		else:
-			return Response({
-				'detail': 'Tutor not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		tutor = fetch_or_404(
+			Tutor, detail='Tutor not found.', uuid=uuid.UUID(tutor_uuid)
+		)
+		request.data['tutor'] = tutor.id
 
 		# Setting the status of the tuition request manually
 		request.data['status'] = 'direct-request'
@@ -908,21 +985,12 @@ class DirectRequestCreate(APIView):
 				with transaction.atomic():
 					serializer.validated_data['notification_created'] = True
 					serializer.save()
-					job_uuid = serializer.data['uuid']
-					Notification.objects.create(
-						notification_type='direct-request-create',
-						tutor=tutor,
-						created_for='tutor',
-						title='New direct request',
-						body=str(
-							'A parent has directly requested you to be the '
-							'potential tutor for their children!'
-						),
-						url=str(
-							f'https://app.yoda.com/tutor/job-details/{job_uuid}/'
-						),
-						create_extra_notifications=True
-					)
+					Notification.create_many([
+						Notification.build(
+							'direct-request-create', tutor, True,
+							tuition_request_uuid=serializer.data['uuid']
+						)
+					])
 			else:
 				# Simply saving the serializer otherwise
 				serializer.validated_data['notification_created'] = False
@@ -935,10 +1003,11 @@ class DirectRequestCreate(APIView):
 		return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class TuitionRequestList(APIView, PageNumberPagination):
+class TuitionRequestList(APIView, KeysetPagination):
 	page_size = 10
 	max_page_size = 10
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
 	def get_tuition_requests(self, status):
 		raise NotImplementedError(
@@ -992,25 +1061,20 @@ class TutorTuitionRequestList(TuitionRequestList):
 
 class TuitionRequestDetails(APIView):
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
-	def check_if_tuition_request_exists(self, tuition_request_uuid):
-		raise NotImplementedError(
-			'Please implement this method in the sub-class.'
-		)
-
-	def get_tuition_request(self, tuition_request_uuid):
+	def get_tuition_request_filters(self, tuition_request_uuid):
 		raise NotImplementedError(
 			'Please implement this method in the sub-class.'
 		)
 
 	def get(self, request, tuition_request_uuid, format=None):
 		# Getting the tuition request
-		if self.check_if_tuition_request_exists(tuition_request_uuid):
-			tuition_request = self.get_tuition_request(tuition_request_uuid)
-		else:
-			return Response({
-				'detail': 'Tuition request not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		tuition_request = fetch_or_404(
+			TuitionRequest, TUITION_REQUEST_LOAD_PLAN,
+			'Tuition request not found.',
+			**self.get_tuition_request_filters(tuition_request_uuid)
+		)
 
 		# Creating and returning the serializer data
 		serializer = TuitionRequestSerializer(tuition_request)
@@ -1020,109 +1084,39 @@ class TuitionRequestDetails(APIView):
 
 
 class ParentTuitionRequestDetails(TuitionRequestDetails):
-	def check_if_tuition_request_exists(self, tuition_request_uuid):
-		if TuitionRequest.objects.filter(
-			uuid=uuid.UUID(tuition_request_uuid), parent=self.user,
-			is_rejected_by_ops=False, is_rejected_by_tutor=False
-		).exists():
-			return True
-		else:
-			return False
-
-	def get_tuition_request(self, tuition_request_uuid):
-		return TuitionRequest.objects.select_related(
-			'parent', 'tutor__undergraduate_university', 'tuition_area', 'review'
-		).get(
-			uuid=uuid.UUID(tuition_request_uuid), parent=self.user,
-			is_rejected_by_ops=False, is_rejected_by_tutor=False
-		)
+	def get_tuition_request_filters(self, tuition_request_uuid):
+		return {
+			'uuid': uuid.UUID(tuition_request_uuid), 'parent': self.user,
+			'is_rejected_by_ops': False, 'is_rejected_by_tutor': False
+		}
 
 
 class TutorTuitionRequestDetails(TuitionRequestDetails):
-	def check_if_tuition_request_exists(self, tuition_request_uuid):
-		if TuitionRequest.objects.filter(
-			uuid=uuid.UUID(tuition_request_uuid), tutor=self.user,
-			is_rejected_by_tutor=False, is_rejected_by_ops=False,
-			parent__is_verified_by_ops=True,
-			parent__is_suspended_by_ops=False, parent__is_deleted=False
-		).exists():
-			return True
-		else:
-			return False
-
-	def get_tuition_request(self, tuition_request_uuid):
-		return TuitionRequest.objects.select_related(
-			'parent', 'tutor__undergraduate_university', 'tuition_area', 'review'
-		).get(
-			uuid=uuid.UUID(tuition_request_uuid), tutor=self.user,
-			is_rejected_by_ops=False
-		)
+	def get_tuition_request_filters(self, tuition_request_uuid):
+		return {
+			'uuid': uuid.UUID(tuition_request_uuid), 'tutor': self.user,
+			'is_rejected_by_tutor': False, 'is_rejected_by_ops': False,
+			'parent__is_verified_by_ops': True,
+			'parent__is_suspended_by_ops': False, 'parent__is_deleted': False
+		}
 
 
 class AcceptDirectRequest(APIView):
-	permission_classes = (UserPermissionTutorSelectRelated,)
+	permission_classes = (UserPermission,)
+	user_load_plan = TUTOR_ACADEMIC_BACKGROUNDS_LOAD_PLAN
 
 	def post(self, request, tuition_request_uuid, format=None):
 		tutor = self.user
 
 		# Getting the tuition request if it exists, 404 otherwise
-		if TuitionRequest.objects.filter(
+		tuition_request = fetch_or_404(
+			TuitionRequest, TUITION_REQUEST_LOAD_PLAN,
+			'Tuition request not found, or not verified.',
 			uuid=uuid.UUID(tuition_request_uuid), tutor=tutor,
 			is_rejected_by_ops=False, status='direct-request',
 			parent__is_verified_by_ops=True,
 			parent__is_suspended_by_ops=False, parent__is_deleted=False
-		).exists():
-			tuition_request = TuitionRequest.objects.select_related(
-				'parent', 'tutor__undergraduate_university', 'tuition_area', 'review'
-			).get(
-				uuid=uuid.UUID(tuition_request_uuid), tutor=tutor,
-				is_rejected_by_ops=False, status='direct-request'
-			)
-		else:
-			return Response({
-				'detail': 'Tuition request not found, or not verified.'
-			}, status=status.HTTP_404_NOT_FOUND)
-
-		# Checking if the tutor has jobs left, and updating the counts
-		jobs_left = tutor.get_jobs_left()
-		current_date = jobs_left['current_date']
-		current_month = jobs_left['current_month']
-
-		if jobs_left['daily_direct_requests_left'] < 1:
-			# Basic account
-			if tutor.get_account_type() == 'basic':
-				return Response({
-					'detail': 'Daily direct requests limit reached. Please upgrade to premium to accept more jobs.'
-				}, status=status.HTTP_402_PAYMENT_REQUIRED)
-
-			# Premium account
-			if tutor.get_account_type() == 'premium':
-				return Response({
-					'detail': 'Daily direct requests limit reached.'
-				}, status=status.HTTP_400_BAD_REQUEST)
-
-		if jobs_left['monthly_direct_requests_left'] < 1:
-			# Basic account
-			if tutor.get_account_type() == 'basic':
-				return Response({
-					'detail': 'Monthly direct requests limit reached. Please upgrade to premium to accept more jobs.'
-				}, status=status.HTTP_402_PAYMENT_REQUIRED)
-
-			# Premium account
-			if tutor.get_account_type() == 'premium':
-				return Response({
-					'detail': 'Monthly direct requests limit reached.'
-				}, status=status.HTTP_400_BAD_REQUEST)
-
-		if current_date in tutor.daily_direct_requests_accepted:
-			tutor.daily_direct_requests_accepted[current_date] += 1
-		else:
-			tutor.daily_direct_requests_accepted[current_date] = 1
-
-		if current_month in tutor.monthly_direct_requests_accepted:
-			tutor.monthly_direct_requests_accepted[current_month] += 1
-		else:
-			tutor.monthly_direct_requests_accepted[current_month] = 1
+		)
 
 		# Updating the last applied to
 		tutor.last_applied_to_job_at = arrow.utcnow().datetime
@@ -1138,41 +1132,29 @@ class AcceptDirectRequest(APIView):
 
 		# Creating the notifications and saving the objects using a transaction
 		with transaction.atomic():
-			tutor.save()
+			# Reserving the job in the quotas of the tutor, before changing the
+			# tuition request
+			job_limit_error = reserve_job(tutor, 'direct_requests')
+			if job_limit_error:
+				detail, status_code = job_limit_error
+				return Response({
+					'detail': detail
+				}, status=status_code)
+
+			tutor.save(update_fields=['last_applied_to_job_at'])
 			tuition_request.save()
 
-			# Notification for parent
-			Notification.objects.create(
-				notification_type='direct-request-accept',
-				parent=tuition_request.parent,
-				created_for='parent',
-				title='Direct request accepted by tutor',
-				body=str(
-					'A tutor you directly requested has accepted the job '
-					'offer. Please expect a call from them before finalizing '
-					'the details and confirming the job.'
-				),
-				url=str(
-					f'https://app.yoda.com/parent/job-details/{tuition_request.uuid}/'
+			# Notifications for parent and tutor
+			Notification.create_many([
+				Notification.build(
+					'direct-request-accept', tuition_request.parent, True,
+					tuition_request_uuid=tuition_request.uuid
 				),
-				create_extra_notifications=True
-			)
-
-			# Notification for tutor
-			Notification.objects.create(
-				notification_type='direct-request-accept',
-				tutor=tuition_request.tutor,
-				created_for='tutor',
-				title='Direct request accepted',
-				body=str(
-					'You have accepted the direct request. Please call the '
-					'parent to finalize and confirm the job.'
-				),
-				url=str(
-					f'https://app.yoda.com/tutor/job-details/{tuition_request.uuid}/'
-				),
-				create_extra_notifications=False
-			)
+				Notification.build(
+					'direct-request-accept', tuition_request.tutor, False,
+					tuition_request_uuid=tuition_request.uuid
+				)
+			])
 
 			return Response({
 				'detail': 'Direct request accepted.',
@@ -1183,69 +1165,21 @@ class AcceptDirectRequest(APIView):
 
 
 class ApplyToHotJob(APIView):
-	permission_classes = (UserPermissionTutorSelectRelated,)
+	permission_classes = (UserPermission,)
+	user_load_plan = TUTOR_ACADEMIC_BACKGROUNDS_LOAD_PLAN
 
 	def post(self, request, tuition_request_uuid, format=None):
 		tutor = self.user
 
 		# Getting the tuition request if it exists, 404 otherwise
-		if TuitionRequest.objects.filter(
+		tuition_request = fetch_or_404(
+			TuitionRequest, TUITION_REQUEST_LOAD_PLAN,
+			'Tuition request not found, or not verified.',
 			uuid=uuid.UUID(tuition_request_uuid), tutor=tutor,
 			is_rejected_by_ops=False, status='hot-job',
 			parent__is_verified_by_ops=True,
 			parent__is_suspended_by_ops=False, parent__is_deleted=False
-		).exists():
-			tuition_request = TuitionRequest.objects.select_related(
-				'parent', 'tutor__undergraduate_university', 'tuition_area', 'review'
-			).get(
-				uuid=uuid.UUID(tuition_request_uuid), tutor=tutor,
-				is_rejected_by_ops=False, status='hot-job'
-			)
-		else:
-			return Response({
-				'detail': 'Tuition request not found, or not verified.'
-			}, status=status.HTTP_404_NOT_FOUND)
-
-		# Checking if the tutor has jobs left, and updating the counts
-		jobs_left = tutor.get_jobs_left()
-		current_date = jobs_left['current_date']
-		current_month = jobs_left['current_month']
-
-		if jobs_left['daily_hot_jobs_left'] < 1:
-			# Basic account
-			if tutor.get_account_type() == 'basic':
-				return Response({
-					'detail': 'Please upgrade to premium to apply to hot jobs.'
-				}, status=status.HTTP_402_PAYMENT_REQUIRED)
-
-			# Premium account
-			if tutor.get_account_type() == 'premium':
-				return Response({
-					'detail': 'Daily hot jobs limit reached.'
-				}, status=status.HTTP_400_BAD_REQUEST)
-
-		if jobs_left['monthly_hot_jobs_left'] < 1:
-			# Basic account
-			if tutor.get_account_type() == 'basic':
-				return Response({
-					'detail': 'Please upgrade to premium to apply to hot jobs.'
-				}, status=status.HTTP_402_PAYMENT_REQUIRED)
-
-			# Premium account
-			if tutor.get_account_type() == 'premium':
-				return Response({
-					'detail': 'Monthly hot jobs limit reached.'
-				}, status=status.HTTP_400_BAD_REQUEST)
-
-		if current_date in tutor.daily_hot_jobs_applied:
-			tutor.daily_hot_jobs_applied[current_date] += 1
-		else:
-			tutor.daily_hot_jobs_applied[current_date] = 1
-
-		if current_month in tutor.monthly_hot_jobs_applied:
-			tutor.monthly_hot_jobs_applied[current_month] += 1
-		else:
-			tutor.monthly_hot_jobs_applied[current_month] = 1
+		)
 
 		# Updating the last applied to
 		tutor.last_applied_to_job_at = arrow.utcnow().datetime
@@ -1261,41 +1195,29 @@ class ApplyToHotJob(APIView):
 
 		# Creating the notifications and saving the objects using a transaction
 		with transaction.atomic():
-			tutor.save()
-			tuition_request.save()
+			# Reserving the job in the quotas of the tutor, before changing the
+			# tuition request
+			job_limit_error = reserve_job(tutor, 'hot_jobs')
+			if job_limit_error:
+				detail, status_code = job_limit_error
+				return Response({
+					'detail': detail
+				}, status=status_code)
 
-			# Notification for parent
-			Notification.objects.create(
-				notification_type='hot-job-apply',
-				parent=tuition_request.parent,
-				created_for='parent',
-				title='A tutor applied to your job post',
-				body=str(
-					'A tutor has applied to a job post you made. Please '
-					'expect a call from them before finalizing the details '
-					'and confirming the job.'
-				),
-				url=str(
-					f'https://app.yoda.com/parent/job-details/{tuition_request.uuid}/'
-				),
-				create_extra_notifications=True
-			)
+			tutor.save(update_fields=['last_applied_to_job_at'])
+			tuition_request.save()
 
-			# Notification for tutor
-			Notification.objects.create(
-				notification_type='hot-job-apply',
-				tutor=tuition_request.tutor,
-				created_for='tutor',
-				title='Successfully applied to hot job',
-				body=str(
-					'You have applied to the hot job. Please call the parent '
-					'to finalize and confirm the job.'
+			# Notifications for parent and tutor
+			Notification.create_many([
+				Notification.build(
+					'hot-job-apply', tuition_request.parent, True,
+					tuition_request_uuid=tuition_request.uuid
 				),
-				url=str(
-					f'https://app.yoda.com/tutor/job-details/{tuition_request.uuid}/'
-				),
-				create_extra_notifications=False
-			)
+				Notification.build(
+					'hot-job-apply', tuition_request.tutor, False,
+					tuition_request_uuid=tuition_request.uuid
+				)
+			])
 
 			return Response({
 				'detail': 'Successfully applied to the hot job.',
@@ -1307,29 +1229,35 @@ class ApplyToHotJob(APIView):
 
 class TutorRejectTuitionRequest(APIView):
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
 	def post(self, request, tuition_request_uuid, format=None):
 		tutor = self.user
-
-		# Getting the tuition request if it exists, 404 otherwise
-		if TuitionRequest.objects.filter(
+		tuition_requests = TuitionRequest.objects.filter(
 			uuid=uuid.UUID(tuition_request_uuid), tutor=tutor,
 			is_rejected_by_tutor=False, is_rejected_by_ops=False,
-			parent__is_verified_by_ops=True,
-			parent__is_suspended_by_ops=False, parent__is_deleted=False
-		).exists():
-			tuition_request = TuitionRequest.objects.get(
-				uuid=uuid.UUID(tuition_request_uuid), tutor=tutor,
-				is_rejected_by_tutor=False, is_rejected_by_ops=False
+			parent__in=Parent.objects.filter(
+				is_verified_by_ops=True, is_suspended_by_ops=False,
+				is_deleted=False
 			)
-		else:
+		)
+		version = get_job_version(request.data)
+
+		# Rejecting the tuition request with one conditional update, 404
+		# otherwise
+		if not transition_jobs(
+			tuition_requests, {'is_rejected_by_tutor': True}, version
+		):
+			if is_job_changed(tuition_requests, version):
+				detail, status_code = JOB_CHANGED_ERROR
+				return Response({
+					'detail': detail
+				}, status=status_code)
+
 			return Response({
 				'detail': 'Tuition request not found, or not verified.'
 			}, status=status.HTTP_404_NOT_FOUND)
 
-		tuition_request.is_rejected_by_tutor = True
-		tuition_request.save()
-
 		return Response({
 			'detail': 'The tuition request has been rejected.'
 		})
@@ -1337,128 +1265,58 @@ class TutorRejectTuitionRequest(APIView):
 
 class TutorConfirmTuitionRequest(APIView):
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
 	def post(self, request, tuition_request_uuid, format=None):
 		tutor = self.user
-
-		# Getting the tuition request if it exists, 404 otherwise
-		if TuitionRequest.objects.filter(
+		tuition_requests = TuitionRequest.objects.filter(
 			uuid=uuid.UUID(tuition_request_uuid), tutor=tutor,
 			is_rejected_by_tutor=False, is_rejected_by_ops=False,
-			parent__is_verified_by_ops=True,
-			parent__is_suspended_by_ops=False, parent__is_deleted=False,
-			status__in=['in-process', 'waiting-for-tutor']
-		).exists():
-			tuition_request = TuitionRequest.objects.select_related(
-				'parent', 'parent_rft'
-			).get(
-				uuid=uuid.UUID(tuition_request_uuid), tutor=tutor,
-				is_rejected_by_tutor=False, is_rejected_by_ops=False,
-				status__in=['in-process', 'waiting-for-tutor']
-			)
-		else:
-			return Response({
-				'detail': 'Tuition request not found, or not verified.'
-			}, status=status.HTTP_404_NOT_FOUND)
-
-		# Parent save check
-		save_parent = False
-
-		# Parent RFT save check
-		save_parent_rft = False
-
-		# Generating the status specific data
-		if tuition_request.status == 'in-process':
-			tuition_request.status = 'waiting-for-parent'
-
-			# Parent notification
-			parent_notification_title = str(
-				'A tutor is waiting for you to confirm a job'
-			)
-			parent_notification_body = str(
-				'A tutor is waiting for you to confirm a job you posted. '
-				'Please confirm if you have talked over the phone and '
-				'finalized everything.'
-			)
-
-			# Tutor notification
-			tutor_notification_title = 'Waiting for parent'
-			tutor_notification_body = str(
-				'You have confirmed the job from your side. Please wait for '
-				'the parent to confirm the job from their side.'
+			parent__in=Parent.objects.filter(
+				is_verified_by_ops=True, is_suspended_by_ops=False,
+				is_deleted=False
 			)
+		)
+		version = get_job_version(request.data)
 
-		elif tuition_request.status == 'waiting-for-tutor':
-			tuition_request.status = 'confirmed'
-			tuition_request.confirmation_date = arrow.utcnow().datetime
-
-			# Parent notification
-			parent_notification_title = 'Job confirmed'
-			parent_notification_body = 'Job has been confirmed successfully.'
-
-			# Tutor notification
-			tutor_notification_title = parent_notification_title
-			tutor_notification_body = parent_notification_body
-
-			# Update the parent and save check
-			save_parent = True
-			tuition_request.parent.last_confirmed_job_at = arrow.utcnow().datetime
-
-			# Update the parent RFT save check
-			if tuition_request.parent_rft:
-				if not tuition_request.parent_rft.is_confirmed:
-					tuition_request.parent_rft.is_confirmed = True
-					tuition_request.parent_rft.confirmation_date = arrow.utcnow().datetime
-					save_parent_rft = True
-
-		# Creating the notifications and saving the object using a transaction
+		# Changing the status with one conditional update, and creating the
+		# notifications and confirming the parent and parent RFT once
+		# committed
+		effects = JobTransitionEffects()
 		with transaction.atomic():
-			tuition_request.save()
-
-			# Notification for parent
-			Notification.objects.create(
-				notification_type=tuition_request.status,
-				parent=tuition_request.parent,
-				created_for='parent',
-				title=parent_notification_title,
-				body=parent_notification_body,
-				url=str(
-					f'https://app.yoda.com/parent/job-details/{tuition_request.uuid}/'
-				),
-				create_extra_notifications=True
-			)
-
-			# Notification for tutor
-			Notification.objects.create(
-				notification_type=tuition_request.status,
-				tutor=tuition_request.tutor,
-				created_for='tutor',
-				title=tutor_notification_title,
-				body=tutor_notification_body,
-				url=str(
-					f'https://app.yoda.com/tutor/job-details/{tuition_request.uuid}/'
-				),
-				create_extra_notifications=False
+			rows = transition_tuition_requests(
+				tuition_requests, 'tutor-confirm', effects, version
 			)
+			effects.run_on_commit()
+
+		# 404 if the tuition request could not be confirmed
+		if not rows:
+			if is_job_changed(tuition_requests.filter(
+				status__in=list(TUITION_REQUEST_TRANSITIONS['tutor-confirm'])
+			), version):
+				detail, status_code = JOB_CHANGED_ERROR
+				return Response({
+					'detail': detail
+				}, status=status_code)
 
-			# Update the parent, depending on save check
-			if save_parent:
-				tuition_request.parent.save()
-
-			# Update the parent RFT, depending on save check
-			if save_parent_rft:
-				tuition_request.parent_rft.save()
-
-			# Returning the response
 			return Response({
-				'detail': 'This job has been successfully confirmed.',
-				'tuition_request':
-				TuitionRequestSerializer(tuition_request).data
-			})
+				'detail': 'Tuition request not found, or not verified.'
+			}, status=status.HTTP_404_NOT_FOUND)
+
+		# Returning the response
+		tuition_request = TuitionRequest.objects.select_related(
+			'parent', 'tutor__undergraduate_university', 'tuition_area', 'review'
+		).get(id=rows[0]['id'])
+		return Response({
+			'detail': 'This job has been successfully confirmed.',
+			'tuition_request':
+			TuitionRequestSerializer(tuition_request).data
+		})
 
 
 class ParentConfirmTuitionRequest(APIView):
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
 	def is_ops_view(self):
 		return False
@@ -1480,171 +1338,104 @@ class ParentConfirmTuitionRequest(APIView):
 				parent_uuid = request.data['parent_uuid']
 
 			# Get parent
-			if Parent.objects.filter(
-					uuid=uuid.UUID(parent_uuid),
-					is_phone_number_verified=True,
-					is_verified_by_ops=True,
-					is_suspended_by_ops=False,
-					is_deleted=False
-				).exists():
-				parent = Parent.objects.get(
-					uuid=uuid.UUID(parent_uuid),
-					is_phone_number_verified=True,
-					is_verified_by_ops=True,
-					is_suspended_by_ops=False,
-					is_deleted=False
-				)
-			else:
-				return Response({
-					'detail': str(
-						'Parent not found, or one of following: phone number '
-						'not verified, parent not verified by ops, parent '
-						'suspended by ops, and/or parent deleted.'
-					)
-				}, status=status.HTTP_404_NOT_FOUND)
+			parent = fetch_or_404(
+				Parent,
+				detail=str(
+					'Parent not found, or one of following: phone number '
+					'not verified, parent not verified by ops, parent '
+					'suspended by ops, and/or parent deleted.'
+				),
+				uuid=uuid.UUID(parent_uuid),
+				is_phone_number_verified=True,
+				is_verified_by_ops=True,
+				is_suspended_by_ops=False,
+				is_deleted=False
+			)
 
-		# Getting the tuition request if it exists, 404 otherwise
-		if TuitionRequest.objects.filter(
+		tuition_requests = TuitionRequest.objects.filter(
 			uuid=uuid.UUID(tuition_request_uuid), parent=parent,
 			is_rejected_by_tutor=False, is_rejected_by_ops=False,
-			parent__is_verified_by_ops=True,
-			parent__is_suspended_by_ops=False, parent__is_deleted=False,
-			status__in=['in-process', 'waiting-for-parent']
-		).exists():
-			tuition_request = TuitionRequest.objects.get(
-				uuid=uuid.UUID(tuition_request_uuid), parent=parent,
-				is_rejected_by_tutor=False, is_rejected_by_ops=False,
-				status__in=['in-process', 'waiting-for-parent']
-			)
-		else:
-			return Response({
-				'detail': 'Tuition request not found, or not verified.'
-			}, status=status.HTTP_404_NOT_FOUND)
-
-		# Parent save check
-		save_parent = False
-
-		# Parent RFT save check
-		save_parent_rft = False
-
-		# Generating the status specific data
-		if tuition_request.status == 'in-process':
-			tuition_request.status = 'waiting-for-tutor'
-
-			# Parent notification
-			parent_notification_title = str(
-				'Waiting for tutor'
-			)
-			parent_notification_body = str(
-				'You have confirmed the job from your side. Please wait for '
-				'the tutor to confirm the job from their side.'
+			parent__in=Parent.objects.filter(
+				is_verified_by_ops=True, is_suspended_by_ops=False,
+				is_deleted=False
 			)
+		)
+		statuses = TUITION_REQUEST_TRANSITIONS['parent-confirm']
+		version = get_job_version(request.data)
+		values = None
+
+		# Adding the ops note for ops view, to the ops notes of the version
+		# which is read
+		if self.is_ops_view():
+			tuition_request = tuition_requests.filter(
+				status__in=list(statuses)
+			).only('id', 'status', 'ops_notes', 'version').first()
+			if tuition_request is None:
+				return Response({
+					'detail': 'Tuition request not found, or not verified.'
+				}, status=status.HTTP_404_NOT_FOUND)
 
-			# Tutor notification
-			tutor_notification_title = str(
-				'A parent is waiting for you to confirm a job'
+			tuition_request.ops_notes['notes'].append(
+				generate_ops_note(
+					self.account.user,
+					str(f'Status changed to '
+						f'{statuses[tuition_request.status]} by ops user.')
+				)
 			)
-			tutor_notification_body = str(
-				'A parent is waiting for you to confirm a job you accepted or '
-				'applied to. Please confirm if you have talked over the phone '
-				'and finalized everything.'
+			tuition_requests = tuition_requests.filter(
+				id=tuition_request.id, status=tuition_request.status
 			)
+			values = {'ops_notes': tuition_request.ops_notes}
+			version = tuition_request.version
 
-		elif tuition_request.status == 'waiting-for-parent':
-			tuition_request.status = 'confirmed'
-			tuition_request.confirmation_date = arrow.utcnow().datetime
-
-			# Parent notification
-			parent_notification_title = 'Job confirmed'
-			parent_notification_body = 'Job has been confirmed successfully.'
-
-			# Tutor notification
-			tutor_notification_title = parent_notification_title
-			tutor_notification_body = parent_notification_body
-
-			# Update the parent and save check
-			save_parent = True
-			parent.last_confirmed_job_at = arrow.utcnow().datetime
-
-			# Update the parent RFT save check
-			if tuition_request.parent_rft:
-				if not tuition_request.parent_rft.is_confirmed:
-					tuition_request.parent_rft.is_confirmed = True
-					tuition_request.parent_rft.confirmation_date = arrow.utcnow().datetime
-					save_parent_rft = True
-
-		# Creating the notifications and saving the object using a transaction
+		# Changing the status with one conditional update, and creating the
+		# notifications and confirming the parent and parent RFT once
+		# committed
+		effects = JobTransitionEffects()
 		with transaction.atomic():
-			# Update the ops note for ops view
-			if self.is_ops_view():
-				tuition_request.ops_notes['notes'].append(
-					generate_ops_note(
-						self.account.user,
-						str(f'Status changed to {tuition_request.status} by '
-							f'ops user.')
-					)
-				)
-			tuition_request.save()
-
-			# Notification for parent
-			Notification.objects.create(
-				notification_type=tuition_request.status,
-				parent=tuition_request.parent,
-				created_for='parent',
-				title=parent_notification_title,
-				body=parent_notification_body,
-				url=str(
-					f'https://app.yoda.com/parent/job-details/{tuition_request.uuid}/'
-				),
-				create_extra_notifications=False
-			)
-
-			# Notification for tutor
-			Notification.objects.create(
-				notification_type=tuition_request.status,
-				tutor=tuition_request.tutor,
-				created_for='tutor',
-				title=tutor_notification_title,
-				body=tutor_notification_body,
-				url=str(
-					f'https://app.yoda.com/tutor/job-details/{tuition_request.uuid}/'
-				),
-				create_extra_notifications=True
+			rows = transition_tuition_requests(
+				tuition_requests, 'parent-confirm', effects, version, values
 			)
+			effects.run_on_commit()
+
+		# 404 if the tuition request could not be confirmed
+		if not rows:
+			if self.is_ops_view() or is_job_changed(tuition_requests.filter(
+				status__in=list(statuses)
+			), version):
+				detail, status_code = JOB_CHANGED_ERROR
+				return Response({
+					'detail': detail
+				}, status=status_code)
 
-			# Update the parent, depending on save check
-			if save_parent:
-				parent.save()
-
-			# Update the parent RFT, depending on save check
-			if save_parent_rft:
-				tuition_request.parent_rft.save()
-
-			# Returning the response
 			return Response({
-				'detail': 'This job has been successfully confirmed.',
-				'tuition_request':
-				self.get_serializer_class()(tuition_request).data
-			})
+				'detail': 'Tuition request not found, or not verified.'
+			}, status=status.HTTP_404_NOT_FOUND)
+
+		# Returning the response
+		tuition_request = TuitionRequest.objects.select_related(
+			'parent', 'tutor__undergraduate_university', 'tuition_area', 'review'
+		).get(id=rows[0]['id'])
+		return Response({
+			'detail': 'This job has been successfully confirmed.',
+			'tuition_request':
+			self.get_serializer_class()(tuition_request).data
+		})
 
 
 # Notification views
 
-class NotificationList(APIView, PageNumberPagination):
+class NotificationList(APIView, KeysetPagination):
 	page_size = 10
 	max_page_size = 10
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
 	def get_notifications(self, obj):
 		raise NotImplementedError(
 			'Please implement this method in the sub-class.'
 		)
 
-	def get_unread_notifications_count(self, obj):
-		raise NotImplementedError(
-			'Please implement this method in the sub-class.'
-		)
-
 	def get(self, request, format=None):
 		obj = self.user
 
@@ -1659,7 +1450,7 @@ class NotificationList(APIView, PageNumberPagination):
 		# Add number of unread notifications
 		response = self.get_paginated_response(paginated_serializer.data)
 		response.data['unread_notifications_count'
-		] = self.get_unread_notifications_count(obj)
+		] = UnreadNotificationCounter.get_count(obj)
 
 		return response
 
@@ -1668,47 +1459,33 @@ class ParentNotificationList(NotificationList):
 	def get_notifications(self, obj):
 		return Notification.objects.filter(parent=obj)
 
-	def get_unread_notifications_count(self, obj):
-		return Notification.objects.filter(parent=obj, is_read=False).count()
-
 
 class StudentNotificationList(NotificationList):
 	def get_notifications(self, obj):
 		return Notification.objects.filter(student=obj)
 
-	def get_unread_notifications_count(self, obj):
-		return Notification.objects.filter(student=obj, is_read=False).count()
-
 
 class TutorNotificationList(NotificationList):
 	def get_notifications(self, obj):
 		return Notification.objects.filter(tutor=obj)
 
-	def get_unread_notifications_count(self, obj):
-		return Notification.objects.filter(tutor=obj, is_read=False).count()
-
 
 class ReadNotification(APIView):
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
-	def check_if_notification_exists(self, notification_id):
-		raise NotImplementedError(
-			'Please implement this method in the sub-class.'
-		)
-
-	def get_notification(self, notification_id):
+	def get_notification_filters(self, notification_id):
 		raise NotImplementedError(
 			'Please implement this method in the sub-class.'
 		)
 
 	def post(self, request, notification_id, format=None):
 		# Get notification or 404
-		if self.check_if_notification_exists(notification_id):
-			notification = self.get_notification(notification_id)
-		else:
-			return Response({
-				'detail': 'Notification not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		notification = fetch_or_404(
+			Notification, NOTIFICATION_READ_STATUS_LOAD_PLAN,
+			'Notification not found.',
+			**self.get_notification_filters(notification_id)
+		)
 
 		# Check if notification read or not
 		if notification.is_read == True:
@@ -1716,62 +1493,77 @@ class ReadNotification(APIView):
 				'detail': 'Already read.'
 			}, status=status.HTTP_400_BAD_REQUEST)
 
-		# Update notification and handle response
-		notification.is_read = True
-		notification.save()
+		# Update notification and the unread counter, and handle response
+		with transaction.atomic():
+			if Notification.objects.filter(
+				id=notification.id, is_read=False
+			).update(is_read=True):
+				UnreadNotificationCounter.remove_unread(self.user)
 		return Response({
 			'detail': 'Notification read successfully.'
 		})
 
 
 class ParentReadNotification(ReadNotification):
-	def check_if_notification_exists(self, notification_id):
-		if Notification.objects.filter(
-			parent=self.user, id=int(notification_id)).exists():
-			return True
-		else:
-			return False
+	def get_notification_filters(self, notification_id):
+		return {'parent': self.user, 'id': int(notification_id)}
+
+
+class StudentReadNotification(ReadNotification):
+	def get_notification_filters(self, notification_id):
+		return {'student': self.user, 'id': int(notification_id)}
+
+
+class TutorReadNotification(ReadNotification):
+	def get_notification_filters(self, notification_id):
+		return {'tutor': self.user, 'id': int(notification_id)}
+
 
-	def get_notification(self, notification_id):
-		return Notification.objects.get(
-			parent=self.user, id=int(notification_id)
+class ReadAllNotifications(APIView):
+	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
+
+	def get_notifications(self, obj):
+		raise NotImplementedError(
+			'Please implement this method in the sub-class.'
 		)
 
+	def post(self, request, format=None):
+		# Update the notifications and the unread counter in a transaction
+		with transaction.atomic():
+			number_of_notifications = self.get_notifications(
+				self.user
+			).filter(is_read=False).update(is_read=True)
+			UnreadNotificationCounter.reset(self.user)
 
-class StudentReadNotification(ReadNotification):
-	def check_if_notification_exists(self, notification_id):
-		if Notification.objects.filter(
-			student=self.user, id=int(notification_id)).exists():
-			return True
-		else:
-			return False
+		return Response({
+			'detail': 'Notifications read successfully.',
+			'number_of_notifications_read': number_of_notifications
+		})
+
+
+class ParentReadAllNotifications(ReadAllNotifications):
+	def get_notifications(self, obj):
+		return Notification.objects.filter(parent=obj)
 
-	def get_notification(self, notification_id):
-		return Notification.objects.get(
-			student=self.user, id=int(notification_id)
-		)
 
+class StudentReadAllNotifications(ReadAllNotifications):
+	def get_notifications(self, obj):
+		return Notification.objects.filter(student=obj)
 
-class TutorReadNotification(ReadNotification):
-	def check_if_notification_exists(self, notification_id):
-		if Notification.objects.filter(
-			tutor=self.user, id=int(notification_id)).exists():
-			return True
-		else:
-			return False
 
-	def get_notification(self, notification_id):
-		return Notification.objects.get(
-			tutor=self.user, id=int(notification_id)
-		)
+class TutorReadAllNotifications(ReadAllNotifications):
+	def get_notifications(self, obj):
+		return Notification.objects.filter(tutor=obj)
 
 
 # Transaction views
 
-class TransactionList(APIView, PageNumberPagination):
+class TransactionList(APIView, KeysetPagination):
 	page_size = 20
 	max_page_size = 20
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
 	def get_transactions(self, obj):
 		raise NotImplementedError(
@@ -1825,9 +1617,8 @@ class OpsLogin(APIView):
 			}, status=status.HTTP_400_BAD_REQUEST)
 
 		# Find the user, and 404 otherwise
-		if User.objects.filter(username=request.data['username']).exists():
-			user = User.objects.get(username=request.data['username'])
-		else:
+		user = fetch(User, username=request.data['username'])
+		if user is None:
 			return Response({
 				'username': ['User not found with that username.']
 			}, status=status.HTTP_404_NOT_FOUND)
@@ -2072,12 +1863,7 @@ class OpsUserDetails(APIView):
 
 	def get(self, request, user_uuid, format=None):
 		# Check if the user exists and get it
-		if self.get_model_class().objects.filter(uuid=uuid.UUID(user_uuid)):
-			user = self.get_user(user_uuid)
-		else:
-			return Response({
-				'detail': 'User not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		user = self.get_user(user_uuid)
 
 		# Handle the serializer
 		serializer = self.get_serializer_class_for_get()(user)
@@ -2088,12 +1874,7 @@ class OpsUserDetails(APIView):
 
 	def post(self, request, user_uuid, format=None):
 		# Check if the user exists and get it
-		if self.get_model_class().objects.filter(uuid=uuid.UUID(user_uuid)):
-			user = self.get_user(user_uuid)
-		else:
-			return Response({
-				'detail': 'User not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		user = self.get_user(user_uuid)
 
 		# Check if country is given
 		if not 'country' in request.data:
@@ -2155,7 +1936,9 @@ class OpsParentDetails(OpsUserDetails):
 		return Parent
 
 	def get_user(self, user_uuid):
-		return Parent.objects.get(uuid=uuid.UUID(user_uuid))
+		return fetch_or_404(
+			Parent, detail='User not found.', uuid=uuid.UUID(user_uuid)
+		)
 
 	def get_serializer_class_for_get(self):
 		return OpsParentSerializer
@@ -2169,7 +1952,9 @@ class OpsStudentDetails(OpsUserDetails):
 		return Student
 
 	def get_user(self, user_uuid):
-		return Student.objects.get(uuid=uuid.UUID(user_uuid))
+		return fetch_or_404(
+			Student, detail='User not found.', uuid=uuid.UUID(user_uuid)
+		)
 
 	def get_serializer_class_for_get(self):
 		return OpsStudentSerializer
@@ -2183,10 +1968,10 @@ class OpsTutorDetails(OpsUserDetails):
 		return Tutor
 
 	def get_user(self, user_uuid):
-		return Tutor.objects.select_related(
-			'undergraduate_university_academic_bg', 'school_academic_bg',
-			'college_academic_bg'
-		).get(uuid=uuid.UUID(user_uuid))
+		return fetch_or_404(
+			Tutor, TUTOR_ACADEMIC_BACKGROUNDS_LOAD_PLAN, 'User not found.',
+			uuid=uuid.UUID(user_uuid)
+		)
 
 	def get_serializer_class_for_get(self):
 		return OpsTutorDetailsGetSerializer
@@ -2244,14 +2029,29 @@ class OpsUserFilter(APIView, PageNumberPagination):
 
 			if request.data.get('full_name', ''):
 				filters &= models.Q(
-					full_name__icontains=request.data['full_name'],
+					full_name__ilike_contains=request.data['full_name'],
 				)
 
+			# Text query over the names, about texts, and institutions of the
+			# tutors
+			try:
+				text = get_text_search_query(request.data)
+			except ValueError as e:
+				return Response({
+					'q': [str(e)]
+				}, status=status.HTTP_400_BAD_REQUEST)
+
 			if request.data.get('phone_number', ''):
 				filters &= models.Q(
 					phone_number=request.data['phone_number'],
 				)
 
+			if request.data.get('phone_number_prefix', ''):
+				filters &= models.Q(
+					phone_number__startswith=
+					request.data['phone_number_prefix'],
+				)
+
 			if 'is_phone_number_verified' in request.data:
 				filters &= models.Q(
 					is_phone_number_verified=
@@ -2349,28 +2149,27 @@ class OpsUserFilter(APIView, PageNumberPagination):
 						request.data['is_teaching_preferences_complete'],
 					)
 
-				if request.data.get('account_type', ''):
-					if request.data['account_type'] == 'basic':
-						filters &= models.Q(
-							date_till_premium_account_valid__lte=
-							arrow.utcnow().datetime,
-						)
-					elif request.data['account_type'] == 'premium':
-						filters &= models.Q(
-							date_till_premium_account_valid__gte=
-							arrow.utcnow().datetime,
-						)
+				if request.data.get('account_type', '') in ('basic', 'premium'):
+					filters &= Tutor.get_account_type_q(
+						request.data['account_type']
+					)
 
+				# Matching academic backgrounds in a subquery, so that every
+				# tutor is found once without joining them
 				if request.data.get('school_name', ''):
 					filters &= models.Q(
-						school_academic_bg__name_of_institution__icontains=
-						request.data['school_name'],
+						school_academic_bg__in=AcademicBackground.objects.filter(
+							name_of_institution__ilike_contains=
+							request.data['school_name'],
+						).values('id'),
 					)
 
 				if request.data.get('college_name', ''):
 					filters &= models.Q(
-						college_academic_bg__name_of_institution__icontains=
-						request.data['college_name'],
+						college_academic_bg__in=AcademicBackground.objects.filter(
+							name_of_institution__ilike_contains=
+							request.data['college_name'],
+						).values('id'),
 					)
 
 				if request.data.get('date_till_premium_account_valid', None):
@@ -2402,8 +2201,15 @@ class OpsUserFilter(APIView, PageNumberPagination):
 						premium_type=request.data['premium_type'],
 					)
 
-			# Getting the users
+				if text:
+					filters &= get_tutor_text_search_q(text)
+
+			# Getting the users, the most relevant to the text query first
 			users = self.get_users(filters)
+			if text and self.get_user_type() == 'tutor':
+				users = users.annotate(
+					text_rank=get_tutor_text_search_rank(text)
+				).order_by('-text_rank', 'id')
 
 			if not get_all:
 				# Init paginated serializer and return
@@ -2457,10 +2263,11 @@ class OpsStudentFilter(OpsUserFilter):
 
 class OpsTutorFilter(OpsUserFilter):
 	def get_users(self, filters):
+		# The filters only follow foreign keys, so no tutor is found twice
 		return Tutor.objects.select_related(
 			'undergraduate_university_academic_bg', 'school_academic_bg',
 			'college_academic_bg'
-		).filter(filters).distinct()
+		).filter(filters)
 
 	def get_serializer_class_for_filter(self):
 		return OpsTutorFilterSerializer
@@ -2500,13 +2307,7 @@ class OpsChangeUserVerification(APIView):
 	def post(self, request, user_uuid, new_ops_verification_status,
 		format=None):
 		# Check and get if the user exists
-		if self.get_model_class().objects.filter(
-			uuid=uuid.UUID(user_uuid)).exists():
-			user = self.get_user(user_uuid)
-		else:
-			return Response({
-				'detail': 'User not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		user = self.get_user(user_uuid)
 
 		# Check if redundant
 		if user.is_verified_by_ops and new_ops_verification_status == 'verify':
@@ -2550,7 +2351,9 @@ class OpsChangeParentVerification(OpsChangeUserVerification):
 		return Parent
 
 	def get_user(self, user_uuid):
-		return Parent.objects.get(uuid=uuid.UUID(user_uuid))
+		return fetch_or_404(
+			Parent, detail='User not found.', uuid=uuid.UUID(user_uuid)
+		)
 
 	def save_user(self, user):
 		if user.is_verified_by_ops:
@@ -2564,25 +2367,17 @@ class OpsChangeParentVerification(OpsChangeUserVerification):
 					notification_created=False
 				)
 
-				# Update the tuition requests and create notifications
-				for tuition_request in tuition_requests:
-					Notification.objects.create(
-						notification_type='direct-request-create',
-						tutor=tuition_request.tutor,
-						created_for='tutor',
-						title='New direct request',
-						body=str(
-							'A parent has directly requested you to be the '
-							'potential tutor for their children!'
-						),
-						url=str(
-							f'https://app.yoda.com/tutor/job-details'
-							f'/{tuition_request.uuid}/'
-						),
-						create_extra_notifications=True
-					)
-					tuition_request.notification_created = True
-					tuition_request.save()
+				# Create the notifications and update the tuition requests
+				Notification.create_many([
+					Notification.build(
+						'direct-request-create', tuition_request.tutor, True,
+						tuition_request_uuid=tuition_request.uuid
+					) for tuition_request in tuition_requests
+				])
+				tuition_requests.update(
+					notification_created=True,
+					updated_at=arrow.utcnow().datetime
+				)
 
 				# Save the object
 				user.save()
@@ -2598,7 +2393,9 @@ class OpsChangeStudentVerification(OpsChangeUserVerification):
 		return Student
 
 	def get_user(self, user_uuid):
-		return Student.objects.get(uuid=uuid.UUID(user_uuid))
+		return fetch_or_404(
+			Student, detail='User not found.', uuid=uuid.UUID(user_uuid)
+		)
 
 	def save_user(self, user):
 		user.save()
@@ -2612,27 +2409,18 @@ class OpsChangeTutorVerification(OpsChangeUserVerification):
 		return Tutor
 
 	def get_user(self, user_uuid):
-		return Tutor.objects.select_related(
-			'undergraduate_university_academic_bg', 'school_academic_bg',
-			'college_academic_bg'
-		).get(uuid=uuid.UUID(user_uuid))
+		return fetch_or_404(
+			Tutor, TUTOR_ACADEMIC_BACKGROUNDS_LOAD_PLAN, 'User not found.',
+			uuid=uuid.UUID(user_uuid)
+		)
 
 	def save_user(self, user):
 		if user.is_verified_by_ops:
 			with transaction.atomic():
 				# Create the notification
-				Notification.objects.create(
-					notification_type='ops-verification',
-					tutor=user,
-					created_for='tutor',
-					title='Profile verification successful',
-					body=str(
-						'Congratulations. Your profile has been successfully '
-						'verified by Yoda!'
-					),
-					url=str(f'https://app.yoda.com/tutor/dashboard/'),
-					create_extra_notifications=True
-				)
+				Notification.create_many([
+					Notification.build('ops-verification', user, True)
+				])
 
 				# Save the object
 				user.save()
@@ -2656,29 +2444,20 @@ class OpsRequestForTutorCreate(APIView):
 			}, status=status.HTTP_400_BAD_REQUEST)
 
 		# Check if the parent exists and meets all the checks
-		if Parent.objects.filter(
-				phone_number=request.data['parent_phone_number'],
-				is_phone_number_verified=True,
-				is_verified_by_ops=True,
-				is_suspended_by_ops=False,
-				is_deleted=False
-			).exists():
-			parent = Parent.objects.get(
-				phone_number=request.data['parent_phone_number'],
-				is_phone_number_verified=True,
-				is_verified_by_ops=True,
-				is_suspended_by_ops=False,
-				is_deleted=False
-			)
-			request.data['parent'] = parent.id
-		else:
-			return Response({
-				'detail': str(
-					'Parent not found, or one of following: phone number not '
-					'verified, parent not verified by ops, parent suspended '
-					'by ops, and/or parent deleted.'
-				)
-			}, status=status.HTTP_404_NOT_FOUND)
+		parent = fetch_or_404(
+			Parent,
+			detail=str(
+				'Parent not found, or one of following: phone number not '
+				'verified, parent not verified by ops, parent suspended '
+				'by ops, and/or parent deleted.'
+			),
+			phone_number=request.data['parent_phone_number'],
+			is_phone_number_verified=True,
+			is_verified_by_ops=True,
+			is_suspended_by_ops=False,
+			is_deleted=False
+		)
+		request.data['parent'] = parent.id
 
 		# Handle the serializer
 		serializer = RequestForTutorCreateSerializer(data=request.data)
@@ -2722,12 +2501,7 @@ class OpsJobDetails(APIView):
 
 	def get(self, request, job_uuid, format=None):
 		# Check if the job exists and get it
-		if self.get_model_class().objects.filter(uuid=uuid.UUID(job_uuid)):
-			job = self.get_job(job_uuid)
-		else:
-			return Response({
-				'detail': 'Not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		job = self.get_job(job_uuid)
 
 		# Handle the serializer
 		serializer = self.get_serializer_class()(job)
@@ -2741,9 +2515,10 @@ class OpsRequestForTutorDetails(OpsJobDetails):
 		return RequestForTutor
 
 	def get_job(self, job_uuid):
-		return RequestForTutor.objects.select_related(
-			'parent', 'tuition_area', 'tutor_undergraduate_university'
-		).get(uuid=uuid.UUID(job_uuid))
+		return fetch_or_404(
+			RequestForTutor, OPS_REQUEST_FOR_TUTOR_LOAD_PLAN,
+			uuid=uuid.UUID(job_uuid)
+		)
 
 	def get_serializer_class(self):
 		return OpsRequestForTutorSerializer
@@ -2757,9 +2532,9 @@ class OpsTuitionRequestDetails(OpsJobDetails):
 		return TuitionRequest
 
 	def get_job(self, job_uuid):
-		return TuitionRequest.objects.select_related(
-			'parent', 'tutor__undergraduate_university', 'tuition_area', 'review'
-		).get(uuid=uuid.UUID(job_uuid))
+		return fetch_or_404(
+			TuitionRequest, TUITION_REQUEST_LOAD_PLAN, uuid=uuid.UUID(job_uuid)
+		)
 
 	def get_serializer_class(self):
 		return OpsTuitionRequestSerializer
@@ -2792,14 +2567,8 @@ class OpsChangeJobRejection(APIView):
 		)
 
 	def post(self, request, job_uuid, new_ops_rejection_status, format=None):
-		# Check and get if the job exists
-		if self.get_model_class().objects.filter(
-			uuid=uuid.UUID(job_uuid)).exists():
-			job = self.get_job(job_uuid)
-		else:
-			return Response({
-				'detail': 'Not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		# Get the job if it exists, 404 otherwise
+		job = self.get_job(job_uuid)
 
 		# Check if redundant
 		if job.is_rejected_by_ops and new_ops_rejection_status == 'reject':
@@ -2815,12 +2584,12 @@ class OpsChangeJobRejection(APIView):
 
 		# Update the rejection status
 		if new_ops_rejection_status == 'reject':
-			job.is_rejected_by_ops = True
+			is_rejected_by_ops = True
 		elif new_ops_rejection_status == 'unreject':
-			job.is_rejected_by_ops = False
+			is_rejected_by_ops = False
 
 		# Update the ops notes
-		if job.is_rejected_by_ops:
+		if is_rejected_by_ops:
 			job.ops_notes['notes'].append(
 				generate_ops_note(self.account.user, 'Rejected by ops user.')
 			)
@@ -2829,7 +2598,25 @@ class OpsChangeJobRejection(APIView):
 				generate_ops_note(self.account.user, 'Unrejected by ops user.')
 			)
 
-		job.save()
+		# Saving the changes with one conditional update of the version which
+		# is read, 409 if the job has been changed since
+		rows = transition_jobs(
+			self.get_model_class().objects.filter(
+				id=job.id, is_rejected_by_ops=job.is_rejected_by_ops
+			), {
+				'is_rejected_by_ops': is_rejected_by_ops,
+				'ops_notes': job.ops_notes
+			}, job.version
+		)
+		if not rows:
+			detail, status_code = JOB_CHANGED_ERROR
+			return Response({
+				'detail': detail
+			}, status=status_code)
+
+		job.is_rejected_by_ops = is_rejected_by_ops
+		job.version = rows[0]['version']
+		job.updated_at = rows[0]['updated_at']
 		return Response({
 			'detail': 'Successfully updated rejection status.',
 			self.get_job_type(): self.get_serializer_class()(job).data
@@ -2841,9 +2628,10 @@ class OpsChangeRequestForTutorRejection(OpsChangeJobRejection):
 		return RequestForTutor
 
 	def get_job(self, job_uuid):
-		return RequestForTutor.objects.select_related(
-			'parent', 'tuition_area', 'tutor_undergraduate_university'
-		).get(uuid=uuid.UUID(job_uuid))
+		return fetch_or_404(
+			RequestForTutor, OPS_REQUEST_FOR_TUTOR_LOAD_PLAN,
+			uuid=uuid.UUID(job_uuid)
+		)
 
 	def get_serializer_class(self):
 		return OpsRequestForTutorSerializer
@@ -2857,9 +2645,9 @@ class OpsChangeTuitionRequestRejection(OpsChangeJobRejection):
 		return TuitionRequest
 
 	def get_job(self, job_uuid):
-		return TuitionRequest.objects.select_related(
-			'parent', 'tutor__undergraduate_university', 'tuition_area', 'review'
-		).get(uuid=uuid.UUID(job_uuid))
+		return fetch_or_404(
+			TuitionRequest, TUITION_REQUEST_LOAD_PLAN, uuid=uuid.UUID(job_uuid)
+		)
 
 	def get_serializer_class(self):
 		return OpsTuitionRequestSerializer
@@ -3038,18 +2826,12 @@ class OpsRftToHotJob(APIView):
 
 	def post(self, request, rft_uuid, format=None):
 		# Get RFT
-		if RequestForTutor.objects.filter(
-				uuid=uuid.UUID(rft_uuid),
-				is_rejected_by_ops=False
-			).exists():
-			rft = RequestForTutor.objects.get(
-				uuid=uuid.UUID(rft_uuid),
-				is_rejected_by_ops=False
-			)
-		else:
-			return Response({
-				'detail': 'RFT not found, or is rejected by ops.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		rft = fetch_or_404(
+			RequestForTutor, OPS_REQUEST_FOR_TUTOR_LOAD_PLAN,
+			'RFT not found, or is rejected by ops.',
+			uuid=uuid.UUID(rft_uuid),
+			is_rejected_by_ops=False
+		)
 
 		# Get tutor uuid
 		if not 'tutor_uuid' in request.data:
@@ -3060,25 +2842,17 @@ class OpsRftToHotJob(APIView):
 			tutor_uuid = request.data['tutor_uuid']
 
 		# Get tutor
-		if Tutor.objects.filter(
-				uuid=uuid.UUID(tutor_uuid),
-				is_phone_number_verified=True,
-				is_suspended_by_ops=False,
-				is_deleted=False
-			).exists():
-			tutor = Tutor.objects.get(
-				uuid=uuid.UUID(tutor_uuid),
-				is_phone_number_verified=True,
-				is_suspended_by_ops=False,
-				is_deleted=False
-			)
-		else:
-			return Response({
-				'detail': str(
-					'Tutor not found, or one of following: phone number not '
-					'verified, tutor suspended by ops, and/or tutor deleted.'
-				)
-			}, status=status.HTTP_404_NOT_FOUND)
+		tutor = fetch_or_404(
+			Tutor,
+			detail=str(
+				'Tutor not found, or one of following: phone number not '
+				'verified, tutor suspended by ops, and/or tutor deleted.'
+			),
+			uuid=uuid.UUID(tutor_uuid),
+			is_phone_number_verified=True,
+			is_suspended_by_ops=False,
+			is_deleted=False
+		)
 
 		# Check if the tutor has received the same RFT as a hot job before
 		if TuitionRequest.objects.filter(tutor=tutor, parent_rft=rft).exists():
@@ -3123,21 +2897,15 @@ class OpsRftToHotJob(APIView):
 				generate_ops_note(self.account.user, 'Created by ops user.')
 			)
 			hot_job.save()
-			for subject in rft.subjects.all():
-				hot_job.subjects.add(subject)
+			hot_job.subjects.add(*rft.subjects.all())
 
 			# Create the notification
-			Notification.objects.create(
-				notification_type='new-hot-job',
-				tutor=tutor,
-				created_for='tutor',
-				title='New hot job',
-				body='You have a new job you can apply to.',
-				url=str(
-					f'https://app.yoda.com/tutor/job-details/{hot_job.uuid}/'
-				),
-				create_extra_notifications=True
-			)
+			Notification.create_many([
+				Notification.build(
+					'new-hot-job', tutor, True,
+					tuition_request_uuid=hot_job.uuid
+				)
+			])
 
 			return Response({
 				'detail': 'Hot job created.',
@@ -3159,6 +2927,7 @@ class OpsParentConfirmTuitionRequest(ParentConfirmTuitionRequest):
 
 class AddOpsNote(APIView):
 	permission_classes = (OpsPermission,)
+	load_plan = None
 
 	def get_model_class(self):
 		raise NotImplementedError(
@@ -3166,8 +2935,9 @@ class AddOpsNote(APIView):
 		)
 
 	def get_obj(self, obj_uuid):
-		raise NotImplementedError(
-			'Please implement this method in the sub-class.'
+		return fetch_or_404(
+			self.get_model_class(), self.load_plan, 'Object not found.',
+			uuid=uuid.UUID(obj_uuid)
 		)
 
 	def get_serializer_class(self):
@@ -3182,13 +2952,7 @@ class AddOpsNote(APIView):
 
 	def post(self, request, obj_uuid, format=None):
 		# Get object or 404
-		if self.get_model_class().objects.filter(
-			uuid=uuid.UUID(obj_uuid)).exists():
-			obj = self.get_obj(obj_uuid)
-		else:
-			return Response({
-				'detail': 'Object not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		obj = self.get_obj(obj_uuid)
 
 		# Check if note exists
 		if not 'note' in request.data:
@@ -3219,9 +2983,6 @@ class ParentAddOpsNote(AddOpsNote):
 	def get_model_class(self):
 		return Parent
 
-	def get_obj(self, obj_uuid):
-		return Parent.objects.get(uuid=uuid.UUID(obj_uuid))
-
 	def get_serializer_class(self):
 		return OpsParentSerializer
 
@@ -3233,9 +2994,6 @@ class StudentAddOpsNote(AddOpsNote):
 	def get_model_class(self):
 		return Student
 
-	def get_obj(self, obj_uuid):
-		return Student.objects.get(uuid=uuid.UUID(obj_uuid))
-
 	def get_serializer_class(self):
 		return OpsStudentSerializer
 
@@ -3244,15 +3002,11 @@ class StudentAddOpsNote(AddOpsNote):
 
 
 class TutorAddOpsNote(AddOpsNote):
+	load_plan = TUTOR_ACADEMIC_BACKGROUNDS_LOAD_PLAN
+
 	def get_model_class(self):
 		return Tutor
 
-	def get_obj(self, obj_uuid):
-		return Tutor.objects.select_related(
-			'undergraduate_university_academic_bg', 'school_academic_bg',
-			'college_academic_bg'
-		).get(uuid=uuid.UUID(obj_uuid))
-
 	def get_serializer_class(self):
 		return OpsTutorDetailsGetSerializer
 
@@ -3261,14 +3015,11 @@ class TutorAddOpsNote(AddOpsNote):
 
 
 class RequestForTutorAddOpsNote(AddOpsNote):
+	load_plan = OPS_REQUEST_FOR_TUTOR_LOAD_PLAN
+
 	def get_model_class(self):
 		return RequestForTutor
 
-	def get_obj(self, obj_uuid):
-		return RequestForTutor.objects.select_related(
-			'parent', 'tuition_area', 'tutor_undergraduate_university'
-		).get(uuid=uuid.UUID(obj_uuid))
-
 	def get_serializer_class(self):
 		return OpsRequestForTutorSerializer
 
@@ -3277,14 +3028,11 @@ class RequestForTutorAddOpsNote(AddOpsNote):
 
 
 class TuitionRequestAddOpsNote(AddOpsNote):
+	load_plan = TUITION_REQUEST_LOAD_PLAN
+
 	def get_model_class(self):
 		return TuitionRequest
 
-	def get_obj(self, obj_uuid):
-		return TuitionRequest.objects.select_related(
-			'parent', 'tutor__undergraduate_university', 'tuition_area', 'review'
-		).get(uuid=uuid.UUID(obj_uuid))
-
 	def get_serializer_class(self):
 		return OpsTuitionRequestSerializer
 
@@ -3294,10 +3042,11 @@ class TuitionRequestAddOpsNote(AddOpsNote):
 
 # Review views
 
-class ReviewList(APIView, PageNumberPagination):
+class ReviewList(APIView, KeysetPagination):
 	page_size = 30
 	max_page_size = 30
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
 	def get_reviews(self):
 		raise NotImplementedError(
@@ -3340,25 +3089,22 @@ class OpsReviewList(ReviewList):
 
 class ReviewDetails(APIView):
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
-	def check_if_review_exists(self, review_uuid):
+	def get_review_filters(self, review_uuid):
 		raise NotImplementedError(
 			'Please implement this method in the sub-class.'
 		)
 
 	def get_review(self, review_uuid):
-		raise NotImplementedError(
-			'Please implement this method in the sub-class.'
+		return fetch_or_404(
+			Review, REVIEW_LOAD_PLAN, 'Review not found.',
+			**self.get_review_filters(review_uuid)
 		)
 
 	def get(self, request, review_uuid, format=None):
 		# Check if review exists and get it, 404 otherwise
-		if self.check_if_review_exists(review_uuid):
-			review = self.get_review(review_uuid)
-		else:
-			return Response({
-				'detail': 'Review not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		review = self.get_review(review_uuid)
 
 		# Handle the serializer and return the data
 		serializer = ReviewSerializer(review)
@@ -3368,12 +3114,7 @@ class ReviewDetails(APIView):
 
 	def post(self, request, review_uuid, format=None):
 		# Check if review exists and get it, 404 otherwise
-		if self.check_if_review_exists(review_uuid):
-			review = self.get_review(review_uuid)
-		else:
-			return Response({
-				'detail': 'Review not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		review = self.get_review(review_uuid)
 
 		# Handle the serializer and return the data
 		serializer = ReviewSerializer(review, data=request.data, partial=True)
@@ -3388,12 +3129,7 @@ class ReviewDetails(APIView):
 
 	def delete(self, request, review_uuid, format=None):
 		# Check if review exists and get it, 404 otherwise
-		if self.check_if_review_exists(review_uuid):
-			review = self.get_review(review_uuid)
-		else:
-			return Response({
-				'detail': 'Review not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		review = self.get_review(review_uuid)
 
 		with transaction.atomic():
 			# Delete the review
@@ -3406,31 +3142,13 @@ class ReviewDetails(APIView):
 
 
 class ParentReviewDetails(ReviewDetails):
-	def check_if_review_exists(self, review_uuid):
-		if Review.objects.filter(
-			parent=self.user, uuid=uuid.UUID(review_uuid)).exists():
-			return True
-		else:
-			return False
-
-	def get_review(self, review_uuid):
-		return Review.objects.get(
-			parent=self.user, uuid=uuid.UUID(review_uuid)
-		)
+	def get_review_filters(self, review_uuid):
+		return {'parent': self.user, 'uuid': uuid.UUID(review_uuid)}
 
 
 class TutorReviewDetails(ReviewDetails):
-	def check_if_review_exists(self, review_uuid):
-		if Review.objects.filter(
-			tutor=self.user, uuid=uuid.UUID(review_uuid)).exists():
-			return True
-		else:
-			return False
-
-	def get_review(self, review_uuid):
-		return Review.objects.get(
-			tutor=self.user, uuid=uuid.UUID(review_uuid)
-		)
+	def get_review_filters(self, review_uuid):
+		return {'tutor': self.user, 'uuid': uuid.UUID(review_uuid)}
 
 	def post(self, request, review_uuid, format=None):
 		return Response({
@@ -3446,40 +3164,27 @@ class TutorReviewDetails(ReviewDetails):
 class OpsReviewDetails(ReviewDetails):
 	permission_classes = (OpsPermission,)
 
-	def check_if_review_exists(self, review_uuid):
-		if Review.objects.filter(uuid=uuid.UUID(review_uuid)).exists():
-			return True
-		else:
-			return False
-
-	def get_review(self, review_uuid):
-		return Review.objects.get(uuid=uuid.UUID(review_uuid))
+	def get_review_filters(self, review_uuid):
+		return {'uuid': uuid.UUID(review_uuid)}
 
 
 class ParentReviewCreate(APIView):
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
 	def is_ops_view(self):
 		return False
 
 	def post(self, request, tuition_request_uuid, format=None):
 		# Get the tuition request if it exists, 404 otherwise
-		if TuitionRequest.objects.filter(
+		tuition_request = fetch_or_404(
+			TuitionRequest, TUITION_REQUEST_USERS_LOAD_PLAN,
+			'Tuition request not found, or not verified.',
 			uuid=uuid.UUID(tuition_request_uuid),
 			is_rejected_by_ops=False, status='confirmed',
 			parent__is_verified_by_ops=True,
 			parent__is_suspended_by_ops=False, parent__is_deleted=False
-		).exists():
-			tuition_request = TuitionRequest.objects.select_related(
-				'parent', 'tutor'
-			).get(
-				uuid=uuid.UUID(tuition_request_uuid),
-				is_rejected_by_ops=False, status='confirmed',
-			)
-		else:
-			return Response({
-				'detail': 'Tuition request not found, or not verified.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		)
 
 		# Check if parent same as authenticated parent (only for non ops view)
 		if not self.is_ops_view():
@@ -3537,7 +3242,8 @@ class OpsReviewCreate(ParentReviewCreate):
 # Upgrade to premium and payment views
 
 class UpgradeTutorToPremiumWithPoints(APIView):
-	permission_classes = (UserPermissionTutorSelectRelated,)
+	permission_classes = (UserPermission,)
+	user_load_plan = TUTOR_ACADEMIC_BACKGROUNDS_LOAD_PLAN
 
 	def post(self, request, format=None):
 		tutor = self.user
@@ -3564,17 +3270,12 @@ class OpsUpgradeTutorToPremium(APIView):
 
 	def post(self, request, tutor_uuid, format=None):
 		# Get tutor or 404
-		if Tutor.objects.filter(
+		tutor = fetch_or_404(
+			Tutor, TUTOR_ACADEMIC_BACKGROUNDS_LOAD_PLAN,
+			'Tutor not found, or suspended/deleted by ops.',
 			uuid=uuid.UUID(tutor_uuid), is_suspended_by_ops=False,
-			is_deleted=False).exists():
-			tutor = Tutor.objects.select_related(
-				'undergraduate_university_academic_bg', 'school_academic_bg',
-				'college_academic_bg'
-			).get(uuid=uuid.UUID(tutor_uuid))
-		else:
-			return Response({
-				'detail': 'Tutor not found, or suspended/deleted by ops.'
-			}, status=status.HTTP_404_NOT_FOUND)
+			is_deleted=False
+		)
 
 		# Upgrade account
 		tutor.upgrade_to_premium()
@@ -3593,6 +3294,7 @@ class OpsUpgradeTutorToPremium(APIView):
 
 class BkashCreatePayment(APIView):
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
 	def post(self, request, format=None):
 		bkash_credentials = get_bkash_credentials()
@@ -3637,6 +3339,7 @@ class BkashCreatePayment(APIView):
 
 class BkashExecutePayment(APIView):
 	permission_classes = (UserPermission,)
+	user_load_plan = TUTOR_ACADEMIC_BACKGROUNDS_LOAD_PLAN
 
 	def post(self, request, format=None):
 		bkash_credentials = get_bkash_credentials()
@@ -3703,23 +3406,19 @@ class HotJobsListFromRFT(APIView, PageNumberPagination):
 	page_size = 30
 	max_page_size = 30
 	permission_classes = (UserPermission,)
+	user_load_plan = USER_IDENTITY_LOAD_PLAN
 
-	def check_if_rft_exists(self, rft_uuid):
+	def get_rft_filters(self, rft_uuid):
 		raise NotImplementedError(
 			'Please implement this method in the sub-class.'
 		)
 
-	def get_rft(self, rft_uuid):
-		return RequestForTutor.objects.get(uuid=uuid.UUID(rft_uuid))
-
 	def get(self, request, rft_uuid, format=None):
 		# Getting the RFT, 404 otherwise
-		if self.check_if_rft_exists(rft_uuid):
-			rft = self.get_rft(rft_uuid)
-		else:
-			return Response({
-				'detail': 'RFT not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		rft = fetch_or_404(
+			RequestForTutor, ID_LOAD_PLAN, 'RFT not found.',
+			**self.get_rft_filters(rft_uuid)
+		)
 
 		# Getting the queryset
 		hot_jobs = TuitionRequest.objects.select_related(
@@ -3737,22 +3436,15 @@ class HotJobsListFromRFT(APIView, PageNumberPagination):
 
 
 class ParentHotJobsListFromRFT(HotJobsListFromRFT):
-	def check_if_rft_exists(self, rft_uuid):
-		if RequestForTutor.objects.filter(
-			uuid=uuid.UUID(rft_uuid), parent=self.user).exists():
-			return True
-		else:
-			return False
+	def get_rft_filters(self, rft_uuid):
+		return {'uuid': uuid.UUID(rft_uuid), 'parent': self.user}
 
 
 class OpsHotJobsListFromRFT(HotJobsListFromRFT):
 	permission_classes = (OpsPermission,)
 
-	def check_if_rft_exists(self, rft_uuid):
-		if RequestForTutor.objects.filter(uuid=uuid.UUID(rft_uuid)).exists():
-			return True
-		else:
-			return False
+	def get_rft_filters(self, rft_uuid):
+		return {'uuid': uuid.UUID(rft_uuid)}
 
 
 # SMS sender views
@@ -3760,12 +3452,7 @@ class OpsHotJobsListFromRFT(HotJobsListFromRFT):
 class OpsSendSMS(APIView):
 	permission_classes = (OpsPermission,)
 
-	def check_if_user_exists(self, phone_number):
-		raise NotImplementedError(
-			'Please implement this method in the sub-class.'
-		)
-
-	def get_user(self, phone_number):
+	def get_model_class(self):
 		raise NotImplementedError(
 			'Please implement this method in the sub-class.'
 		)
@@ -3807,12 +3494,10 @@ class OpsSendSMS(APIView):
 			)
 
 		# Check if user exists or not
-		if self.check_if_user_exists(request.data['phone_number']):
-			self.user = self.get_user(request.data['phone_number'])
-		else:
-			return Response({
-				'detail': 'User not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		self.user = fetch_or_404(
+			self.get_model_class(), SMS_RECIPIENT_LOAD_PLAN, 'User not found.',
+			phone_number=request.data['phone_number']
+		)
 
 		# Check if message exists
 		if not 'message' in request.data:
@@ -3821,10 +3506,15 @@ class OpsSendSMS(APIView):
 			}, status=status.HTTP_400_BAD_REQUEST)
 
 		# Send SMS
-		SMS_SENDER_COUNTRY_MAP[request.data['country']](
-			request.data['phone_number'],
-			str(request.data['message'])
-		)
+		try:
+			send_many(request.data['country'], [(
+				request.data['phone_number'],
+				str(request.data['message'])
+			)])
+		except Exception as e:
+			return Response({
+				'detail': 'SMS could not be sent.'
+			}, status=status.HTTP_400_BAD_REQUEST)
 
 		# Create log
 		self.create_log(str(request.data['message']))
@@ -3836,53 +3526,44 @@ class OpsSendSMS(APIView):
 
 
 class OpsSendSMSToParent(OpsSendSMS):
-	def check_if_user_exists(self, phone_number):
-		if Parent.objects.filter(phone_number=phone_number).exists():
-			return True
-		else:
-			return False
-
-	def get_user(self, phone_number):
-		return Parent.objects.get(phone_number=phone_number)
+	def get_model_class(self):
+		return Parent
 
 	def create_log(self, message):
 		SMSLog.objects.create(
 			parent=self.user,
-			message=message
+			message=message,
+			phone_number=self.user.phone_number,
+			country=self.user.country,
+			status='sent'
 		)
 
 
 class OpsSendSMSToStudent(OpsSendSMS):
-	def check_if_user_exists(self, phone_number):
-		if Student.objects.filter(phone_number=phone_number).exists():
-			return True
-		else:
-			return False
-
-	def get_user(self, phone_number):
-		return Student.objects.get(phone_number=phone_number)
+	def get_model_class(self):
+		return Student
 
 	def create_log(self, message):
 		SMSLog.objects.create(
 			student=self.user,
-			message=message
+			message=message,
+			phone_number=self.user.phone_number,
+			country=self.user.country,
+			status='sent'
 		)
 
 
 class OpsSendSMSToTutor(OpsSendSMS):
-	def check_if_user_exists(self, phone_number):
-		if Tutor.objects.filter(phone_number=phone_number).exists():
-			return True
-		else:
-			return False
-
-	def get_user(self, phone_number):
-		return Tutor.objects.get(phone_number=phone_number)
+	def get_model_class(self):
+		return Tutor
 
 	def create_log(self, message):
 		SMSLog.objects.create(
 			tutor=self.user,
-			message=message
+			message=message,
+			phone_number=self.user.phone_number,
+			country=self.user.country,
+			status='sent'
 		)
 
 
@@ -3911,12 +3592,9 @@ class OpsTutorTransactionList(APIView, PageNumberPagination):
 	permission_classes = (OpsPermission,)
 
 	def get(self, request, tutor_uuid, format=None):
-		if Tutor.objects.filter(uuid=uuid.UUID(tutor_uuid)).exists():
-			tutor = Tutor.objects.get(uuid=uuid.UUID(tutor_uuid))
-		else:
-			return Response({
-				'detail': 'Tutor not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		tutor = fetch_or_404(
+			Tutor, ID_LOAD_PLAN, 'Tutor not found.', uuid=uuid.UUID(tutor_uuid)
+		)
 
 		# Getting transactions
 		transactions = Transaction.objects.filter(tutor=tutor)
@@ -3930,17 +3608,12 @@ class OpsTutorTransactionList(APIView, PageNumberPagination):
 
 # Ops SMS log lists
 
-class OpsSMSLogList(APIView, PageNumberPagination):
+class OpsSMSLogList(APIView, KeysetPagination):
 	page_size = 30
 	max_page_size = 30
 	permission_classes = (OpsPermission,)
 
-	def check_if_user_exists(self, user_uuid):
-		raise NotImplementedError(
-			'Please implement this method in the sub-class.'
-		)
-
-	def get_user(self, user_uuid):
+	def get_model_class(self):
 		raise NotImplementedError(
 			'Please implement this method in the sub-class.'
 		)
@@ -3951,12 +3624,10 @@ class OpsSMSLogList(APIView, PageNumberPagination):
 		)
 
 	def get(self, request, user_uuid, format=None):
-		if self.check_if_user_exists(user_uuid):
-			self.user = self.get_user(user_uuid)
-		else:
-			return Response({
-				'detail': 'User not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		self.user = fetch_or_404(
+			self.get_model_class(), USER_UUID_LOAD_PLAN, 'User not found.',
+			uuid=uuid.UUID(user_uuid)
+		)
 
 		# Getting sms logs
 		sms_logs = self.get_sms_logs(self.user)
@@ -3969,45 +3640,53 @@ class OpsSMSLogList(APIView, PageNumberPagination):
 
 
 class OpsParentSMSLogList(OpsSMSLogList):
-	def check_if_user_exists(self, user_uuid):
-		if Parent.objects.filter(uuid=uuid.UUID(user_uuid)).exists():
-			return True
-		else:
-			return False
-
-	def get_user(self, user_uuid):
-		return Parent.objects.get(uuid=uuid.UUID(user_uuid))
+	def get_model_class(self):
+		return Parent
 
 	def get_sms_logs(self, user):
-		return SMSLog.objects.filter(parent=user)
+		# OTP logs are not shown, as they contain the OTPs
+		return SMSLog.objects.filter(parent=user, message_type='ops')
 
 
 class OpsStudentSMSLogList(OpsSMSLogList):
-	def check_if_user_exists(self, user_uuid):
-		if Student.objects.filter(uuid=uuid.UUID(user_uuid)).exists():
-			return True
-		else:
-			return False
-
-	def get_user(self, user_uuid):
-		return Student.objects.get(uuid=uuid.UUID(user_uuid))
+	def get_model_class(self):
+		return Student
 
 	def get_sms_logs(self, user):
-		return SMSLog.objects.filter(student=user)
+		# OTP logs are not shown, as they contain the OTPs
+		return SMSLog.objects.filter(student=user, message_type='ops')
 
 
 class OpsTutorSMSLogList(OpsSMSLogList):
-	def check_if_user_exists(self, user_uuid):
-		if Tutor.objects.filter(uuid=uuid.UUID(user_uuid)).exists():
-			return True
-		else:
-			return False
-
-	def get_user(self, user_uuid):
-		return Tutor.objects.get(uuid=uuid.UUID(user_uuid))
+	def get_model_class(self):
+		return Tutor
 
 	def get_sms_logs(self, user):
-		return SMSLog.objects.filter(tutor=user)
+		# OTP logs are not shown, as they contain the OTPs
+		return SMSLog.objects.filter(tutor=user, message_type='ops')
+
+
+# Ops notification delivery metrics view
+
+class OpsNotificationDeliveryMetrics(APIView):
+	permission_classes = (OpsPermission,)
+
+	def get(self, request, format=None):
+		# The metrics are of the process that handles the request
+		return Response(notification_delivery_engine.get_metrics())
+
+
+# Ops tutor filter cache stats view
+
+class OpsTutorFilterCacheStats(APIView):
+	permission_classes = (OpsPermission,)
+
+	def get(self, request, format=None):
+		# The stats are of the process that handles the request
+		return Response({
+			'results': tutor_filter_result_cache.get_stats(),
+			'cards': tutor_card_cache.get_stats()
+		})
 
 
 # Tutor slug to UUID view
@@ -4016,14 +3695,12 @@ class TutorSlugToUUID(APIView):
 	permission_classes = (CorrectAPIKeyPermission,)
 
 	def get(self, request, tutor_slug, format=None):
-		if Tutor.objects.filter(old_slug=tutor_slug).exists():
-			return Response({
-				'tutor_uuid': str(Tutor.objects.get(old_slug=tutor_slug).uuid)
-			})
-		else:
-			return Response({
-				'detail': 'Tutor not found.'
-			}, status=status.HTTP_404_NOT_FOUND)
+		tutor = fetch_or_404(
+			Tutor, USER_UUID_LOAD_PLAN, 'Tutor not found.', old_slug=tutor_slug
+		)
+		return Response({
+			'tutor_uuid': str(tutor.uuid)
+		})
 
 
 # Make bkash payment using app